@@ -3,13 +3,25 @@ Tower Defense Game - Main Entry Point
 """
 
 import pygame  # type: ignore
+import argparse
 import sys
+import time
 from src.game import Game
-from src.constants import SCREEN_WIDTH, SCREEN_HEIGHT, FPS
+from src.timestep import FixedTimestep
+from src.replay import Replay, ReplayPlayer, ReplayRecorder
+from src.constants import SCREEN_WIDTH, SCREEN_HEIGHT, FPS, DIRTY_RECT_RENDERING, MIXER_FREQUENCY, MIXER_CHANNELS
 
 def main():
     """Main game entry point"""
-    # Initialize Pygame
+    parser = argparse.ArgumentParser(description="Tower Defense Game")
+    parser.add_argument('--record', metavar='PATH', help="record inputs to a replay file")
+    parser.add_argument('--replay', metavar='PATH', help="play back a replay file instead of taking input")
+    parser.add_argument('--dirty-rects', action='store_true', default=DIRTY_RECT_RENDERING,
+                        help="update only changed screen areas (for slow displays)")
+    args = parser.parse_args()
+    
+    # Initialize Pygame, with the mixer in the format sounds are synthesized in
+    pygame.mixer.pre_init(MIXER_FREQUENCY, -16, MIXER_CHANNELS)
     pygame.init()
     pygame.mixer.init()
     
@@ -24,8 +36,20 @@ def main():
     from src.sprite_manager import sprite_manager
     sprite_manager.ensure_sprites_loaded()
     
-    # Create game instance
-    game = Game(screen)
+    # Create game instance, re-driven from a replay if one was given
+    player = None
+    if args.replay:
+        replay = Replay.load(args.replay)
+        game = Game(screen, seed=replay.seed, dirty_rects=args.dirty_rects)
+        player = ReplayPlayer(replay, game)
+    else:
+        game = Game(screen, dirty_rects=args.dirty_rects)
+    
+    if args.record:
+        game.recorder = ReplayRecorder(game.rng.seed)
+    
+    # Fixed-step simulation clock
+    timestep = FixedTimestep()
     
     # Main game loop
     running = True
@@ -34,18 +58,40 @@ def main():
         for event in pygame.event.get():
             if event.type == pygame.QUIT:
                 running = False
-            else:
+            elif player is None:
                 game.handle_event(event)
         
-        # Update game state
-        dt = clock.tick(FPS) / 1000.0  # Delta time in seconds
-        game.update(dt)
+        # Advance the simulation in fixed steps, however long the frame took;
+        # fast-forward runs more steps per frame, never longer ones
+        frame_dt = clock.tick(FPS) / 1000.0  # Delta time in seconds
+        game.update_camera(frame_dt)
+        if timestep.speed != game.game_speed:
+            timestep.set_speed(game.game_speed)
+        
+        sim_start = time.perf_counter()
+        for _ in range(timestep.advance(frame_dt)):
+            if player is not None:
+                player.step()
+            else:
+                game.update(timestep.step)
+        
+        # Frame budget guard: back off the effective speed when the CPU can't keep up
+        timestep.report_sim_cost(time.perf_counter() - sim_start)
+        game.ui.update_game_speed(game.game_speed, timestep.effective_speed)
+        
+        # Start the sounds the simulation steps asked for, once per frame
+        game.audio.update(frame_dt)
         
-        # Render game
-        game.render()
-        pygame.display.flip()
+        # Render game, interpolating between the last two simulation steps
+        dirty_rects = game.render(timestep.alpha)
+        if dirty_rects is None:
+            pygame.display.flip()
+        elif dirty_rects:
+            pygame.display.update(dirty_rects)
     
     # Cleanup
+    if game.recorder is not None:
+        game.recorder.save(args.record, game.sim_ticks)
     pygame.quit()
     sys.exit()
 
@@ -1,53 +1,306 @@
 """
-Audio management system - Placeholder for Phase 1
+Audio management system - pooled sound effects and level music
 
-This system will handle:
-- Sound effects (tower firing, explosions, enemy deaths)
-- Background music
-- Audio settings and volume control
+Sounds come from the procedural sound bank (src/sound_bank.py). Game code
+requests them as events happen, possibly several simulation steps per
+frame, and update() starts them once per rendered frame:
 
-Currently not implemented - focusing on core gameplay first.
-Will be implemented in Day 7 (Integration & Polish) of Phase 1.
+- a sound plays at most once per frame, and not again until its
+  min_interval has passed
+- a sound never has more than max_voices voices; another one replaces its
+  oldest voice
+- each sound plays on its category's channel pool; when the pool is full the
+  lowest-priority voice (oldest first) is stolen, unless it outranks the new
+  sound, in which case the new sound is dropped
+
+Settings per sound live in SOUND_SETTINGS (constants.py). The manager stays
+silent when disabled (headless games) or when the mixer is not initialized.
+
+Sounds are built in memory from int16 sample arrays (make_sound), so
+pitch-shifted variants can be synthesized and cached while the game runs.
+
+Level music is synthesized while it plays (src/music_stream.py) and streamed
+to a channel of its own by MusicStreamer.
 """
 
+import queue
+import threading
 import pygame  # type: ignore
+import numpy as np  # type: ignore
+from typing import Dict, Iterator, List, Optional, Tuple
+from .constants import *
+from .audio_generator import AudioGenerator
+
+def make_sound(pcm: np.ndarray, sample_rate: int = AudioGenerator.SAMPLE_RATE) -> pygame.mixer.Sound:
+    """
+    Turn mono 16-bit samples into a Sound without temp files or per-sample packing
+
+    The int16 array goes to the mixer through the buffer protocol. Only when
+    the mixer runs at another rate or channel count are the samples first
+    resampled or duplicated to match.
+    """
+    frequency, size, channels = pygame.mixer.get_init()
+    if size != -16:
+        raise ValueError(f"Unsupported mixer sample format: {size}")
+    if frequency != sample_rate:
+        pcm = pitch_shift(pcm, sample_rate / frequency)
+    if channels > 1:
+        pcm = np.repeat(pcm, channels)  # Interleave identical channels
+    return pygame.mixer.Sound(buffer=np.ascontiguousarray(pcm, dtype=np.int16))
+
+def pitch_shift(pcm: np.ndarray, pitch: float) -> np.ndarray:
+    """Resample int16 samples so they play back pitch times higher (and shorter)"""
+    positions = np.arange(int(len(pcm) / pitch)) * pitch
+    return np.interp(positions, np.arange(len(pcm)), pcm).astype(np.int16)
+
+class MusicStreamer:
+    """
+    Plays a stream of int16 chunks on one mixer channel
+
+    A background thread pulls chunks from the stream, turns them into Sounds
+    and keeps a small look-ahead buffer of them, waiting while it is full.
+    update() only moves the next ready Sound onto the channel's queue, so the
+    main loop never synthesizes anything and memory stays constant.
+    """
+
+    def __init__(self, channel: pygame.mixer.Channel, lookahead: int = MUSIC_LOOKAHEAD_CHUNKS):
+        self.channel = channel
+        self.lookahead = lookahead
+        self.buffer: queue.Queue = queue.Queue(lookahead)
+        self.stopping = threading.Event()
+        self.playing = False
+
+        # Chunks queued on the channel, and frames on which it had run dry
+        # waiting for the synthesis thread
+        self.chunks_played = 0
+        self.underruns = 0
+
+    def start(self, chunks: Iterator[np.ndarray]) -> None:
+        """Stop the current stream and start playing another"""
+        self.stop()
+        # Each stream gets its own buffer and stop flag, so a thread still
+        # finishing its last chunk never feeds the next stream
+        self.buffer = queue.Queue(self.lookahead)
+        self.stopping = threading.Event()
+        self.playing = True
+        self.chunks_played = 0
+        threading.Thread(target=self._synthesize, args=(chunks, self.buffer, self.stopping),
+                         name='music-stream', daemon=True).start()
+
+    def _synthesize(self, chunks: Iterator[np.ndarray], buffer: queue.Queue, stopping: threading.Event) -> None:
+        """Synthesis thread: fill the buffer until the stream ends or is stopped"""
+        try:
+            for chunk in chunks:
+                sound = make_sound(chunk)
+                while not stopping.is_set():
+                    try:
+                        buffer.put(sound, timeout=0.1)
+                        break
+                    except queue.Full:
+                        pass
+                if stopping.is_set():
+                    return
+        except (ValueError, pygame.error) as e:
+            print(f"Warning: music stream failed: {e}")
+
+    def update(self) -> None:
+        """Queue the next chunk behind the one playing (call once per frame)"""
+        if not self.playing or self.channel.get_queue() is not None:
+            return
+        try:
+            sound = self.buffer.get_nowait()
+        except queue.Empty:
+            if self.chunks_played and not self.channel.get_busy():
+                self.underruns += 1
+            return
+        # Plays at once if the channel is idle (the first chunk, or after an underrun)
+        self.channel.queue(sound)
+        self.chunks_played += 1
+
+    def stop(self) -> None:
+        """Stop playing; the synthesis thread exits on its own without being waited for"""
+        self.stopping.set()
+        self.playing = False
+        self.channel.stop()
+
+    def set_volume(self, volume: float) -> None:
+        """Set the music channel volume"""
+        self.channel.set_volume(volume)
 
 class AudioManager:
-    """Audio system manager - placeholder implementation"""
-    
-    def __init__(self):
-        # Initialize pygame mixer (already done in main.py)
+    """Audio system manager"""
+
+    def __init__(self, enabled: bool = True):
+        # Without a mixer (headless runs, no audio device) every call is a no-op
+        self.enabled = enabled and pygame.mixer.get_init() is not None
         self.sound_enabled = True
         self.music_enabled = True
         self.sound_volume = 0.7
         self.music_volume = 0.5
-        
-        # Sound effects dictionary (to be loaded)
-        self.sounds = {}
-        
-        # Music tracks
+
+        # Sound effects and their samples by name
+        self.sounds: Dict[str, pygame.mixer.Sound] = {}
+        self.samples: Dict[str, np.ndarray] = {}
+
+        # Pitch-shifted variants by (sound, pitch), made on first use, and the
+        # next entry of each sound's pitch cycle
+        self.variants: Dict[Tuple[str, float], pygame.mixer.Sound] = {}
+        self.pitch_turns: Dict[str, int] = {}
+
+        # Music tracks, streamed on a channel of their own
+        self.current_music: Optional[str] = None
+        self.music: Optional[MusicStreamer] = None
+
+        # Channels of each pool, and the (sound, priority, start time) last started on each
+        self.pools: Dict[str, List[pygame.mixer.Channel]] = {}
+        self.voices: Dict[str, List[Optional[Tuple[str, int, float]]]] = {}
+
+        # Sound requests since the last update, and when each sound last started
+        self.pending: Dict[str, int] = {}
+        self.last_played: Dict[str, float] = {}
+        self.time = 0.0
+
+        # What happened to requests: started, merged into another request of the
+        # same frame, throttled by min_interval, stolen a voice, or dropped
+        self.stats = {'played': 0, 'merged': 0, 'throttled': 0, 'stolen': 0, 'dropped': 0}
+
+    def load_sounds(self) -> None:
+        """Build (or reuse) the sound effects in the sound bank, load them and set up the channels"""
+        if not self.enabled:
+            return
+
+        # Imported here so headless games never load the synthesis code.
+        # Music is streamed, so only the sound effects come from the bank
+        from .sound_bank import build_sound_bank, read_pcm
+        from .sound_recipes import SFX_RECIPES
+        try:
+            records = build_sound_bank(SFX_RECIPES, prune=False)
+            for name in SOUND_SETTINGS:
+                if name in records:
+                    self.samples[name] = read_pcm(records[name]['path'])
+                    self.sounds[name] = make_sound(self.samples[name])
+        except (OSError, ValueError, RuntimeError, pygame.error) as e:
+            print(f"Warning: sound bank unavailable, audio disabled: {e}")
+            self.enabled = False
+            return
+
+        # Reserve the pooled channels, and one more for music, so sounds played
+        # elsewhere never take them
+        channel_count = sum(AUDIO_CHANNEL_POOLS.values()) + 1
+        pygame.mixer.set_num_channels(max(pygame.mixer.get_num_channels(), channel_count))
+        pygame.mixer.set_reserved(channel_count)
+        first_channel = 0
+        for pool, size in AUDIO_CHANNEL_POOLS.items():
+            self.pools[pool] = [pygame.mixer.Channel(first_channel + i) for i in range(size)]
+            self.voices[pool] = [None] * size
+            first_channel += size
+        self.music = MusicStreamer(pygame.mixer.Channel(first_channel))
+
+    def get_sound(self, name: str, pitch: float = 1.0) -> pygame.mixer.Sound:
+        """Get a loaded sound, pitch-shifted from its samples (and cached) if pitch isn't 1"""
+        if pitch == 1.0:
+            return self.sounds[name]
+        key = (name, pitch)
+        variant = self.variants.get(key)
+        if variant is None:
+            variant = make_sound(pitch_shift(self.samples[name], pitch))
+            self.variants[key] = variant
+        return variant
+
+    def play_sound(self, sound_name: str) -> None:
+        """Request a sound effect; it starts on the next update"""
+        if self.enabled and self.sound_enabled and sound_name in self.sounds:
+            self.pending[sound_name] = self.pending.get(sound_name, 0) + 1
+
+    def update(self, dt: float) -> None:
+        """Keep the music fed and start the sounds requested since the last update (call once per rendered frame)"""
+        self.time += dt
+        if self.music is not None:
+            self.music.update()
+        if not self.pending:
+            return
+
+        # Most important sounds first, so they get the free channels
+        for name in sorted(self.pending, key=lambda name: -SOUND_SETTINGS[name]['priority']):
+            self.stats['merged'] += self.pending[name] - 1
+            self._start_voice(name)
+        self.pending.clear()
+
+    def _start_voice(self, name: str) -> None:
+        """Start a sound on its pool, applying the retrigger, voice and priority limits"""
+        settings = SOUND_SETTINGS[name]
+        last_played = self.last_played.get(name)
+        if last_played is not None and self.time - last_played < settings['min_interval']:
+            self.stats['throttled'] += 1
+            return
+
+        pool = settings['pool']
+        channels = self.pools[pool]
+        voices = self.voices[pool]
+        playing = [i for i, channel in enumerate(channels) if channel.get_busy()]
+
+        # At the voice limit this sound's oldest voice restarts; otherwise take a
+        # free channel or steal the least important voice
+        own_voices = [i for i in playing if voices[i] is not None and voices[i][0] == name]
+        if len(own_voices) >= settings['max_voices']:
+            index = min(own_voices, key=lambda i: voices[i][2])
+        elif len(playing) < len(channels):
+            index = next(i for i, channel in enumerate(channels) if not channel.get_busy())
+        else:
+            index = min(playing, key=lambda i: voices[i][1:] if voices[i] is not None else (-1, 0.0))
+            if voices[index] is not None and voices[index][1] > settings['priority']:
+                self.stats['dropped'] += 1
+                return
+            self.stats['stolen'] += 1
+
+        # Cycle through the sound's pitch variants
+        pitch = 1.0
+        pitches = settings.get('pitches')
+        if pitches:
+            turn = self.pitch_turns.get(name, 0)
+            pitch = pitches[turn % len(pitches)]
+            self.pitch_turns[name] = turn + 1
+
+        channel = channels[index]
+        channel.play(self.get_sound(name, pitch))
+        channel.set_volume(settings['volume'] * self.sound_volume)
+        voices[index] = (name, settings['priority'], self.time)
+        self.last_played[name] = self.time
+        self.stats['played'] += 1
+
+    def stop_sounds(self) -> None:
+        """Stop every sound effect and forget pending requests"""
+        self.pending.clear()
+        for pool, channels in self.pools.items():
+            for channel in channels:
+                channel.stop()
+            self.voices[pool] = [None] * len(channels)
+
+    def play_music(self, music_name: str) -> None:
+        """Loop a background music track, unless it is already playing"""
+        if self.music is None or not self.music_enabled or music_name == self.current_music:
+            return
+        from .music_stream import stream_music
+        from .sound_recipes import MUSIC_RECIPES
+        if music_name not in MUSIC_RECIPES:
+            return
+        # The stream synthesizes nothing until the music thread asks for its first chunk
+        self.music.set_volume(self.music_volume)
+        self.music.start(stream_music(MUSIC_RECIPES[music_name]))
+        self.current_music = music_name
+
+    def stop_music(self) -> None:
+        """Stop background music"""
+        if self.music is not None:
+            self.music.stop()
         self.current_music = None
-    
-    def load_sounds(self):
-        """Load all sound effects - to be implemented"""
-        pass
-    
-    def play_sound(self, sound_name: str):
-        """Play a sound effect - to be implemented"""
-        pass
-    
-    def play_music(self, music_name: str):
-        """Play background music - to be implemented"""
-        pass
-    
-    def stop_music(self):
-        """Stop background music - to be implemented"""
-        pass
-    
-    def set_sound_volume(self, volume: float):
-        """Set sound effects volume - to be implemented"""
+
+    def set_sound_volume(self, volume: float) -> None:
+        """Set sound effects volume (takes effect on the next sound started)"""
         self.sound_volume = max(0.0, min(1.0, volume))
-    
-    def set_music_volume(self, volume: float):
-        """Set music volume - to be implemented"""
-        self.music_volume = max(0.0, min(1.0, volume)) 
\ No newline at end of file
+
+    def set_music_volume(self, volume: float) -> None:
+        """Set music volume"""
+        self.music_volume = max(0.0, min(1.0, volume))
+        if self.music is not None:
+            self.music.set_volume(self.music_volume)
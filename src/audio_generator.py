@@ -1,14 +1,24 @@
 """
 Audio Generator - Procedural Audio Synthesis Engine
 Generates professional-quality game audio using mathematical waveform synthesis
+
+Every operation works on whole NumPy buffers: methods accept lists or arrays
+of samples and return float64 arrays. The original sample-by-sample engine
+lives on in audio_reference.py as the baseline for the benchmark:
+
+    python -m src.audio_generator --benchmark
 """
 
+import argparse
 import math
-import struct
+import time
 import wave
-import random
-from typing import List, Tuple, Optional, Union
+from fractions import Fraction
+import numpy as np  # type: ignore
+from typing import Callable, Dict, List, Optional, Sequence, Tuple, Union
 
+# Audio buffers: anything array-like in, float64 arrays out
+AudioData = Union[Sequence[float], np.ndarray]
 
 class AudioGenerator:
     """Procedural audio synthesis engine for tower defense game"""
@@ -31,14 +41,81 @@ class AudioGenerator:
     BROWN_NOISE = "brown"
     FILTERED_NOISE = "filtered"
     
-    def __init__(self):
-        """Initialize the audio generator"""
+    # Brown noise: per-sample leak that keeps the random walk from drifting,
+    # applied in blocks so the integration stays vectorized
+    BROWN_NOISE_LEAK = 0.99
+    BROWN_NOISE_BLOCK = 1024
+    
+    # Moving-average width of the filtered noise low-pass
+    NOISE_FILTER_SIZE = 5
+    
+    # Samples per block of _times and _sine: _sine's scratch buffers stay in
+    # cache, and no buffer the size of the output is allocated (fresh buffers
+    # cost as much as the arithmetic on them)
+    SINE_BLOCK = 8192
+    
+    def __init__(self, seed: Optional[int] = None):
+        """
+        Initialize the audio generator
+        
+        Args:
+            seed: Seed for the noise generator; random if omitted
+        """
         self.sample_rate = self.SAMPLE_RATE
         self.bit_depth = self.BIT_DEPTH
         self.max_amplitude = self.MAX_AMPLITUDE
+        self.rng = np.random.default_rng(seed)
+    
+    def _times(self, num_samples: int) -> np.ndarray:
+        """Sample times in seconds of the first num_samples samples"""
+        # One block's ramp plus each block's start time: a single pass over the
+        # output, where arange and a division would take two slower ones
+        block = min(num_samples, self.SINE_BLOCK) or 1
+        rows = -(-num_samples // block)
+        times = np.empty((rows, block))
+        np.add(np.arange(block) / self.sample_rate,
+               (np.arange(rows) * block / self.sample_rate)[:, np.newaxis], out=times)
+        return times.reshape(-1)[:num_samples]
+    
+    def _periodic(self, frequency: float, num_samples: int,
+                  shape: Callable[[np.ndarray], np.ndarray]) -> np.ndarray:
+        """
+        Evaluate shape(t) for a waveform of constant frequency
+        
+        Sampled at a fixed rate, such a waveform repeats exactly after the
+        denominator of frequency / sample_rate samples (2205 for 440 Hz), so
+        only the first period is synthesized and the rest is tiled from it.
+        Frequencies that aren't finite are evaluated sample by sample.
+        """
+        frequency = float(frequency)
+        period = num_samples
+        if math.isfinite(frequency):
+            period = min((Fraction(frequency) / self.sample_rate).denominator, num_samples)
+        return np.resize(shape(self._times(period)), num_samples)
+    
+    def _sine(self, cycles: np.ndarray) -> np.ndarray:
+        """
+        sin(2π * cycles) for waveforms that don't repeat (sweeps, FM), computed in place
+        
+        The phase is reduced to one cycle in float64 and the sine evaluated in
+        float32, which is several times faster; the error (~3e-7) is far below
+        one 16-bit sample step. cycles is overwritten with the result.
+        """
+        size = min(len(cycles), self.SINE_BLOCK)
+        fraction = np.empty(size)
+        angle = np.empty(size, dtype=np.float32)
+        for start in range(0, len(cycles), size or 1):
+            block = cycles[start:start + size]
+            count = len(block)
+            np.floor(block, out=fraction[:count])
+            np.subtract(block, fraction[:count], out=fraction[:count])
+            np.multiply(fraction[:count], 2 * math.pi, out=angle[:count])
+            np.sin(angle[:count], out=angle[:count])
+            block[:] = angle[:count]
+        return cycles
         
     def generate_waveform(self, wave_type: str, frequency: float, duration: float, 
-                         amplitude: float = 0.5, phase: float = 0.0) -> List[float]:
+                         amplitude: float = 0.5, phase: float = 0.0) -> np.ndarray:
         """
         Generate basic waveform data
         
@@ -50,52 +127,29 @@ class AudioGenerator:
             phase: Phase offset in radians
             
         Returns:
-            List of audio samples
+            Array of audio samples
         """
         num_samples = int(self.sample_rate * duration)
-        samples = []
         
         if wave_type == self.SINE:
-            for i in range(num_samples):
-                t = i / self.sample_rate
-                sample = amplitude * math.sin(2 * math.pi * frequency * t + phase)
-                samples.append(sample)
-                
+            shape = lambda t: amplitude * np.sin(2 * math.pi * frequency * t + phase)
         elif wave_type == self.SQUARE:
-            for i in range(num_samples):
-                t = i / self.sample_rate
-                sine_val = math.sin(2 * math.pi * frequency * t + phase)
-                sample = amplitude * (1 if sine_val >= 0 else -1)
-                samples.append(sample)
-                
+            shape = lambda t: amplitude * np.where(np.sin(2 * math.pi * frequency * t + phase) >= 0, 1.0, -1.0)
         elif wave_type == self.TRIANGLE:
-            for i in range(num_samples):
-                t = i / self.sample_rate
-                # Triangle wave using arcsin of sine wave
-                sine_val = math.sin(2 * math.pi * frequency * t + phase)
-                sample = amplitude * (2 / math.pi) * math.asin(sine_val)
-                samples.append(sample)
-                
+            # Triangle wave using arcsin of sine wave
+            shape = lambda t: amplitude * (2 / math.pi) * np.arcsin(np.sin(2 * math.pi * frequency * t + phase))
         elif wave_type == self.SAWTOOTH:
-            for i in range(num_samples):
-                t = i / self.sample_rate
-                # Sawtooth wave: linear ramp from -1 to 1
-                cycle_position = (frequency * t + phase / (2 * math.pi)) % 1
-                sample = amplitude * (2 * cycle_position - 1)
-                samples.append(sample)
-                
+            # Sawtooth wave: linear ramp from -1 to 1
+            shape = lambda t: amplitude * (2 * np.mod(frequency * t + phase / (2 * math.pi), 1) - 1)
         elif wave_type == self.NOISE:
-            for i in range(num_samples):
-                sample = amplitude * (random.random() * 2 - 1)
-                samples.append(sample)
-                
+            return amplitude * self.rng.uniform(-1.0, 1.0, num_samples)
         else:
             raise ValueError(f"Unknown wave type: {wave_type}")
-            
-        return samples
+        
+        return self._periodic(frequency, num_samples, shape)
     
-    def apply_envelope(self, audio_data: List[float], attack: float, decay: float, 
-                      sustain: float, release: float, sustain_level: float = 0.7) -> List[float]:
+    def apply_envelope(self, audio_data: AudioData, attack: float, decay: float, 
+                      sustain: float, release: float, sustain_level: float = 0.7) -> np.ndarray:
         """
         Apply ADSR envelope to audio data
         
@@ -110,11 +164,11 @@ class AudioGenerator:
         Returns:
             Audio data with envelope applied
         """
-        if not audio_data:
-            return audio_data
-            
-        num_samples = len(audio_data)
-        envelope = [0.0] * num_samples
+        audio = np.asarray(audio_data, dtype=np.float64)
+        num_samples = len(audio)
+        if num_samples == 0:
+            return audio
+        envelope = np.zeros(num_samples)
         
         # Convert times to sample counts
         attack_samples = int(attack * self.sample_rate)
@@ -132,37 +186,62 @@ class AudioGenerator:
             sustain_samples = int(sustain_samples * scale)
             release_samples = num_samples - attack_samples - decay_samples - sustain_samples
         
-        sample_idx = 0
-        
         # Attack phase
-        for i in range(attack_samples):
-            envelope[sample_idx] = i / attack_samples
-            sample_idx += 1
-            
+        start = 0
+        if attack_samples > 0:
+            envelope[:attack_samples] = np.arange(attack_samples) / attack_samples
+        start += attack_samples
+        
         # Decay phase
-        for i in range(decay_samples):
-            envelope[sample_idx] = 1.0 - (i / decay_samples) * (1.0 - sustain_level)
-            sample_idx += 1
-            
+        if decay_samples > 0:
+            ramp = np.arange(decay_samples) / decay_samples
+            envelope[start:start + decay_samples] = 1.0 - ramp * (1.0 - sustain_level)
+        start += decay_samples
+        
         # Sustain phase
-        for i in range(sustain_samples):
-            envelope[sample_idx] = sustain_level
-            sample_idx += 1
-            
+        envelope[start:start + sustain_samples] = sustain_level
+        start += sustain_samples
+        
         # Release phase
-        for i in range(release_samples):
-            if sample_idx < num_samples:
-                envelope[sample_idx] = sustain_level * (1.0 - i / release_samples)
-                sample_idx += 1
-        
-        # Apply envelope to audio data
-        result = []
-        for i in range(num_samples):
-            result.append(audio_data[i] * envelope[i])
-            
-        return result
+        release_count = min(release_samples, num_samples - start)
+        if release_count > 0:
+            envelope[start:start + release_count] = sustain_level * (1.0 - np.arange(release_count) / release_samples)
+        
+        return audio * envelope
     
-    def generate_noise(self, noise_type: str, duration: float, amplitude: float = 0.5) -> List[float]:
+    def _leaky_integrate(self, steps: np.ndarray, leak: float, state: float = 0.0) -> np.ndarray:
+        """
+        Run y[n] = leak * y[n-1] + steps[n] over the whole buffer, from y[-1] = state
+        
+        Within a block y[j] = leak^j * (leak * y_prev + cumsum(steps[i] / leak^i)),
+        so each block is one cumulative sum; the block length keeps leak^-i small.
+        All blocks are summed at once as the rows of a matrix; only the value
+        carried from one block into the next is a loop.
+        """
+        count = len(steps)
+        block = min(self.BROWN_NOISE_BLOCK, count)
+        if count == 0:
+            return np.zeros(0)
+        rows = -(-count // block)
+        powers = leak ** np.arange(block)
+        sums = np.zeros((rows, block))
+        sums.reshape(-1)[:count] = steps
+        sums *= leak ** -np.arange(block)
+        np.cumsum(sums, axis=1, out=sums)
+        
+        # State entering each block: y_prev of the next block is leak^(block-1) * (leak * y_prev + sums[-1])
+        carried = np.empty(rows)
+        last_power = powers[-1]
+        for row, block_sum in enumerate(sums[:, -1].tolist()):
+            carried[row] = state
+            state = last_power * (leak * state + block_sum)
+        
+        carried *= leak
+        sums += carried[:, np.newaxis]
+        sums *= powers
+        return sums.reshape(-1)[:count]
+    
+    def generate_noise(self, noise_type: str, duration: float, amplitude: float = 0.5) -> np.ndarray:
         """
         Generate different types of noise
         
@@ -172,45 +251,48 @@ class AudioGenerator:
             amplitude: Amplitude (0.0 to 1.0)
             
         Returns:
-            List of noise samples
+            Array of noise samples
         """
         num_samples = int(self.sample_rate * duration)
-        samples = []
         
         if noise_type == self.WHITE_NOISE:
-            for i in range(num_samples):
-                sample = amplitude * (random.random() * 2 - 1)
-                samples.append(sample)
-                
-        elif noise_type == self.BROWN_NOISE:
-            # Brown noise (red noise) - integrated white noise
-            last_sample = 0.0
-            for i in range(num_samples):
-                white_sample = (random.random() * 2 - 1) * 0.1
-                last_sample += white_sample
-                # Prevent drift
-                if abs(last_sample) > 1.0:
-                    last_sample *= 0.95
-                samples.append(amplitude * last_sample)
-                
-        elif noise_type == self.FILTERED_NOISE:
-            # Simple low-pass filtered white noise
-            white_noise = [amplitude * (random.random() * 2 - 1) for _ in range(num_samples)]
-            # Apply simple moving average filter
-            filter_size = 5
-            for i in range(num_samples):
-                start = max(0, i - filter_size // 2)
-                end = min(num_samples, i + filter_size // 2 + 1)
-                filtered_sample = sum(white_noise[start:end]) / (end - start)
-                samples.append(filtered_sample)
-                
-        else:
-            raise ValueError(f"Unknown noise type: {noise_type}")
+            noise = self.rng.uniform(-1.0, 1.0, num_samples)
+            noise *= amplitude
+            return noise
+        
+        if noise_type == self.BROWN_NOISE:
+            # Brown noise (red noise) - integrated white noise, leaking back
+            # towards zero to prevent drift and clipped to the unit range
+            white = self.rng.uniform(-0.1, 0.1, num_samples)
+            brown = self._leaky_integrate(white, self.BROWN_NOISE_LEAK)
+            np.clip(brown, -1.0, 1.0, out=brown)
+            brown *= amplitude
+            return brown
+        
+        if noise_type == self.FILTERED_NOISE:
+            # Simple low-pass filtered white noise: centred moving average,
+            # narrowing at the buffer edges
+            white_noise = self.rng.uniform(-1.0, 1.0, num_samples)
+            white_noise *= amplitude
+            if num_samples == 0:
+                return white_noise
+            size = self.NOISE_FILTER_SIZE
+            half = size // 2
+            filtered = np.convolve(white_noise, np.ones(size))[half:half + num_samples]
             
-        return samples
+            # Every window is full except the few overlapping either edge
+            edges = np.unique(np.concatenate((np.arange(min(half, num_samples)),
+                                              np.arange(max(num_samples - half, 0), num_samples))))
+            counts = np.minimum(edges, half) + 1 + np.minimum(num_samples - 1 - edges, half)
+            edge_values = filtered[edges] / counts
+            filtered /= size
+            filtered[edges] = edge_values
+            return filtered
+        
+        raise ValueError(f"Unknown noise type: {noise_type}")
     
     def frequency_modulation(self, carrier_freq: float, modulator_freq: float, 
-                           mod_depth: float, duration: float, amplitude: float = 0.5) -> List[float]:
+                           mod_depth: float, duration: float, amplitude: float = 0.5) -> np.ndarray:
         """
         Generate frequency modulated audio
         
@@ -222,24 +304,23 @@ class AudioGenerator:
             amplitude: Amplitude (0.0 to 1.0)
             
         Returns:
-            List of FM audio samples
+            Array of FM audio samples
         """
         num_samples = int(self.sample_rate * duration)
-        samples = []
-        
-        for i in range(num_samples):
-            t = i / self.sample_rate
-            # Frequency modulation: f(t) = carrier_freq + mod_depth * sin(2π * modulator_freq * t)
-            instantaneous_freq = carrier_freq + mod_depth * math.sin(2 * math.pi * modulator_freq * t)
-            # Integrate to get phase
-            phase = 2 * math.pi * instantaneous_freq * t
-            sample = amplitude * math.sin(phase)
-            samples.append(sample)
-            
-        return samples
+        # Frequency modulation: f(t) = carrier_freq + mod_depth * sin(2π * modulator_freq * t),
+        # built in place in the modulator buffer (fresh buffers cost as much as the arithmetic)
+        cycles = self._periodic(modulator_freq, num_samples,
+                                lambda t: np.sin(2 * math.pi * modulator_freq * t))
+        cycles *= mod_depth
+        cycles += carrier_freq
+        # Integrate to get phase
+        cycles *= self._times(num_samples)
+        wave = self._sine(cycles)
+        wave *= amplitude
+        return wave
     
-    def add_noise(self, audio_data: List[float], noise_level: float, 
-                  noise_type: str = WHITE_NOISE) -> List[float]:
+    def add_noise(self, audio_data: AudioData, noise_level: float, 
+                  noise_type: str = WHITE_NOISE) -> np.ndarray:
         """
         Add noise to existing audio data
         
@@ -251,31 +332,27 @@ class AudioGenerator:
         Returns:
             Audio data with noise added
         """
-        if not audio_data:
-            return audio_data
+        audio = np.asarray(audio_data, dtype=np.float64)
+        if len(audio) == 0:
+            return audio
             
-        duration = len(audio_data) / self.sample_rate
+        duration = len(audio) / self.sample_rate
         noise_samples = self.generate_noise(noise_type, duration, noise_level)
-        
-        result = []
-        for i in range(len(audio_data)):
-            result.append(audio_data[i] + noise_samples[i])
-            
-        return result
+        return audio + noise_samples[:len(audio)]
     
-    def mix_audio(self, *audio_streams: List[float], weights: Optional[List[float]] = None) -> List[float]:
+    def mix_audio(self, *audio_streams: AudioData, weights: Optional[List[float]] = None) -> np.ndarray:
         """
         Mix multiple audio streams together
         
         Args:
-            audio_streams: Multiple audio sample lists
+            audio_streams: Multiple audio sample buffers
             weights: Optional weights for each stream
             
         Returns:
             Mixed audio samples
         """
         if not audio_streams:
-            return []
+            return np.zeros(0)
             
         # Find the maximum length
         max_length = max(len(stream) for stream in audio_streams)
@@ -286,16 +363,13 @@ class AudioGenerator:
         elif len(weights) != len(audio_streams):
             raise ValueError("Number of weights must match number of audio streams")
         
-        result = [0.0] * max_length
-        
-        for i, stream in enumerate(audio_streams):
-            weight = weights[i]
-            for j in range(len(stream)):
-                result[j] += stream[j] * weight
-                
+        result = np.zeros(max_length)
+        for stream, weight in zip(audio_streams, weights):
+            stream = np.asarray(stream, dtype=np.float64)
+            result[:len(stream)] += stream * weight
         return result
     
-    def normalize_audio(self, audio_data: List[float], target_amplitude: float = 0.9) -> List[float]:
+    def normalize_audio(self, audio_data: AudioData, target_amplitude: float = 0.9) -> np.ndarray:
         """
         Normalize audio to prevent clipping
         
@@ -306,18 +380,19 @@ class AudioGenerator:
         Returns:
             Normalized audio samples
         """
-        if not audio_data:
-            return audio_data
+        audio = np.asarray(audio_data, dtype=np.float64)
+        if len(audio) == 0:
+            return audio
             
-        max_amplitude = max(abs(sample) for sample in audio_data)
+        # Peak from the extremes, without an abs() copy of the whole buffer
+        max_amplitude = max(float(np.max(audio)), -float(np.min(audio)))
         if max_amplitude == 0:
-            return audio_data
+            return audio
             
-        scale_factor = target_amplitude / max_amplitude
-        return [sample * scale_factor for sample in audio_data]
+        return audio * (target_amplitude / max_amplitude)
     
-    def apply_fade(self, audio_data: List[float], fade_in: float = 0.0, 
-                   fade_out: float = 0.0) -> List[float]:
+    def apply_fade(self, audio_data: AudioData, fade_in: float = 0.0, 
+                   fade_out: float = 0.0) -> np.ndarray:
         """
         Apply fade in/out to audio data
         
@@ -329,28 +404,45 @@ class AudioGenerator:
         Returns:
             Audio data with fades applied
         """
-        if not audio_data:
-            return audio_data
+        result = np.array(audio_data, dtype=np.float64)
+        num_samples = len(result)
+        if num_samples == 0:
+            return result
             
-        num_samples = len(audio_data)
         fade_in_samples = int(fade_in * self.sample_rate)
         fade_out_samples = int(fade_out * self.sample_rate)
         
-        result = audio_data.copy()
-        
         # Apply fade in
-        for i in range(min(fade_in_samples, num_samples)):
-            fade_factor = i / fade_in_samples
-            result[i] *= fade_factor
+        count = min(fade_in_samples, num_samples)
+        if count > 0:
+            result[:count] *= np.arange(count) / fade_in_samples
             
-        # Apply fade out
-        for i in range(min(fade_out_samples, num_samples)):
-            fade_factor = (fade_out_samples - i) / fade_out_samples
-            result[num_samples - 1 - i] *= fade_factor
+        # Apply fade out, mirroring the fade in: the last sample reaches zero
+        count = min(fade_out_samples, num_samples)
+        if count > 0:
+            result[num_samples - count:] *= np.arange(count - 1, -1, -1) / fade_out_samples
             
         return result
     
-    def save_wav_file(self, audio_data: List[float], filename: str, 
+    def to_pcm16(self, audio_data: AudioData, normalize: bool = True) -> np.ndarray:
+        """
+        Convert audio to 16-bit PCM samples
+        
+        Args:
+            audio_data: Audio samples
+            normalize: Whether to normalize the audio first
+            
+        Returns:
+            int16 array
+        """
+        audio = np.asarray(audio_data, dtype=np.float64)
+        if normalize:
+            audio = self.normalize_audio(audio, 0.9)
+        
+        # Clamp to valid range; the cast truncates towards zero like int()
+        return (np.clip(audio, -1.0, 1.0) * self.max_amplitude).astype(np.int16)
+    
+    def save_wav_file(self, audio_data: AudioData, filename: str, 
                      normalize: bool = True) -> None:
         """
         Save audio data to WAV file
@@ -360,36 +452,23 @@ class AudioGenerator:
             filename: Output filename
             normalize: Whether to normalize the audio
         """
-        if not audio_data:
+        if len(audio_data) == 0:
             print(f"Warning: No audio data to save for {filename}")
             return
-            
-        # Normalize if requested
-        if normalize:
-            audio_data = self.normalize_audio(audio_data, 0.9)
         
-        # Convert to 16-bit integers
-        audio_data_int = []
-        for sample in audio_data:
-            # Clamp to valid range
-            sample = max(-1.0, min(1.0, sample))
-            int_sample = int(sample * self.max_amplitude)
-            audio_data_int.append(int_sample)
+        pcm = self.to_pcm16(audio_data, normalize)
         
         # Create WAV file
         with wave.open(filename, 'wb') as wav_file:
             wav_file.setnchannels(self.CHANNELS)
             wav_file.setsampwidth(self.bit_depth // 8)
             wav_file.setframerate(self.sample_rate)
-            
-            # Pack audio data
-            packed_data = struct.pack(f'<{len(audio_data_int)}h', *audio_data_int)
-            wav_file.writeframes(packed_data)
+            wav_file.writeframes(pcm.astype('<i2').tobytes())
             
         print(f"Generated audio file: {filename}")
     
     def generate_complex_tone(self, fundamental_freq: float, harmonics: List[Tuple[float, float]], 
-                            duration: float, amplitude: float = 0.5) -> List[float]:
+                            duration: float, amplitude: float = 0.5) -> np.ndarray:
         """
         Generate complex tone with harmonics
         
@@ -421,7 +500,7 @@ class AudioGenerator:
         return self.mix_audio(*audio_streams, weights=weights)
     
     def generate_sweep(self, start_freq: float, end_freq: float, duration: float, 
-                      wave_type: str = SINE, amplitude: float = 0.5) -> List[float]:
+                      wave_type: str = SINE, amplitude: float = 0.5) -> np.ndarray:
         """
         Generate frequency sweep
         
@@ -435,25 +514,17 @@ class AudioGenerator:
         Returns:
             Frequency sweep audio samples
         """
-        num_samples = int(self.sample_rate * duration)
-        samples = []
+        t = self._times(int(self.sample_rate * duration))
         
-        for i in range(num_samples):
-            t = i / self.sample_rate
-            # Linear frequency interpolation
-            freq = start_freq + (end_freq - start_freq) * (t / duration)
-            
-            if wave_type == self.SINE:
-                # For sweeps, we need to integrate frequency to get phase
-                phase = 2 * math.pi * (start_freq * t + 0.5 * (end_freq - start_freq) * t * t / duration)
-                sample = amplitude * math.sin(phase)
-            else:
-                # For other waveforms, use instantaneous frequency
-                sample = amplitude * math.sin(2 * math.pi * freq * t)
-                
-            samples.append(sample)
-            
-        return samples
+        if wave_type == self.SINE:
+            # For sweeps, we need to integrate frequency to get phase
+            cycles = start_freq * t + 0.5 * (end_freq - start_freq) * t * t / duration
+        else:
+            # For other waveforms, use instantaneous frequency (linear interpolation)
+            cycles = (start_freq + (end_freq - start_freq) * (t / duration)) * t
+        wave = self._sine(cycles)
+        wave *= amplitude
+        return wave
 
 
 # Test functions for verification
@@ -539,7 +610,99 @@ def test_complex_features():
     print("Complex features tests completed!")
 
 
-if __name__ == "__main__":
+def _scenarios(generator) -> Dict[str, Callable[[], Dict[str, np.ndarray]]]:
+    """The test_* scenarios above, minus file writing, for either engine"""
+    g = generator
+    harmonics = [(2.0, 0.5), (3.0, 0.3), (4.0, 0.2)]
+    return {
+        'basic_waveforms': lambda: {wave_type: g.normalize_audio(g.generate_waveform(wave_type, 440.0, 1.0, 0.5))
+                                    for wave_type in (g.SINE, g.SQUARE, g.TRIANGLE, g.SAWTOOTH, g.NOISE)},
+        'envelope': lambda: {'adsr': g.normalize_audio(g.apply_envelope(
+            g.generate_waveform(g.SINE, 440.0, 2.0, 0.8), 0.1, 0.3, 1.0, 0.6, 0.7))},
+        'noise_generation': lambda: {noise_type: g.normalize_audio(g.generate_noise(noise_type, 1.0, 0.5))
+                                     for noise_type in (g.WHITE_NOISE, g.BROWN_NOISE, g.FILTERED_NOISE)},
+        'frequency_modulation': lambda: {'fm': g.normalize_audio(g.frequency_modulation(440.0, 5.0, 50.0, 2.0, 0.5))},
+        'complex_features': lambda: {'complex': g.normalize_audio(g.generate_complex_tone(220.0, harmonics, 2.0, 0.6)),
+                                     'sweep': g.normalize_audio(g.generate_sweep(200.0, 800.0, 2.0, g.SINE, 0.5))},
+    }
+
+# Speedup the test scenarios should reach over the reference engine, taken
+# together (a single scenario of a few hundred microseconds is too noisy to hold to it)
+BENCHMARK_TARGET_SPEEDUP = 50
+
+# Scenario outputs built from random noise, which can't be compared between engines
+_RANDOM_OUTPUTS = {AudioGenerator.NOISE, AudioGenerator.WHITE_NOISE,
+                   AudioGenerator.BROWN_NOISE, AudioGenerator.FILTERED_NOISE}
+
+def _best_time(function: Callable[[], Dict[str, np.ndarray]], repeats: int) -> Tuple[float, Dict[str, np.ndarray]]:
+    """Fastest of several runs, with the output of the last"""
+    best = float('inf')
+    output: Dict[str, np.ndarray] = {}
+    for _ in range(repeats):
+        start = time.perf_counter()
+        output = function()
+        best = min(best, time.perf_counter() - start)
+    return best, output
+
+def benchmark(reference_repeats: int = 3, repeats: int = 20) -> Dict[str, Dict[str, float]]:
+    """
+    Time the test_* scenarios on the NumPy engine against the reference engine
+    
+    Outputs that don't involve noise are compared sample by sample. Samples
+    further apart than half a 16-bit step count as mismatched; the only
+    expected ones are square wave samples whose sine is rounding noise around
+    zero, where either engine may pick either sign.
+    
+    Returns:
+        Per scenario: reference and vectorized seconds, speedup, maximum
+        difference and mismatched sample count of the compared outputs
+    """
+    from .audio_reference import ReferenceAudioGenerator
+    reference = _scenarios(ReferenceAudioGenerator())
+    vectorized = _scenarios(AudioGenerator(seed=0))
+    tolerance = 0.5 / AudioGenerator.MAX_AMPLITUDE
+    
+    results = {}
+    for name in reference:
+        reference_time, expected = _best_time(reference[name], reference_repeats)
+        vectorized_time, actual = _best_time(vectorized[name], repeats)
+        max_difference = 0.0
+        mismatched = 0
+        for label in expected.keys() - _RANDOM_OUTPUTS:
+            difference = np.abs(np.asarray(expected[label]) - actual[label])
+            max_difference = max(max_difference, float(np.max(difference)))
+            mismatched += int(np.count_nonzero(difference > tolerance))
+        results[name] = {
+            'reference_seconds': reference_time,
+            'vectorized_seconds': vectorized_time,
+            'speedup': reference_time / vectorized_time,
+            'max_difference': max_difference,
+            'mismatched_samples': mismatched,
+        }
+    return results
+
+def main(argv: Optional[List[str]] = None) -> None:
+    """Command line entry point"""
+    parser = argparse.ArgumentParser(description="Procedural audio synthesis tests and benchmark")
+    parser.add_argument('--benchmark', action='store_true',
+                        help="compare the test scenarios against the pure-Python reference engine")
+    args = parser.parse_args(argv)
+    
+    if args.benchmark:
+        results = benchmark()
+        print(f"{'scenario':<22}{'reference':>12}{'numpy':>12}{'speedup':>10}{'max diff':>12}{'mismatched':>12}")
+        for name, result in results.items():
+            print(f"{name:<22}{result['reference_seconds'] * 1000:>10.1f}ms"
+                  f"{result['vectorized_seconds'] * 1000:>10.2f}ms{result['speedup']:>9.0f}x"
+                  f"{result['max_difference']:>12.1e}{result['mismatched_samples']:>12}")
+        reference_total = sum(result['reference_seconds'] for result in results.values())
+        vectorized_total = sum(result['vectorized_seconds'] for result in results.values())
+        speedup = reference_total / vectorized_total
+        shortfall = f"  below {BENCHMARK_TARGET_SPEEDUP}x target" if speedup < BENCHMARK_TARGET_SPEEDUP else ""
+        print(f"{'total':<22}{reference_total * 1000:>10.1f}ms{vectorized_total * 1000:>10.2f}ms"
+              f"{speedup:>9.0f}x{shortfall}")
+        return
+    
     print("AudioGenerator Test Suite")
     print("=" * 40)
     
@@ -549,4 +712,8 @@ if __name__ == "__main__":
     test_frequency_modulation()
     test_complex_features()
     
-    print("\nAll tests completed! Check generated test files.") 
\ No newline at end of file
+    print("\nAll tests completed! Check generated test files.")
+
+
+if __name__ == "__main__":
+    main()
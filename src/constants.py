@@ -7,6 +7,19 @@ SCREEN_WIDTH = 800
 SCREEN_HEIGHT = 600
 FPS = 60
 
+# Fixed-step simulation (independent of the display frame rate)
+SIM_RATE = 60  # Simulation steps per second
+SIM_DT = 1.0 / SIM_RATE
+MAX_SUBSTEPS = 8  # Most simulation steps run in one frame when catching up (per 1x of speed)
+
+# Fast-forward speeds and the frame budget guard that throttles them
+GAME_SPEEDS = [1, 2, 4, 8]
+SIM_FRAME_BUDGET = 0.7 / FPS  # Seconds of simulation work allowed per rendered frame
+
+# Dirty-rectangle rendering: push only changed screen areas to the display
+DIRTY_RECT_RENDERING = False
+MAX_DIRTY_RECTS = 200  # Above this many rects a full-screen update is cheaper
+
 # Grid system
 GRID_SIZE = 40
 GRID_WIDTH = SCREEN_WIDTH // GRID_SIZE
@@ -211,6 +224,12 @@ ENEMY_TYPES = {
     }
 }
 
+# Extra distance added to an enemy's size when checking projectile hits
+PROJECTILE_HIT_PADDING = 5
+
+# Enemy storage backend: 'objects' (one Enemy per enemy) or 'arrays' (NumPy struct-of-arrays)
+ENEMY_STORAGE_BACKEND = 'objects'
+
 # Level configurations
 LEVELS = {
     1: {
@@ -429,4 +448,61 @@ WAVES = LEVELS[1]['waves']
 UI_PANEL_WIDTH = 200
 GAME_AREA_WIDTH = SCREEN_WIDTH - UI_PANEL_WIDTH
 TOWER_BUTTON_SIZE = 50
-TOWER_BUTTON_SPACING = 60 
\ No newline at end of file
+TOWER_BUTTON_SPACING = 60
+
+# Rendered text surfaces kept by the shared text cache (least recently used are dropped)
+TEXT_CACHE_SIZE = 256
+
+# Mixer output format: mono 16-bit at the synthesis rate, so generated sample
+# buffers are handed to the mixer as they are
+MIXER_FREQUENCY = 44100
+MIXER_CHANNELS = 1
+
+# Audio mixer channels, split into pools so one kind of sound can't starve the others
+AUDIO_CHANNEL_POOLS = {
+    'ui': 2,
+    'event': 2,
+    'impact': 4,
+    'tower': 8,
+}
+
+# Playback of each sound: channel pool, priority (a full pool gives up its
+# lowest-priority voice to a sound of equal or higher priority), most voices
+# playing at once, shortest time between retriggers in seconds, and volume.
+# Sounds with pitches cycle through pitch-shifted variants so rapid repeats
+# don't sound identical
+SOUND_SETTINGS = {
+    'cannon_fire':      {'pool': 'tower',  'priority': 3, 'max_voices': 2, 'min_interval': 0.08, 'volume': 0.7, 'pitches': [0.95, 1.0, 1.05]},
+    'machine_gun_fire': {'pool': 'tower',  'priority': 1, 'max_voices': 2, 'min_interval': 0.10, 'volume': 0.4, 'pitches': [0.94, 1.0, 1.06, 1.12]},
+    'missile_launch':   {'pool': 'tower',  'priority': 3, 'max_voices': 2, 'min_interval': 0.12, 'volume': 0.6},
+    'laser_beam':       {'pool': 'tower',  'priority': 2, 'max_voices': 2, 'min_interval': 0.08, 'volume': 0.5, 'pitches': [0.97, 1.0, 1.03]},
+    'freeze_blast':     {'pool': 'tower',  'priority': 2, 'max_voices': 2, 'min_interval': 0.10, 'volume': 0.5},
+    'explosion_small':  {'pool': 'impact', 'priority': 2, 'max_voices': 2, 'min_interval': 0.06, 'volume': 0.6, 'pitches': [0.9, 1.0, 1.1]},
+    'explosion_large':  {'pool': 'impact', 'priority': 4, 'max_voices': 2, 'min_interval': 0.10, 'volume': 0.8, 'pitches': [0.92, 1.0, 1.08]},
+    'enemy_death':      {'pool': 'impact', 'priority': 1, 'max_voices': 2, 'min_interval': 0.05, 'volume': 0.5, 'pitches': [0.9, 1.0, 1.1, 1.2]},
+    'life_lost':        {'pool': 'event',  'priority': 5, 'max_voices': 1, 'min_interval': 0.30, 'volume': 0.8},
+    'wave_start':       {'pool': 'event',  'priority': 4, 'max_voices': 1, 'min_interval': 0.50, 'volume': 0.7},
+    'victory':          {'pool': 'event',  'priority': 6, 'max_voices': 1, 'min_interval': 1.00, 'volume': 0.8},
+    'ui_click':         {'pool': 'ui',     'priority': 5, 'max_voices': 1, 'min_interval': 0.05, 'volume': 0.6},
+}
+
+# Sound of each tower's shot, and background music of each level
+TOWER_FIRE_SOUNDS = {
+    'cannon': 'cannon_fire',
+    'machine_gun': 'machine_gun_fire',
+    'missile': 'missile_launch',
+    'laser': 'laser_beam',
+    'freeze': 'freeze_blast',
+}
+LEVEL_MUSIC = {
+    1: 'forest_ambient',
+    2: 'mountain_ambient',
+    3: 'desert_ambient',
+    4: 'nightmare_ambient',
+    5: 'frozen_ambient',
+}
+
+# Level music is synthesized while it plays: chunks of this many samples
+# (about 0.19 s), rendered up to this many chunks ahead of playback
+MUSIC_CHUNK_SAMPLES = 8192
+MUSIC_LOOKAHEAD_CHUNKS = 4
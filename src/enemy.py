@@ -4,10 +4,34 @@ Enemy classes and management system
 
 import pygame  # type: ignore
 import math
-from typing import List, Dict, Tuple
+import random
+import numpy as np  # type: ignore
+from typing import List, Dict, NamedTuple, Optional, Tuple
 from .constants import *
 from .level import Level
-from .sprite_manager import sprite_manager
+from .sprite_manager import sprite_manager, ENEMY_STEALTH_ALPHA
+from .spatial_hash import SpatialHash
+from .render_queue import RenderQueue
+
+# Level-specific enemy speed multipliers
+LEVEL_SPEED_MULTIPLIERS = {
+    4: 1.4,  # Nightmare Spiral: 40% faster enemies for increased challenge
+}
+
+# Special ability timings (seconds)
+STEALTH_DURATION = 2.0  # 2 seconds invisible
+STEALTH_COOLDOWN = 5.0  # 5 seconds between stealth
+PHASE_DURATION = 1.0  # 1 second phased
+PHASE_COOLDOWN = 8.0  # 8 seconds between phases
+
+class EnemyTargetData(NamedTuple):
+    """Per-frame arrays describing every active enemy, aligned with enemies"""
+    enemies: List
+    x: np.ndarray
+    y: np.ndarray
+    flying: np.ndarray
+    stealthed: np.ndarray
+    phased: np.ndarray
 
 class Enemy:
     """Base enemy class"""
@@ -23,11 +47,7 @@ class Enemy:
         base_speed = stats['speed']
         
         # Apply level-specific speed multipliers
-        level_speed_multipliers = {
-            4: 1.4,  # Nightmare Spiral: 40% faster enemies for increased challenge
-        }
-        
-        speed_multiplier = level_speed_multipliers.get(level.level_id, 1.0)
+        speed_multiplier = LEVEL_SPEED_MULTIPLIERS.get(level.level_id, 1.0)
         self.speed = base_speed * speed_multiplier
         
         self.reward = stats['reward']
@@ -47,13 +67,13 @@ class Enemy:
         
         # Special ability timers and states
         self.stealth_timer = 0.0
-        self.stealth_duration = 2.0  # 2 seconds invisible
-        self.stealth_cooldown = 5.0  # 5 seconds between stealth
+        self.stealth_duration = STEALTH_DURATION
+        self.stealth_cooldown = STEALTH_COOLDOWN
         self.is_stealthed = False
         
         self.phase_timer = 0.0
-        self.phase_duration = 1.0  # 1 second phased
-        self.phase_cooldown = 8.0  # 8 seconds between phases
+        self.phase_duration = PHASE_DURATION
+        self.phase_cooldown = PHASE_COOLDOWN
         self.is_phased = False
         
         # Store base speed for berserker ability
@@ -65,11 +85,15 @@ class Enemy:
         self.freeze_slow_multiplier = 1.0
         
         # Position and movement
-        self.path_progress = 0.0  # 0.0 to 1.0 along the path
+        self.path_distance = 0.0  # Distance travelled along the path (world units)
         start_pos = level.get_path_start()
         self.x = start_pos[0]
         self.y = start_pos[1]
         
+        # Position at the start of the last simulation step, for render interpolation
+        self.prev_x = self.x
+        self.prev_y = self.y
+        
         # Status
         self.is_alive = True
         self.reached_end = False
@@ -149,17 +173,28 @@ class Enemy:
                 self.freeze_slow_multiplier = 1.0
         
         # Move along path using current speed (accounting for all effects)
+        self.prev_x = self.x
+        self.prev_y = self.y
         current_speed = self.get_current_speed()
-        distance_to_move = current_speed * dt
-        new_x, new_y, new_progress = self.level.get_next_position_on_path(self.path_progress, distance_to_move)
-        
-        self.x = new_x
-        self.y = new_y
-        self.path_progress = new_progress
+        self.path_distance += current_speed * dt
         
         # Check if reached the end
-        if self.path_progress >= 1.0:
+        if self.path_distance >= self.level.path_length:
+            self.x, self.y = self.level.path_end
             self.reached_end = True
+        else:
+            self.x, self.y = self.level.position_at(self.path_distance)
+    
+    @property
+    def path_progress(self) -> float:
+        """Fraction of the path length covered so far"""
+        if self.level.path_length == 0:
+            return 1.0
+        return min(1.0, self.path_distance / self.level.path_length)
+    
+    @path_progress.setter
+    def path_progress(self, progress: float) -> None:
+        self.path_distance = progress * self.level.path_length
     
     def get_position(self) -> Tuple[float, float]:
         """Get current position"""
@@ -171,49 +206,89 @@ class Enemy:
         dy = self.y - target_y
         return math.sqrt(dx * dx + dy * dy)
     
-    def render(self, screen: pygame.Surface, level) -> None:
-        """Render the enemy"""
+    def get_render_position(self, alpha: float) -> Tuple[float, float]:
+        """Get the position interpolated between the last two simulation steps"""
+        return (self.prev_x + (self.x - self.prev_x) * alpha,
+                self.prev_y + (self.y - self.prev_y) * alpha)
+    
+    # Sprites for each render variant with their half sizes, resolved on first render
+    render_sprites: Optional[Dict[Optional[str], Tuple[pygame.Surface, int, int]]] = None
+    
+    def _resolve_render_sprites(self) -> Dict[Optional[str], Tuple[pygame.Surface, int, int]]:
+        """Look up this enemy's sprite and its variants once"""
+        sprites = {}
+        for variant in (None, 'stealth', 'frozen', 'enraged'):
+            sprite = sprite_manager.get_enemy_sprite(self.enemy_type, variant)
+            if sprite is None:
+                # Fallback to simple circle if sprite not available
+                alpha = ENEMY_STEALTH_ALPHA if variant == 'stealth' else 255
+                sprite = sprite_manager.get_circle_sprite(self.size, self.color, alpha)
+            sprites[variant] = (sprite, sprite.get_width() // 2, sprite.get_height() // 2)
+        self.render_sprites = sprites
+        return sprites
+    
+    def queue_render(self, queue: RenderQueue, camera_x: float, camera_y: float,
+                     alpha: float = 1.0) -> Optional[Tuple[int, int]]:
+        """
+        Queue the enemy sprite on the 'enemies' layer
+        
+        Returns:
+            The integer screen position of the enemy centre, or None if it is
+            dead or off screen
+        """
         if not self.is_alive:
-            return
+            return None
         
         # Convert world coordinates to screen coordinates
-        screen_x, screen_y = level.world_to_screen(self.x, self.y)
+        render_x, render_y = self.get_render_position(alpha)
+        screen_x = render_x - camera_x
+        screen_y = render_y - camera_y
         
         # Only render if visible on screen
-        if -50 <= screen_x <= GAME_AREA_WIDTH + 50 and -50 <= screen_y <= SCREEN_HEIGHT + 50:
-            # Handle stealth visibility
-            alpha = 255
-            if self.stealth and self.is_stealthed:
-                alpha = 80  # Semi-transparent when stealthed
-            
-            # Get enemy sprite
-            sprite = sprite_manager.get_enemy_sprite(self.enemy_type)
-            
-            if sprite:
-                # Apply transparency for stealth
-                if alpha < 255:
-                    sprite = sprite.copy()
-                    sprite.set_alpha(alpha)
-                
-                # Center the sprite on the enemy position
-                sprite_rect = sprite.get_rect(center=(int(screen_x), int(screen_y)))
-                screen.blit(sprite, sprite_rect)
-            else:
-                # Fallback to simple circle if sprite not available
-                color = self.color
-                if alpha < 255:
-                    # Create a surface for transparency
-                    temp_surface = pygame.Surface((self.size * 2, self.size * 2), pygame.SRCALPHA)
-                    pygame.draw.circle(temp_surface, (*color, alpha), (self.size, self.size), self.size)
-                    screen.blit(temp_surface, (int(screen_x - self.size), int(screen_y - self.size)))
-                else:
-                    pygame.draw.circle(screen, color, (int(screen_x), int(screen_y)), self.size)
-            
-            # Draw special ability indicators
-            self._draw_special_indicators(screen, screen_x, screen_y)
-            
-            # Draw health bar above enemy
-            self._draw_health_bar(screen, screen_x, screen_y)
+        if not (-50 <= screen_x <= GAME_AREA_WIDTH + 50 and -50 <= screen_y <= SCREEN_HEIGHT + 50):
+            return None
+        
+        # Pick the precomputed sprite variant for the enemy's current state
+        variant = None
+        if self.stealth and self.is_stealthed:
+            variant = 'stealth'  # Semi-transparent when stealthed
+        elif self.is_frozen:
+            variant = 'frozen'
+        elif self.berserker and self.health <= self.max_health * 0.5:
+            variant = 'enraged'
+        
+        sprites = self.render_sprites or self._resolve_render_sprites()
+        sprite, half_width, half_height = sprites[variant]
+        
+        # Center the sprite on the enemy position
+        center_x, center_y = int(screen_x), int(screen_y)
+        queue.add('enemies', sprite, (center_x - half_width, center_y - half_height))
+        return (center_x, center_y)
+    
+    def render_overlays(self, screen: pygame.Surface, center_x: int, center_y: int) -> pygame.Rect:
+        """Draw ability indicators and the health bar, returning the area the enemy may cover"""
+        # Draw special ability indicators
+        self._draw_special_indicators(screen, center_x, center_y)
+        
+        # Draw health bar above enemy
+        self._draw_health_bar(screen, center_x, center_y)
+        
+        # Bounds covering the sprite, ability rings and the health bar
+        sprite, half_width, half_height = self.render_sprites[None]
+        sprite_half = max(half_width, half_height)
+        half_width = max(sprite_half, self.size + 4, 10) + 1
+        top = max(sprite_half, self.size + 8) + 1
+        bottom = max(sprite_half, self.size + 4) + 1
+        return pygame.Rect(center_x - half_width, center_y - top, half_width * 2, top + bottom)
+    
+    def render(self, screen: pygame.Surface, level, alpha: float = 1.0) -> Optional[pygame.Rect]:
+        """Render the enemy and return the screen area it may have drawn on"""
+        queue = RenderQueue()
+        center = self.queue_render(queue, level.camera.x, level.camera.y, alpha)
+        if center is None:
+            return None
+        queue.flush(screen, 'enemies')
+        return self.render_overlays(screen, *center)
     
     def _draw_health_bar(self, screen: pygame.Surface, screen_x: float, screen_y: float) -> None:
         """Draw health bar above enemy"""
@@ -226,12 +301,13 @@ class Enemy:
         bar_y = int(screen_y - self.size - 8)
         
         # Background (red)
-        pygame.draw.rect(screen, RED, (bar_x, bar_y, bar_width, bar_height))
+        screen.fill(RED, (bar_x, bar_y, bar_width, bar_height))
         
         # Health (green)
         health_ratio = self.health / self.max_health
         health_width = int(bar_width * health_ratio)
-        pygame.draw.rect(screen, GREEN, (bar_x, bar_y, health_width, bar_height))
+        if health_width > 0:
+            screen.fill(GREEN, (bar_x, bar_y, health_width, bar_height))
     
     def _draw_special_indicators(self, screen: pygame.Surface, screen_x: float, screen_y: float) -> None:
         """Draw indicators for special abilities"""
@@ -256,16 +332,25 @@ class Enemy:
 class EnemyManager:
     """Manages all enemies and wave spawning"""
     
-    def __init__(self, level: Level):
+    def __init__(self, level: Level, rng: Optional[random.Random] = None):
         self.level = level
         self.enemies: List[Enemy] = []
         
+        # Random source for spawn order
+        self.rng = rng if rng is not None else random.Random()
+        
+        # Spatial hash of active enemies, rebuilt every update
+        self.spatial_hash = SpatialHash(GRID_SIZE)
+        
         # Wave spawning
         self.spawning_queue: List[str] = []
         self.spawn_timer = 0.0
         self.spawn_delay = 0.0
         self.is_spawning_wave = False
         
+        # Batched sprite blits, reused every frame
+        self.render_queue = RenderQueue()
+        
         # Statistics
         self.enemies_killed_this_frame: List[str] = []
         self.enemies_escaped_this_frame = 0
@@ -281,8 +366,7 @@ class EnemyManager:
                     self.spawning_queue.append(enemy_type)
         
         # Shuffle for variety (optional)
-        import random
-        random.shuffle(self.spawning_queue)
+        self.rng.shuffle(self.spawning_queue)
         
         # Set spawn timing
         self.spawn_delay = wave_config.get('delay', 1.0)
@@ -296,20 +380,7 @@ class EnemyManager:
         self.enemies_escaped_this_frame = 0
         
         # Handle spawning
-        if self.is_spawning_wave and self.spawning_queue:
-            self.spawn_timer -= dt
-            if self.spawn_timer <= 0:
-                # Spawn next enemy
-                enemy_type = self.spawning_queue.pop(0)
-                new_enemy = Enemy(enemy_type, self.level)
-                self.enemies.append(new_enemy)
-                
-                # Reset spawn timer
-                self.spawn_timer = self.spawn_delay
-                
-                # Check if done spawning
-                if not self.spawning_queue:
-                    self.is_spawning_wave = False
+        self._update_spawning(dt)
         
         # Update all enemies
         for enemy in self.enemies[:]:  # Use slice copy for safe removal
@@ -324,18 +395,56 @@ class EnemyManager:
             elif enemy.reached_end:
                 self.enemies_escaped_this_frame += 1
                 self.enemies.remove(enemy)
+        
+        # Index surviving enemies by grid cell for proximity queries
+        self.spatial_hash.rebuild(self.enemies)
+    
+    def _update_spawning(self, dt: float) -> None:
+        """Advance the spawn timer and spawn the queued enemies that are due"""
+        if self.is_spawning_wave and self.spawning_queue:
+            self.spawn_timer -= dt
+            # Spawn every enemy that fell due during this step, carrying the
+            # remainder over so the spawn cadence does not drift
+            while self.spawn_timer <= 0 and self.spawning_queue:
+                enemy_type = self.spawning_queue.pop(0)
+                self._spawn_enemy(enemy_type)
+                self.spawn_timer += self.spawn_delay
+            
+            # Check if done spawning
+            if not self.spawning_queue:
+                self.is_spawning_wave = False
+    
+    def _spawn_enemy(self, enemy_type: str) -> Enemy:
+        """Create a new enemy at the path start"""
+        new_enemy = Enemy(enemy_type, self.level)
+        self.enemies.append(new_enemy)
+        return new_enemy
     
     def get_enemies(self) -> List[Enemy]:
         """Get list of all active enemies"""
         return [enemy for enemy in self.enemies if enemy.is_alive and not enemy.reached_end]
     
+    def get_target_data(self) -> EnemyTargetData:
+        """Get positions and targeting flags of all active enemies as arrays"""
+        enemies = self.get_enemies()
+        count = len(enemies)
+        return EnemyTargetData(
+            enemies,
+            np.fromiter((enemy.x for enemy in enemies), dtype=np.float64, count=count),
+            np.fromiter((enemy.y for enemy in enemies), dtype=np.float64, count=count),
+            np.fromiter((enemy.flying for enemy in enemies), dtype=bool, count=count),
+            np.fromiter((enemy.stealth and enemy.is_stealthed for enemy in enemies), dtype=bool, count=count),
+            np.fromiter((enemy.phase and enemy.is_phased for enemy in enemies), dtype=bool, count=count)
+        )
+    
+    def query_radius(self, x: float, y: float, radius: float) -> List[Enemy]:
+        """Get active enemies within radius of a position, in spawn order"""
+        return [enemy for enemy in self.spatial_hash.query_radius(x, y, radius)
+                if enemy.is_alive and not enemy.reached_end]
+    
     def get_enemies_in_range(self, center_x: float, center_y: float, range_radius: float) -> List[Enemy]:
         """Get enemies within range of a position"""
-        enemies_in_range = []
-        for enemy in self.get_enemies():
-            if enemy.get_distance_to(center_x, center_y) <= range_radius:
-                enemies_in_range.append(enemy)
-        return enemies_in_range
+        return self.query_radius(center_x, center_y, range_radius)
     
     def get_killed_enemies(self) -> List[str]:
         """Get list of enemy types killed this frame"""
@@ -356,12 +465,26 @@ class EnemyManager:
     def clear_enemies(self) -> None:
         """Remove all enemies (for game restart)"""
         self.enemies.clear()
+        self.spatial_hash.clear()
         self.spawning_queue.clear()
         self.is_spawning_wave = False
         self.enemies_killed_this_frame.clear()
         self.enemies_escaped_this_frame = 0
     
-    def render(self, screen: pygame.Surface, level) -> None:
-        """Render all enemies"""
+    def render(self, screen: pygame.Surface, level, alpha: float = 1.0) -> List[pygame.Rect]:
+        """
+        Render all enemies, interpolated alpha of the way into the current step
+        
+        Sprites go out in one batched blit; indicators and health bars are
+        drawn on top. Returns the screen areas drawn on, for dirty-rect rendering
+        """
+        queue = self.render_queue
+        camera_x, camera_y = level.camera.x, level.camera.y
+        visible = []
         for enemy in self.enemies:
-            enemy.render(screen, level) 
\ No newline at end of file
+            center = enemy.queue_render(queue, camera_x, camera_y, alpha)
+            if center is not None:
+                visible.append((enemy, center))
+        queue.flush(screen, 'enemies')
+        
+        return [enemy.render_overlays(screen, center_x, center_y) for enemy, (center_x, center_y) in visible]
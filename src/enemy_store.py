@@ -0,0 +1,416 @@
+"""
+Struct-of-arrays enemy storage backed by NumPy
+
+Keeps the per-enemy simulation state in contiguous arrays and advances every
+enemy in one vectorized step. ArrayEnemyManager is a drop-in replacement for
+EnemyManager; towers and projectiles keep working with Enemy-like views.
+"""
+
+import random
+import time
+import numpy as np  # type: ignore
+from typing import Dict, List, Optional
+from .constants import *
+from .level import Level
+from .enemy import (Enemy, EnemyManager, EnemyTargetData, LEVEL_SPEED_MULTIPLIERS,
+                    STEALTH_DURATION, STEALTH_COOLDOWN, PHASE_DURATION, PHASE_COOLDOWN)
+
+# Per-enemy fields stored as arrays, with their dtypes
+FLOAT_FIELDS = ('x', 'y', 'prev_x', 'prev_y', 'health', 'max_health', 'armor', 'speed', 'base_speed', 'speed_boost',
+                'regeneration', 'size', 'freeze_timer', 'freeze_slow_multiplier',
+                'stealth_timer', 'phase_timer', 'path_distance')
+BOOL_FIELDS = ('is_alive', 'reached_end', 'is_frozen', 'is_stealthed', 'is_phased',
+               'stealth', 'phase', 'berserker', 'flying')
+
+# Fields exposed as read/write properties on ArrayEnemy views
+VIEW_FIELDS = ('x', 'y', 'prev_x', 'prev_y', 'health', 'armor', 'speed', 'freeze_timer', 'freeze_slow_multiplier',
+               'stealth_timer', 'phase_timer', 'is_alive', 'reached_end', 'is_frozen',
+               'is_stealthed', 'is_phased')
+
+class EnemyArrays:
+    """Contiguous per-enemy state for every active enemy in spawn order"""
+
+    def __init__(self, level: Level, capacity: int = 256):
+        self.level = level
+        self.count = 0
+        self.capacity = capacity
+        for name in FLOAT_FIELDS:
+            setattr(self, name, np.zeros(capacity, dtype=np.float64))
+        for name in BOOL_FIELDS:
+            setattr(self, name, np.zeros(capacity, dtype=bool))
+
+        self.speed_multiplier = LEVEL_SPEED_MULTIPLIERS.get(level.level_id, 1.0)
+
+        # Distance-based path lookups come from the level's arc-length table
+        self.path_length = level.path_length
+        self.path_end = level.path_end
+
+        # Cell index over current positions (see rebuild_grid)
+        self.grid_cols = level.grid_width + 1
+        self.grid_rows = level.grid_height + 1
+        self.grid_order = np.zeros(0, dtype=np.intp)
+        self.grid_starts = np.zeros(self.grid_cols * self.grid_rows + 1, dtype=np.intp)
+
+    def positions_at(self, distances: np.ndarray) -> np.ndarray:
+        """Get world positions for an array of distances along the path"""
+        return self.level.positions_at(distances)
+
+    def _grow(self) -> None:
+        """Double the capacity of every array"""
+        self.capacity *= 2
+        for name in FLOAT_FIELDS + BOOL_FIELDS:
+            old = getattr(self, name)
+            new = np.zeros(self.capacity, dtype=old.dtype)
+            new[:self.count] = old[:self.count]
+            setattr(self, name, new)
+
+    def add(self, enemy_type: str) -> int:
+        """Append a new enemy at the path start and return its row"""
+        if self.count == self.capacity:
+            self._grow()
+        row = self.count
+        self.count += 1
+
+        stats = ENEMY_TYPES[enemy_type]
+        speed = stats['speed'] * self.speed_multiplier
+        start_x, start_y = self.level.get_path_start()
+
+        for name in FLOAT_FIELDS:
+            getattr(self, name)[row] = 0.0
+        for name in BOOL_FIELDS:
+            getattr(self, name)[row] = False
+
+        self.x[row] = start_x
+        self.y[row] = start_y
+        self.prev_x[row] = start_x
+        self.prev_y[row] = start_y
+        self.health[row] = stats['health']
+        self.max_health[row] = stats['health']
+        self.armor[row] = stats.get('armor', 0)
+        self.speed[row] = speed
+        self.base_speed[row] = speed
+        self.speed_boost[row] = stats.get('speed_boost', 1.0)
+        self.regeneration[row] = stats.get('regeneration', 0)
+        self.size[row] = stats['size']
+        self.freeze_slow_multiplier[row] = 1.0
+        self.is_alive[row] = True
+        self.stealth[row] = stats.get('stealth', False)
+        self.phase[row] = stats.get('phase', False)
+        self.berserker[row] = stats.get('berserker', False)
+        self.flying[row] = stats.get('flying', False)
+        return row
+
+    def step(self, dt: float) -> None:
+        """Advance every active enemy by dt in one vectorized pass"""
+        n = self.count
+        if n == 0:
+            return
+        active = self.is_alive[:n] & ~self.reached_end[:n]
+        health = self.health[:n]
+        max_health = self.max_health[:n]
+
+        # Regeneration
+        regen = active & (self.regeneration[:n] > 0)
+        health[regen] = np.minimum(max_health[regen], health[regen] + self.regeneration[:n][regen] * dt)
+
+        # Berserker speed boost below 50% health
+        berserk = active & self.berserker[:n]
+        enraged = health <= max_health * 0.5
+        base_speed = self.base_speed[:n]
+        self.speed[:n] = np.where(berserk & enraged, base_speed * self.speed_boost[:n],
+                                  np.where(berserk, base_speed, self.speed[:n]))
+
+        # Stealth and phase cycles
+        self._step_cycle(active & self.stealth[:n], self.stealth_timer[:n], self.is_stealthed[:n],
+                         STEALTH_DURATION, STEALTH_COOLDOWN, dt)
+        self._step_cycle(active & self.phase[:n], self.phase_timer[:n], self.is_phased[:n],
+                         PHASE_DURATION, PHASE_COOLDOWN, dt)
+
+        # Freeze countdown
+        frozen = active & self.is_frozen[:n]
+        self.freeze_timer[:n][frozen] -= dt
+        thawed = frozen & (self.freeze_timer[:n] <= 0)
+        self.is_frozen[:n][thawed] = False
+        self.freeze_slow_multiplier[:n][thawed] = 1.0
+
+        # Move along the path, keeping the old positions for render interpolation
+        self.prev_x[:n] = self.x[:n]
+        self.prev_y[:n] = self.y[:n]
+        current_speed = np.where(self.is_frozen[:n], self.speed[:n] * self.freeze_slow_multiplier[:n], self.speed[:n])
+        distance = self.path_distance[:n]
+        distance[active] += current_speed[active] * dt
+
+        finished = active & (distance >= self.path_length)
+        moving = active & ~finished
+        positions = self.positions_at(distance[moving])
+        self.x[:n][moving] = positions[:, 0]
+        self.y[:n][moving] = positions[:, 1]
+        self.x[:n][finished] = self.path_end[0]
+        self.y[:n][finished] = self.path_end[1]
+        self.reached_end[:n][finished] = True
+
+    @staticmethod
+    def _step_cycle(mask: np.ndarray, timer: np.ndarray, state: np.ndarray,
+                    duration: float, cooldown: float, dt: float) -> None:
+        """Advance an on/off ability cycle such as stealth or phasing"""
+        if not mask.any():
+            return
+        timer[mask] += dt
+        turn_off = mask & state & (timer >= duration)
+        turn_on = mask & ~state & (timer >= cooldown)
+        state[turn_off] = False
+        state[turn_on] = True
+        timer[turn_off | turn_on] = 0.0
+
+    def compact(self, keep: np.ndarray) -> None:
+        """Drop rows not in keep, preserving spawn order"""
+        n = self.count
+        m = int(keep.sum())
+        for name in FLOAT_FIELDS + BOOL_FIELDS:
+            arr = getattr(self, name)
+            arr[:m] = arr[:n][keep]
+        self.count = m
+
+    def rebuild_grid(self) -> None:
+        """Sort rows by GRID_SIZE cell so radius queries only touch nearby cells"""
+        n = self.count
+        cols = np.clip((self.x[:n] // GRID_SIZE).astype(np.intp), 0, self.grid_cols - 1)
+        rows = np.clip((self.y[:n] // GRID_SIZE).astype(np.intp), 0, self.grid_rows - 1)
+        keys = cols * self.grid_rows + rows
+        self.grid_order = np.argsort(keys, kind='stable')
+        self.grid_starts = np.searchsorted(keys[self.grid_order], np.arange(self.grid_cols * self.grid_rows + 1))
+
+    def query_radius(self, x: float, y: float, radius: float) -> np.ndarray:
+        """Get rows of active enemies within radius of a position, in spawn order"""
+        if self.count == 0:
+            return self.grid_order[:0]
+        min_cx = max(0, int((x - radius) // GRID_SIZE))
+        max_cx = min(self.grid_cols - 1, int((x + radius) // GRID_SIZE))
+        min_cy = max(0, int((y - radius) // GRID_SIZE))
+        max_cy = min(self.grid_rows - 1, int((y + radius) // GRID_SIZE))
+        if min_cx > max_cx or min_cy > max_cy:
+            return self.grid_order[:0]
+
+        # Cells in one grid column are contiguous in the sorted order
+        starts = self.grid_starts
+        chunks = [self.grid_order[starts[cx * self.grid_rows + min_cy]:starts[cx * self.grid_rows + max_cy + 1]]
+                  for cx in range(min_cx, max_cx + 1)]
+        candidates = np.concatenate(chunks) if len(chunks) > 1 else chunks[0]
+        if len(candidates) == 0:
+            return candidates
+
+        dx = self.x[candidates] - x
+        dy = self.y[candidates] - y
+        inside = (dx * dx + dy * dy <= radius * radius) & self.is_alive[candidates] & ~self.reached_end[candidates]
+        return np.sort(candidates[inside])
+
+def _array_property(name: str) -> property:
+    """Build a property reading and writing one EnemyArrays field for a view"""
+    def getter(self):
+        if self._row < 0:
+            return self._detached[name]
+        return getattr(self._store, name)[self._row]
+
+    def setter(self, value):
+        if self._row < 0:
+            self._detached[name] = value
+        else:
+            getattr(self._store, name)[self._row] = value
+
+    return property(getter, setter)
+
+class ArrayEnemy(Enemy):
+    """Enemy view whose dynamic state lives in an EnemyArrays row"""
+
+    def __init__(self, enemy_type: str, level: Level, store: EnemyArrays, row: int):
+        # Dynamic state lives in the store, so Enemy.__init__ is deliberately skipped
+        self._store = store
+        self._row = row
+        self._detached: Dict[str, object] = {}
+
+        self.enemy_type = enemy_type
+        self.level = level
+
+        stats = ENEMY_TYPES[enemy_type]
+        self.max_health = stats['health']
+        self.reward = stats['reward']
+        self.color = stats['color']
+        self.size = stats['size']
+        self.flying = stats.get('flying', False)
+        self.regeneration = stats.get('regeneration', 0)
+        self.stealth = stats.get('stealth', False)
+        self.berserker = stats.get('berserker', False)
+        self.speed_boost = stats.get('speed_boost', 1.0)
+        self.titan = stats.get('titan', False)
+        self.splash_immune = stats.get('splash_immune', False)
+        self.phase = stats.get('phase', False)
+        self.base_speed = store.base_speed[row]
+        self.stealth_duration = STEALTH_DURATION
+        self.stealth_cooldown = STEALTH_COOLDOWN
+        self.phase_duration = PHASE_DURATION
+        self.phase_cooldown = PHASE_COOLDOWN
+
+    @property
+    def path_progress(self) -> float:
+        """Fraction of the path length covered so far"""
+        store = self._store
+        if self._row < 0:
+            return self._detached['path_progress']
+        if store.path_length == 0:
+            return 1.0
+        return min(1.0, store.path_distance[self._row] / store.path_length)
+
+    @path_progress.setter
+    def path_progress(self, progress: float) -> None:
+        if self._row < 0:
+            self._detached['path_progress'] = progress
+        else:
+            self._store.path_distance[self._row] = progress * self._store.path_length
+
+    def detach(self) -> None:
+        """Snapshot final state when the row is removed from the store"""
+        self._detached = {name: getattr(self, name) for name in VIEW_FIELDS}
+        self._detached['path_progress'] = self.path_progress
+        self._row = -1
+
+    def update(self, dt: float) -> None:
+        """Movement is handled by EnemyArrays.step"""
+        pass
+
+for _field in VIEW_FIELDS:
+    setattr(ArrayEnemy, _field, _array_property(_field))
+
+class ArrayEnemyManager(EnemyManager):
+    """EnemyManager that advances all enemies through a NumPy struct-of-arrays store"""
+
+    def __init__(self, level: Level, rng: Optional[random.Random] = None):
+        super().__init__(level, rng)
+        self.store = EnemyArrays(level)
+
+    def _spawn_enemy(self, enemy_type: str) -> Enemy:
+        """Append a new enemy row and its view"""
+        row = self.store.add(enemy_type)
+        enemy = ArrayEnemy(enemy_type, self.level, self.store, row)
+        self.enemies.append(enemy)
+        return enemy
+
+    def update(self, dt: float) -> None:
+        """Update all enemies and spawning"""
+        # Clear frame statistics
+        self.enemies_killed_this_frame.clear()
+        self.enemies_escaped_this_frame = 0
+
+        # Handle spawning
+        self._update_spawning(dt)
+
+        # Advance every enemy at once
+        store = self.store
+        store.step(dt)
+
+        # Remove dead enemies and enemies that reached the end
+        n = store.count
+        alive = store.is_alive[:n]
+        keep = alive & ~store.reached_end[:n]
+        if not keep.all():
+            for row in np.flatnonzero(~keep):
+                enemy = self.enemies[row]
+                if not alive[row]:
+                    self.enemies_killed_this_frame.append(enemy.enemy_type)
+                else:
+                    self.enemies_escaped_this_frame += 1
+                enemy.detach()
+
+            store.compact(keep)
+            self.enemies = [enemy for enemy, kept in zip(self.enemies, keep) if kept]
+            for row, enemy in enumerate(self.enemies):
+                enemy._row = row
+
+        # Index surviving enemies by grid cell for proximity queries
+        store.rebuild_grid()
+
+    def get_enemies(self) -> List[Enemy]:
+        """Get list of all active enemies"""
+        n = self.store.count
+        active = self.store.is_alive[:n] & ~self.store.reached_end[:n]
+        if active.all():
+            return list(self.enemies)
+        return [self.enemies[row] for row in np.flatnonzero(active)]
+
+    def get_target_data(self) -> EnemyTargetData:
+        """Get positions and targeting flags of all active enemies straight from the store"""
+        store = self.store
+        n = store.count
+        active = store.is_alive[:n] & ~store.reached_end[:n]
+        if active.all():
+            rows = slice(0, n)
+            enemies = list(self.enemies)
+        else:
+            rows = np.flatnonzero(active)
+            enemies = [self.enemies[row] for row in rows]
+        return EnemyTargetData(
+            enemies,
+            store.x[rows],
+            store.y[rows],
+            store.flying[rows],
+            store.is_stealthed[rows],
+            store.is_phased[rows]
+        )
+    
+    def query_radius(self, x: float, y: float, radius: float) -> List[Enemy]:
+        """Get active enemies within radius of a position, in spawn order"""
+        return [self.enemies[row] for row in self.store.query_radius(x, y, radius)]
+
+    def clear_enemies(self) -> None:
+        """Remove all enemies (for game restart)"""
+        for enemy in self.enemies:
+            enemy.detach()
+        super().clear_enemies()
+        self.store.count = 0
+        self.store.rebuild_grid()
+
+def create_enemy_manager(level: Level, backend: str = ENEMY_STORAGE_BACKEND,
+                         rng: Optional[random.Random] = None) -> EnemyManager:
+    """Create an enemy manager using the requested storage backend"""
+    if backend == 'arrays':
+        return ArrayEnemyManager(level, rng)
+    if backend == 'objects':
+        return EnemyManager(level, rng)
+    raise ValueError(f"Unknown enemy storage backend: {backend}")
+
+def benchmark_enemy_store(enemy_count: int = 10000, frames: int = 600, level_id: int = 2) -> Dict[str, float]:
+    """
+    Time EnemyManager.update for both storage backends with enemy_count live enemies
+
+    Returns:
+        Average milliseconds per update for each backend
+    """
+    enemy_types = list(ENEMY_TYPES.keys())
+    results = {}
+
+    for backend, backend_frames in (('arrays', frames), ('objects', max(1, frames // 20))):
+        level = Level(level_id)
+        manager = create_enemy_manager(level, backend)
+        for i in range(enemy_count):
+            manager._spawn_enemy(enemy_types[i % len(enemy_types)])
+
+        # Spread enemies over the first half of the path so few escape during the run
+        for i, enemy in enumerate(manager.enemies):
+            enemy.path_progress = 0.5 * i / enemy_count
+
+        start = time.perf_counter()
+        for _ in range(backend_frames):
+            manager.update(1.0 / FPS)
+        elapsed = time.perf_counter() - start
+
+        results[backend] = elapsed / backend_frames * 1000.0
+        print(f"{backend:>8}: {results[backend]:8.3f} ms/update with {len(manager.enemies)} enemies "
+              f"(frame budget {1000.0 / FPS:.1f} ms)")
+
+    print(f"Speedup: {results['objects'] / results['arrays']:.1f}x")
+    return results
+
+if __name__ == "__main__":
+    print("EnemyArrays Benchmark")
+    print("=" * 40)
+    benchmark_enemy_store(10000)
+    benchmark_enemy_store(50000, frames=120)
@@ -0,0 +1,28 @@
+"""
+Cache keys - fingerprints of source files and hashes of cached content
+
+The sprite pack, the sound bank and sweep results are cached on disk under
+a hash of what was built plus a fingerprint of the code that built it, so
+editing either one rebuilds the entry.
+"""
+
+import hashlib
+import json
+import os
+from typing import Any, Iterable
+
+def file_fingerprint(paths: Iterable[str], *extra: str) -> str:
+    """Hash the names and contents of the given files, plus any extra strings"""
+    digest = hashlib.sha256()
+    for text in extra:
+        digest.update(text.encode())
+    for path in paths:
+        with open(path, 'rb') as f:
+            digest.update(os.path.basename(path).encode())
+            digest.update(f.read())
+    return digest.hexdigest()
+
+def content_hash(value: Any, fingerprint: str) -> str:
+    """Get the 20-character cache key of a JSON-serializable value built by fingerprinted code"""
+    payload = json.dumps(value, sort_keys=True) + fingerprint
+    return hashlib.sha256(payload.encode()).hexdigest()[:20]
@@ -3,12 +3,29 @@ Core game class managing all game systems and state
 """
 
 import pygame  # type: ignore
-from typing import List, Optional
+from typing import Dict, List, Optional, Tuple
 from .constants import *
 from .level import Level
 from .tower import TowerManager
-from .enemy import EnemyManager
-from .ui import UI
+from .projectile import KIND_BULLET, KIND_HOMING
+from .enemy_store import create_enemy_manager
+from .ui import UI, HeadlessUI
+from .audio import AudioManager
+from .rng import GameRandom
+from .text_cache import text_cache
+
+# Key bindings for level selection (menu) and tower selection (in game)
+LEVEL_KEYS = {pygame.K_1: 1, pygame.K_2: 2, pygame.K_3: 3, pygame.K_4: 4, pygame.K_5: 5}
+TOWER_KEYS = {
+    pygame.K_1: 'cannon',
+    pygame.K_2: 'machine_gun',
+    pygame.K_3: 'missile',
+    pygame.K_4: 'laser',
+    pygame.K_5: 'freeze',
+}
+
+# Explosion sound of each projectile kind that bursts with splash damage
+SPLASH_SOUNDS = {KIND_BULLET: 'explosion_small', KIND_HOMING: 'explosion_large'}
 
 class GameState:
     """Game state enumeration"""
@@ -21,28 +38,57 @@ class GameState:
 class Game:
     """Main game class coordinating all systems"""
     
-    def __init__(self, screen: pygame.Surface):
+    def __init__(self, screen: Optional[pygame.Surface] = None, seed: Optional[int] = None,
+                 dirty_rects: bool = DIRTY_RECT_RENDERING):
+        # Without a screen the game runs headless: no fonts, sprites or input polling
         self.screen = screen
+        self.headless = screen is None
         self.state = GameState.MENU
         self.current_level = 1  # Start with level 1
         
+        # All randomness is drawn from streams of one seed so games are reproducible
+        self.rng = GameRandom(seed)
+        
         # Initialize game systems
-        self.level = Level(self.current_level)
-        self.tower_manager = TowerManager()
-        self.enemy_manager = EnemyManager(self.level)
-        self.ui = UI(screen)
+        self.level = Level(self.current_level, self.rng.stream(f"level-{self.current_level}"))
+        self.tower_manager = TowerManager(self.rng.stream("towers"))
+        self.enemy_manager = create_enemy_manager(self.level, rng=self.rng.stream("waves"))
+        self.ui = HeadlessUI() if self.headless else UI(screen)
+        
+        # Sound effects and music (silent when headless)
+        self.audio = AudioManager(enabled=not self.headless)
+        self.audio.load_sounds()
         
         # Game state variables
         self.gold = STARTING_GOLD
         self.lives = STARTING_LIVES
+        self.enemies_killed = 0
+        self.enemies_leaked = 0
         self.current_wave = 0
         self.wave_in_progress = False
         self.selected_tower_type = 'cannon'  # Default selection
+        self.game_speed = GAME_SPEEDS[0]  # Fast-forward multiplier, applied by the main loop
         
         # Timing
         self.wave_start_timer = 0.0
         self.wave_delay = 3.0  # Delay before first wave
         self.wave_force_timer = 0.0  # Timer to force start next wave
+        self.sim_ticks = 0  # Fixed simulation steps run this game
+        
+        # Replay recorder notified of every applied command (see src/replay.py)
+        self.recorder = None
+        
+        # Dirty-rect rendering state: a cached frame of everything static
+        # (level view, towers, UI panel) and what was drawn over it last frame
+        self.dirty_rects = dirty_rects and not self.headless
+        self.static_frame: Optional[pygame.Surface] = None
+        self.static_frame_key = None
+        self.ui_state_key = None
+        self.overlay_frame_key = None
+        self.drawn_rects: List[pygame.Rect] = []
+        
+        # Translucent full-screen overlays for pause/game over/victory, by (color, alpha)
+        self.overlays: Dict[Tuple[Tuple[int, int, int], int], pygame.Surface] = {}
         
         # Get current level waves
         self.waves = LEVELS[self.current_level]['waves']
@@ -54,81 +100,127 @@ class Game:
     
     def handle_event(self, event: pygame.event.Event) -> None:
         """Handle input events"""
+        command = self.command_for_event(event)
+        if command is not None:
+            self.apply_command(*command)
+    
+    def command_for_event(self, event: pygame.event.Event) -> Optional[Tuple]:
+        """Translate an input event into a game command tuple, or None if it does nothing"""
         if self.state == GameState.MENU:
             if event.type == pygame.KEYDOWN:
                 if event.key == pygame.K_SPACE:
-                    self.start_game()
-                elif event.key == pygame.K_1:
-                    self.select_level(1)
-                elif event.key == pygame.K_2:
-                    self.select_level(2)
-                elif event.key == pygame.K_3:
-                    self.select_level(3)
-                elif event.key == pygame.K_4:
-                    self.select_level(4)
-                elif event.key == pygame.K_5:
-                    self.select_level(5)
-                elif event.key == pygame.K_5:
-                    self.select_level(5)
+                    return ('start_game',)
+                elif event.key in LEVEL_KEYS:
+                    return ('select_level', LEVEL_KEYS[event.key])
         
         elif self.state == GameState.PLAYING:
             if event.type == pygame.KEYDOWN:
                 if event.key == pygame.K_p:
-                    self.state = GameState.PAUSED
-                elif event.key == pygame.K_1:
-                    self.selected_tower_type = 'cannon'
-                elif event.key == pygame.K_2:
-                    self.selected_tower_type = 'machine_gun'
-                elif event.key == pygame.K_3:
-                    self.selected_tower_type = 'missile'
-                elif event.key == pygame.K_4:
-                    self.selected_tower_type = 'laser'
-                elif event.key == pygame.K_5:
-                    self.selected_tower_type = 'freeze'
+                    return ('pause',)
+                elif event.key in TOWER_KEYS:
+                    return ('select_tower', TOWER_KEYS[event.key])
                 elif event.key == pygame.K_n:  # 'N' for next wave
-                    self.skip_to_next_wave()
+                    return ('skip_wave',)
+                elif event.key == pygame.K_f:  # 'F' cycles fast-forward speeds
+                    return ('set_speed', self._next_speed(1, wrap=True))
+                elif event.key == pygame.K_RIGHTBRACKET:
+                    return ('set_speed', self._next_speed(1))
+                elif event.key == pygame.K_LEFTBRACKET:
+                    return ('set_speed', self._next_speed(-1))
             
             elif event.type == pygame.MOUSEBUTTONDOWN:
                 if event.button == 1:  # Left click
                     # Check UI events first
                     ui_action = self.ui.handle_event(event)
                     if ui_action == "skip_wave":
-                        self.skip_to_next_wave()
-                    else:
-                        self.handle_mouse_click(event.pos)
+                        return ('skip_wave',)
+                    elif ui_action == "speed":
+                        return ('set_speed', self._next_speed(1, wrap=True))
+                    grid_pos = self.screen_to_grid(event.pos)
+                    if grid_pos is not None:
+                        return ('click', grid_pos[0], grid_pos[1])
         
         elif self.state == GameState.PAUSED:
             if event.type == pygame.KEYDOWN:
                 if event.key == pygame.K_p:
-                    self.state = GameState.PLAYING
+                    return ('resume',)
         
         elif self.state in [GameState.GAME_OVER, GameState.VICTORY]:
             if event.type == pygame.KEYDOWN:
                 if event.key == pygame.K_r:
-                    self.restart_game()
+                    return ('restart',)
+        
+        return None
     
-    def handle_mouse_click(self, pos: tuple) -> None:
-        """Handle mouse clicks for tower placement and upgrades"""
+    def apply_command(self, command: str, *args) -> None:
+        """
+        Apply a game command from player input or a replay
+        
+        Commands are recorded with the current simulation tick when a
+        replay recorder is attached.
+        """
+        if self.recorder is not None:
+            self.recorder.record(self.sim_ticks, command, args)
+        
+        if command == 'start_game':
+            self.start_game()
+        elif command == 'select_level':
+            self.select_level(args[0])
+        elif command == 'pause':
+            self.state = GameState.PAUSED
+        elif command == 'resume':
+            self.state = GameState.PLAYING
+        elif command == 'select_tower':
+            self.selected_tower_type = args[0]
+        elif command == 'skip_wave':
+            self.skip_to_next_wave()
+        elif command == 'set_speed':
+            self.game_speed = args[0]
+        elif command == 'click':
+            self.click_grid(args[0], args[1])
+        elif command == 'restart':
+            self.restart_game()
+        else:
+            raise ValueError(f"Unknown command: {command}")
+    
+    def _next_speed(self, direction: int, wrap: bool = False) -> int:
+        """Get the fast-forward speed one step up (1) or down (-1) from the current one"""
+        index = GAME_SPEEDS.index(self.game_speed) + direction
+        if wrap:
+            index %= len(GAME_SPEEDS)
+        return GAME_SPEEDS[max(0, min(index, len(GAME_SPEEDS) - 1))]
+    
+    def screen_to_grid(self, pos: tuple) -> Optional[Tuple[int, int]]:
+        """Convert a screen position to grid coordinates, or None outside the game area"""
         mouse_x, mouse_y = pos
         
         # Check if click is in game area (not UI panel)
-        if mouse_x < GAME_AREA_WIDTH:
-            # Convert screen coordinates to world coordinates
-            world_x, world_y = self.level.screen_to_world(mouse_x, mouse_y)
-            
-            # Convert to grid coordinates
-            grid_x = int(world_x // GRID_SIZE)
-            grid_y = int(world_y // GRID_SIZE)
-            
-            # Check if there's already a tower at this position
-            existing_tower = self.tower_manager.get_tower_at(grid_x, grid_y)
-            
-            if existing_tower:
-                # Try to upgrade existing tower
-                self.try_upgrade_tower(existing_tower)
-            else:
-                # Try to place new tower
-                self.try_place_tower(grid_x, grid_y)
+        if mouse_x >= GAME_AREA_WIDTH:
+            return None
+        
+        # Convert screen coordinates to world coordinates
+        world_x, world_y = self.level.screen_to_world(mouse_x, mouse_y)
+        
+        # Convert to grid coordinates
+        return (int(world_x // GRID_SIZE), int(world_y // GRID_SIZE))
+    
+    def handle_mouse_click(self, pos: tuple) -> None:
+        """Handle mouse clicks for tower placement and upgrades"""
+        grid_pos = self.screen_to_grid(pos)
+        if grid_pos is not None:
+            self.apply_command('click', grid_pos[0], grid_pos[1])
+    
+    def click_grid(self, grid_x: int, grid_y: int) -> None:
+        """Upgrade the tower on a grid cell, or place the selected tower there"""
+        # Check if there's already a tower at this position
+        existing_tower = self.tower_manager.get_tower_at(grid_x, grid_y)
+        
+        if existing_tower:
+            # Try to upgrade existing tower
+            self.try_upgrade_tower(existing_tower)
+        else:
+            # Try to place new tower
+            self.try_place_tower(grid_x, grid_y)
     
     def try_place_tower(self, grid_x: int, grid_y: int) -> bool:
         """Attempt to place a tower at the specified grid position"""
@@ -149,6 +241,7 @@ class Game:
         if self.tower_manager.place_tower(self.selected_tower_type, grid_x, grid_y):
             self.gold -= tower_cost
             self.ui.update_gold(self.gold)
+            self.audio.play_sound('ui_click')
             return True
         
         return False
@@ -165,9 +258,10 @@ class Game:
             return False
         
         # Upgrade the tower
-        if tower.upgrade():
+        if self.tower_manager.upgrade_tower(tower):
             self.gold -= upgrade_cost
             self.ui.update_gold(self.gold)
+            self.audio.play_sound('ui_click')
             return True
         
         return False
@@ -176,35 +270,54 @@ class Game:
         """Start a new game"""
         self.state = GameState.PLAYING
         self.wave_start_timer = self.wave_delay
+        self.audio.play_music(LEVEL_MUSIC[self.current_level])
     
     def restart_game(self) -> None:
         """Restart the game"""
         # Reset all systems
         self.tower_manager.clear_towers()
         self.enemy_manager.clear_enemies()
+        self.reset_random_streams()
         
         # Reset game state
         self.gold = STARTING_GOLD
         self.lives = STARTING_LIVES
+        self.enemies_killed = 0
+        self.enemies_leaked = 0
         self.current_wave = 0
         self.wave_in_progress = False
         self.wave_start_timer = self.wave_delay
         self.wave_force_timer = 0.0
+        self.sim_ticks = 0
+        self.game_speed = GAME_SPEEDS[0]
         self.state = GameState.PLAYING
+        self.audio.stop_sounds()
+        self.audio.play_music(LEVEL_MUSIC[self.current_level])
         
         # Update UI
         self.ui.update_gold(self.gold)
         self.ui.update_lives(self.lives)
         self.ui.update_wave(self.current_wave + 1, len(self.waves))
+        self.ui.update_game_speed(self.game_speed, self.game_speed)
     
-    def update(self, dt: float) -> None:
-        """Update game state"""
-        if self.state != GameState.PLAYING:
+    def reset_random_streams(self) -> None:
+        """Restart the simulation random streams so a replayed game rolls the same numbers"""
+        self.enemy_manager.rng = self.rng.stream("waves")
+        self.tower_manager.rng = self.rng.stream("towers")
+    
+    def update_camera(self, frame_dt: float) -> None:
+        """Scroll the camera from held keys; runs once per rendered frame"""
+        if self.headless or self.state != GameState.PLAYING:
             return
         
-        # Update camera
         keys_pressed = pygame.key.get_pressed()
-        self.level.update_camera(dt, keys_pressed)
+        self.level.update_camera(frame_dt, keys_pressed)
+    
+    def update(self, dt: float) -> None:
+        """Advance the simulation by one fixed step of dt seconds"""
+        if self.state != GameState.PLAYING:
+            return
+        self.sim_ticks += 1
         
         # Update wave timing
         if not self.wave_in_progress and self.current_wave < len(self.waves):
@@ -231,24 +344,37 @@ class Game:
         
         # Update game systems
         self.enemy_manager.update(dt)
-        self.tower_manager.update(dt, self.enemy_manager.get_enemies())
+        self.tower_manager.update(dt, self.enemy_manager)
+        
+        # Shot and explosion sounds (the audio manager merges repeats within a frame)
+        for tower_type in self.tower_manager.get_shots_fired():
+            self.audio.play_sound(TOWER_FIRE_SOUNDS[tower_type])
+        for kind in self.tower_manager.get_splash_impacts():
+            if kind in SPLASH_SOUNDS:
+                self.audio.play_sound(SPLASH_SOUNDS[kind])
         
         # Check for enemy kills and award gold
         killed_enemies = self.enemy_manager.get_killed_enemies()
         for enemy_type in killed_enemies:
             reward = ENEMY_TYPES[enemy_type]['reward']
             self.gold += reward
+        self.enemies_killed += len(killed_enemies)
         self.ui.update_gold(self.gold)
+        if killed_enemies:
+            self.audio.play_sound('enemy_death')
         
         # Check for enemies that reached the end
         escaped_enemies = self.enemy_manager.get_escaped_enemies()
         if escaped_enemies > 0:
             self.lives -= escaped_enemies
+            self.enemies_leaked += escaped_enemies
             self.ui.update_lives(self.lives)
+            self.audio.play_sound('life_lost')
             
             # Check game over condition
             if self.lives <= 0:
                 self.state = GameState.GAME_OVER
+                self.audio.stop_music()
         
         # Check if wave is complete
         if self.wave_in_progress and not self.enemy_manager.has_enemies() and not self.enemy_manager.is_spawning():
@@ -259,6 +385,8 @@ class Game:
             # Check victory condition
             if self.current_wave >= len(self.waves):
                 self.state = GameState.VICTORY
+                self.audio.stop_music()
+                self.audio.play_sound('victory')
     
     def start_next_wave(self) -> None:
         """Start the next wave of enemies"""
@@ -268,6 +396,7 @@ class Game:
             self.current_wave += 1
             self.wave_in_progress = True
             self.wave_force_timer = 0.0  # Reset force timer for new wave
+            self.audio.play_sound('wave_start')
             
             # Update UI
             self.ui.update_wave(self.current_wave, len(self.waves))
@@ -284,52 +413,69 @@ class Game:
                 self.wave_start_timer = 0.0
                 self.start_next_wave()
     
-    def render(self) -> None:
-        """Render the game"""
+    def render(self, alpha: float = 1.0) -> Optional[List[pygame.Rect]]:
+        """
+        Render the game
+        
+        Args:
+            alpha: Fraction of a simulation step elapsed since the last update,
+                used to interpolate moving entities between their last two states
+        
+        Returns:
+            None if the whole screen should be flipped, otherwise (dirty-rect
+            mode) the list of screen rectangles that changed
+        """
+        # Only interpolate while the simulation is actually advancing
+        if self.state != GameState.PLAYING:
+            alpha = 1.0
+        
+        if self.dirty_rects:
+            return self._render_dirty(alpha)
+        
+        self._render_full(alpha)
+        return None
+    
+    def _render_full(self, alpha: float) -> None:
+        """Redraw the whole screen"""
         # Clear screen
         self.screen.fill(BLACK)
         
         if self.state == GameState.MENU:
             self.render_menu()
         elif self.state in [GameState.PLAYING, GameState.PAUSED]:
-            self.render_game()
+            self.render_game(alpha)
             if self.state == GameState.PAUSED:
                 self.render_pause_overlay()
         elif self.state == GameState.GAME_OVER:
-            self.render_game()
+            self.render_game(alpha)
             self.render_game_over()
         elif self.state == GameState.VICTORY:
-            self.render_game()
+            self.render_game(alpha)
             self.render_victory()
     
     def render_menu(self) -> None:
         """Render the main menu"""
-        font = pygame.font.Font(None, 72)
-        title_text = font.render("Tower Defense", True, WHITE)
+        title_text = text_cache.render("Tower Defense", 72, WHITE)
         title_rect = title_text.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 - 100))
         self.screen.blit(title_text, title_rect)
         
         # Current level display
-        font = pygame.font.Font(None, 48)
         level_name = LEVELS[self.current_level]['name']
-        level_text = font.render(f"Level {self.current_level}: {level_name}", True, YELLOW)
+        level_text = text_cache.render(f"Level {self.current_level}: {level_name}", 48, YELLOW)
         level_rect = level_text.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 - 30))
         self.screen.blit(level_text, level_rect)
         
         # Instructions
-        font = pygame.font.Font(None, 36)
-        start_text = font.render("Press SPACE to Start", True, WHITE)
+        start_text = text_cache.render("Press SPACE to Start", 36, WHITE)
         start_rect = start_text.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 + 30))
         self.screen.blit(start_text, start_rect)
         
         # Level selection
-        font = pygame.font.Font(None, 24)
-        select_text = font.render("Press 1-5 for Level Selection", True, GRAY)
+        select_text = text_cache.render("Press 1-5 for Level Selection", 24, GRAY)
         select_rect = select_text.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 + 70))
         self.screen.blit(select_text, select_rect)
         
         # Level descriptions
-        font = pygame.font.Font(None, 18)
         level_descriptions = [
             "1: Forest Path (Beginner)",
             "2: Mountain Pass (Advanced)", 
@@ -339,20 +485,94 @@ class Game:
         ]
         
         for i, desc in enumerate(level_descriptions):
-            desc_text = font.render(desc, True, GRAY)
+            desc_text = text_cache.render(desc, 18, GRAY)
             desc_rect = desc_text.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 + 90 + i * 20))
             self.screen.blit(desc_text, desc_rect)
     
-    def render_game(self) -> None:
+    def _render_dirty(self, alpha: float) -> Optional[List[pygame.Rect]]:
+        """Redraw only what changed since the last frame, falling back to a full redraw"""
+        if self.state != GameState.PLAYING:
+            # Menus and overlays only change with state, level or mouse position
+            frame_key = (self.state, self.current_level, pygame.mouse.get_pos())
+            if frame_key == self.overlay_frame_key:
+                return []
+            self.overlay_frame_key = frame_key
+            self.static_frame_key = None  # Rebuild the static frame when play resumes
+            self._render_full(alpha)
+            return None
+        self.overlay_frame_key = None
+        
+        # Camera pans, tower changes and level switches invalidate the static frame
+        camera = self.level.camera
+        static_key = (id(self.level), camera.x, camera.y, self.tower_manager.revision)
+        if static_key != self.static_frame_key:
+            self.static_frame_key = static_key
+            self.ui_state_key = self.ui.state_key()
+            self._build_static_frame()
+            self.screen.blit(self.static_frame, (0, 0))
+            self.drawn_rects = self._render_dynamic(alpha)
+            return None
+        
+        dirty = []
+        
+        # Redraw the side panel only when something it shows has changed
+        ui_key = self.ui.state_key()
+        if ui_key != self.ui_state_key:
+            self.ui_state_key = ui_key
+            self.ui.render_to(self.static_frame)
+            dirty.append(self.screen.blit(self.static_frame, self.ui.panel_rect, self.ui.panel_rect))
+        
+        # Erase last frame's entities and overlays, then draw this frame's
+        for rect in self.drawn_rects:
+            self.screen.blit(self.static_frame, rect, rect)
+        dirty.extend(self.drawn_rects)
+        self.drawn_rects = self._render_dynamic(alpha)
+        dirty.extend(self.drawn_rects)
+        
+        if len(dirty) > MAX_DIRTY_RECTS:
+            return None
+        return dirty
+    
+    def _build_static_frame(self) -> None:
+        """Draw everything that only changes on camera pan or tower changes into the static frame"""
+        if self.static_frame is None:
+            self.static_frame = pygame.Surface(self.screen.get_size()).convert()
+        
+        self.static_frame.fill(BLACK)
+        self.level.render(self.static_frame)
+        self.tower_manager.render_towers(self.static_frame, self.level)
+        self.ui.render_to(self.static_frame)
+    
+    def _render_dynamic(self, alpha: float) -> List[pygame.Rect]:
+        """Draw moving entities and mouse overlays onto the screen and return the areas touched"""
+        game_area = pygame.Rect(0, 0, GAME_AREA_WIDTH, SCREEN_HEIGHT)
+        
+        # Entities stay inside the game area so they never paint over the side panel
+        self.screen.set_clip(game_area)
+        rects = self.tower_manager.render_projectiles(self.screen, self.level, alpha)
+        rects += self.enemy_manager.render(self.screen, self.level, alpha)
+        self.screen.set_clip(None)
+        rects = [rect.clip(game_area) for rect in rects]
+        
+        # Overlays drawn after the UI, as in a full redraw
+        screen_area = self.screen.get_rect()
+        preview_rect = self.render_selected_tower_preview()
+        if preview_rect is not None:
+            rects.append(preview_rect.clip(screen_area))
+        rects.extend(rect.clip(screen_area) for rect in self.render_tower_hover_info())
+        
+        return [rect for rect in rects if rect.width and rect.height]
+    
+    def render_game(self, alpha: float = 1.0) -> None:
         """Render the main game view"""
         # Render level
         self.level.render(self.screen)
         
         # Render towers
-        self.tower_manager.render(self.screen, self.level)
+        self.tower_manager.render(self.screen, self.level, alpha)
         
         # Render enemies
-        self.enemy_manager.render(self.screen, self.level)
+        self.enemy_manager.render(self.screen, self.level, alpha)
         
         # Render UI
         self.ui.render()
@@ -363,8 +583,8 @@ class Game:
         # Show tower info on hover
         self.render_tower_hover_info()
     
-    def render_selected_tower_preview(self) -> None:
-        """Show tower range preview at mouse position"""
+    def render_selected_tower_preview(self) -> Optional[pygame.Rect]:
+        """Show tower range preview at mouse position and return the area drawn"""
         mouse_pos = pygame.mouse.get_pos()
         mouse_x, mouse_y = mouse_pos
         
@@ -383,16 +603,18 @@ class Game:
             # Show range circle only if it's visible
             if -100 <= center_screen_x <= GAME_AREA_WIDTH + 100 and -100 <= center_screen_y <= SCREEN_HEIGHT + 100:
                 tower_range = TOWER_TYPES[self.selected_tower_type]['range']
-                pygame.draw.circle(self.screen, WHITE, (int(center_screen_x), int(center_screen_y)), tower_range, 1)
+                return pygame.draw.circle(self.screen, WHITE, (int(center_screen_x), int(center_screen_y)), tower_range, 1)
+        return None
     
-    def render_tower_hover_info(self) -> None:
-        """Show tower information when hovering over towers"""
+    def render_tower_hover_info(self) -> List[pygame.Rect]:
+        """Show tower information when hovering over towers and return the areas drawn"""
         mouse_pos = pygame.mouse.get_pos()
         mouse_x, mouse_y = mouse_pos
+        rects: List[pygame.Rect] = []
         
         # Only show info in game area
         if mouse_x >= GAME_AREA_WIDTH:
-            return
+            return rects
         
         # Convert mouse position to grid coordinates
         world_x, world_y = self.level.screen_to_world(mouse_x, mouse_y)
@@ -409,54 +631,56 @@ class Game:
             # Only draw range circle if tower is visible
             if -100 <= tower_screen_x <= GAME_AREA_WIDTH + 100 and -100 <= tower_screen_y <= SCREEN_HEIGHT + 100:
                 # Use the tower's actual current range (which includes upgrades)
-                pygame.draw.circle(self.screen, YELLOW, (int(tower_screen_x), int(tower_screen_y)), tower.range, 2)
+                rects.append(pygame.draw.circle(self.screen, YELLOW, (int(tower_screen_x), int(tower_screen_y)),
+                                                tower.range, 2))
             
             # Show tower info popup
-            self.ui.render_tower_info(tower, mouse_pos)
+            info_rect = self.ui.render_tower_info(tower, mouse_pos)
+            if info_rect is not None:
+                rects.append(info_rect)
+        
+        return rects
+    
+    def _get_overlay(self, color: Tuple[int, int, int], alpha: int) -> pygame.Surface:
+        """Get a cached translucent full-screen overlay"""
+        key = (color, alpha)
+        overlay = self.overlays.get(key)
+        if overlay is None:
+            overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
+            overlay.set_alpha(alpha)
+            overlay.fill(color)
+            self.overlays[key] = overlay
+        return overlay
     
     def render_pause_overlay(self) -> None:
         """Render pause overlay"""
-        overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
-        overlay.set_alpha(128)
-        overlay.fill(BLACK)
-        self.screen.blit(overlay, (0, 0))
+        self.screen.blit(self._get_overlay(BLACK, 128), (0, 0))
         
-        font = pygame.font.Font(None, 72)
-        pause_text = font.render("PAUSED", True, WHITE)
+        pause_text = text_cache.render("PAUSED", 72, WHITE)
         pause_rect = pause_text.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2))
         self.screen.blit(pause_text, pause_rect)
     
     def render_game_over(self) -> None:
         """Render game over screen"""
-        overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
-        overlay.set_alpha(192)
-        overlay.fill(RED)
-        self.screen.blit(overlay, (0, 0))
+        self.screen.blit(self._get_overlay(RED, 192), (0, 0))
         
-        font = pygame.font.Font(None, 72)
-        game_over_text = font.render("GAME OVER", True, WHITE)
+        game_over_text = text_cache.render("GAME OVER", 72, WHITE)
         game_over_rect = game_over_text.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 - 50))
         self.screen.blit(game_over_text, game_over_rect)
         
-        font = pygame.font.Font(None, 36)
-        restart_text = font.render("Press R to Restart", True, WHITE)
+        restart_text = text_cache.render("Press R to Restart", 36, WHITE)
         restart_rect = restart_text.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 + 50))
         self.screen.blit(restart_text, restart_rect)
     
     def render_victory(self) -> None:
         """Render victory screen"""
-        overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
-        overlay.set_alpha(192)
-        overlay.fill(GREEN)
-        self.screen.blit(overlay, (0, 0))
+        self.screen.blit(self._get_overlay(GREEN, 192), (0, 0))
         
-        font = pygame.font.Font(None, 72)
-        victory_text = font.render("VICTORY!", True, WHITE)
+        victory_text = text_cache.render("VICTORY!", 72, WHITE)
         victory_rect = victory_text.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 - 50))
         self.screen.blit(victory_text, victory_rect)
         
-        font = pygame.font.Font(None, 36)
-        restart_text = font.render("Press R to Play Again", True, WHITE)
+        restart_text = text_cache.render("Press R to Play Again", 36, WHITE)
         restart_rect = restart_text.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 + 50))
         self.screen.blit(restart_text, restart_rect)
     
@@ -465,18 +689,24 @@ class Game:
         if level_id in LEVELS:
             self.current_level = level_id
             # Reinitialize level and enemy manager
-            self.level = Level(self.current_level)
-            self.enemy_manager = EnemyManager(self.level)
+            self.level = Level(self.current_level, self.rng.stream(f"level-{self.current_level}"))
+            self.enemy_manager = create_enemy_manager(self.level, rng=self.rng.stream("waves"))
             self.waves = LEVELS[self.current_level]['waves']
             
             # Reset game state for new level
             self.tower_manager.clear_towers()
             self.enemy_manager.clear_enemies()
+            self.reset_random_streams()
             self.gold = STARTING_GOLD
             self.lives = STARTING_LIVES
+            self.enemies_killed = 0
+            self.enemies_leaked = 0
             self.current_wave = 0
             self.wave_in_progress = False
             self.wave_start_timer = self.wave_delay
+            self.sim_ticks = 0
+            self.audio.stop_sounds()
+            self.audio.stop_music()
             
             # Update UI
             self.ui.update_gold(self.gold)
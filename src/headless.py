@@ -0,0 +1,204 @@
+"""
+Headless simulation - runs Game.update at uncapped speed with no display
+
+Used for balance testing: give it a level, a scripted list of tower
+placements/upgrades and a wave range, and it returns the outcome.
+
+Command line:
+    python -m src.headless --level 2 --waves 1-10 --placements build.json
+"""
+
+import argparse
+import json
+import time
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Union
+from .constants import *
+from .game import Game, GameState
+
+# Give up on a run after this much simulated time (seconds)
+MAX_SIM_TIME = 3600.0
+
+def normalize_action(action: Union[Dict[str, Any], Sequence]) -> Dict[str, Any]:
+    """
+    Convert a placement script entry into an action dict
+
+    Accepts either a dict such as
+        {'action': 'place', 'tower_type': 'cannon', 'grid_x': 3, 'grid_y': 4, 'wave': 1}
+        {'action': 'upgrade', 'grid_x': 3, 'grid_y': 4, 'wave': 3}
+    or a (tower_type, grid_x, grid_y[, wave]) tuple for a placement.
+    'wave' is the 1-based wave the action is made for: it is attempted once
+    the previous wave has started. It defaults to 1 (before the first wave).
+    """
+    if isinstance(action, dict):
+        normalized = dict(action)
+        normalized.setdefault('action', 'place')
+    else:
+        normalized = {'action': 'place', 'tower_type': action[0], 'grid_x': action[1], 'grid_y': action[2]}
+        if len(action) > 3:
+            normalized['wave'] = action[3]
+
+    normalized.setdefault('wave', 1)
+    if normalized['action'] not in ('place', 'upgrade'):
+        raise ValueError(f"Unknown action: {normalized['action']}")
+    if normalized['action'] == 'place' and normalized.get('tower_type') not in TOWER_TYPES:
+        raise ValueError(f"Unknown tower type: {normalized.get('tower_type')}")
+    return normalized
+
+def _try_action(game: Game, action: Dict[str, Any]) -> Optional[bool]:
+    """
+    Attempt a scripted action
+
+    Returns True on success, False if it can never succeed and None if it
+    should be retried later (not enough gold yet)
+    """
+    grid_x, grid_y = action['grid_x'], action['grid_y']
+
+    if action['action'] == 'place':
+        if not game.level.is_buildable(grid_x, grid_y) or game.tower_manager.has_tower_at(grid_x, grid_y):
+            return False
+        game.selected_tower_type = action['tower_type']
+        if game.try_place_tower(grid_x, grid_y):
+            return True
+        return None
+
+    tower = game.tower_manager.get_tower_at(grid_x, grid_y)
+    if tower is None or not tower.can_upgrade():
+        return False
+    if game.try_upgrade_tower(tower):
+        return True
+    return None
+
+def _track_waves(game: Game, wave_stats: List[Dict[str, Any]], wave_before: int,
+                 leaks_before: int, sim_time: float) -> None:
+    """
+    Update per-wave statistics after a simulation step
+
+    Each entry records the wave number, when it started, the gold held at
+    that point, the enemies leaked while it was the newest wave and how long
+    it took to clear (None if the next wave started first).
+    """
+    if wave_stats:
+        current = wave_stats[-1]
+        current['leaks'] += game.enemies_leaked - leaks_before
+        if current['clear_time'] is None and not game.wave_in_progress and game.current_wave == current['wave']:
+            current['clear_time'] = round(sim_time - current['start_time'], 3)
+
+    if game.current_wave != wave_before:
+        wave_stats.append({
+            'wave': game.current_wave,
+            'start_time': round(sim_time, 3),
+            'gold_at_start': game.gold,
+            'leaks': 0,
+            'clear_time': None,
+        })
+
+def run_headless(level_id: int, placements: Sequence = (), wave_range: Optional[Tuple[int, int]] = None,
+                 seed: Optional[int] = None, max_sim_time: float = MAX_SIM_TIME) -> Dict[str, Any]:
+    """
+    Simulate a game without a display
+
+    Args:
+        level_id: Level to play
+        placements: Scripted place/upgrade actions (see normalize_action),
+            carried out in order as soon as they are affordable
+        wave_range: Inclusive 1-based (first, last) waves to play; all waves by default
+        seed: Game seed for reproducible runs; a random one is picked (and reported) if omitted
+        max_sim_time: Simulated seconds after which the run is abandoned
+
+    Returns:
+        Dictionary with the outcome: result, lives, gold, kills, leaks, timings
+        and per-wave statistics
+    """
+    game = Game(seed=seed)
+    game.select_level(level_id)
+
+    all_waves = LEVELS[level_id]['waves']
+    first_wave, last_wave = wave_range if wave_range else (1, len(all_waves))
+    if not 1 <= first_wave <= last_wave <= len(all_waves):
+        raise ValueError(f"Invalid wave range {first_wave}-{last_wave} for level {level_id}")
+
+    # Play only the requested waves; victory triggers after the last one
+    game.waves = all_waves[:last_wave]
+    game.current_wave = first_wave - 1
+    game.start_game()
+
+    pending = [normalize_action(action) for action in placements]
+    failed: List[Dict[str, Any]] = []
+    completed = 0
+
+    start_time = time.perf_counter()
+    ticks = 0
+    sim_time = 0.0
+    wave_stats: List[Dict[str, Any]] = []
+    while game.state == GameState.PLAYING and sim_time < max_sim_time:
+        # Carry out scripted actions in order, waiting while they are unaffordable
+        while pending and pending[0]['wave'] <= max(first_wave, game.current_wave + 1):
+            outcome = _try_action(game, pending[0])
+            if outcome is None:
+                break
+            action = pending.pop(0)
+            if outcome:
+                completed += 1
+            else:
+                failed.append(action)
+
+        wave_before = game.current_wave
+        leaks_before = game.enemies_leaked
+        game.update(SIM_DT)
+        ticks += 1
+        sim_time += SIM_DT
+        _track_waves(game, wave_stats, wave_before, leaks_before, sim_time)
+
+    if game.state == GameState.VICTORY:
+        result = 'victory'
+    elif game.state == GameState.GAME_OVER:
+        result = 'game_over'
+    else:
+        result = 'timeout'
+
+    return {
+        'level': level_id,
+        'waves': [first_wave, last_wave],
+        'seed': game.rng.seed,
+        'result': result,
+        'lives': game.lives,
+        'gold': game.gold,
+        'kills': game.enemies_killed,
+        'leaks': game.enemies_leaked,
+        'waves_reached': game.current_wave,
+        'towers': len(game.tower_manager.towers),
+        'actions_completed': completed,
+        'actions_failed': len(failed),
+        'actions_pending': len(pending),
+        'ticks': ticks,
+        'sim_time': round(sim_time, 3),
+        'wall_time': round(time.perf_counter() - start_time, 3),
+        'wave_stats': wave_stats,
+    }
+
+def _parse_wave_range(text: str) -> Tuple[int, int]:
+    """Parse '3' or '1-10' into an inclusive wave range"""
+    if '-' in text:
+        first, last = text.split('-', 1)
+        return (int(first), int(last))
+    return (int(text), int(text))
+
+def main(argv: Optional[List[str]] = None) -> None:
+    """Command line entry point"""
+    parser = argparse.ArgumentParser(description="Run a headless tower defense simulation")
+    parser.add_argument('--level', type=int, default=1, help="level id (1-5)")
+    parser.add_argument('--waves', type=_parse_wave_range, default=None, help="wave range, e.g. 1-10")
+    parser.add_argument('--placements', default=None, help="JSON file with a list of place/upgrade actions")
+    parser.add_argument('--seed', type=int, default=None, help="random seed")
+    args = parser.parse_args(argv)
+
+    placements = []
+    if args.placements:
+        with open(args.placements) as f:
+            placements = json.load(f)
+
+    results = run_headless(args.level, placements, args.waves, args.seed)
+    print(json.dumps(results, indent=2))
+
+if __name__ == "__main__":
+    main()
@@ -3,8 +3,10 @@ Level management and pathfinding system
 """
 
 import pygame  # type: ignore
+import bisect
 import random
-from typing import List, Tuple, Set, Dict, Any
+import numpy as np  # type: ignore
+from typing import List, Tuple, Set, Dict, Any, Optional
 from .constants import *
 from .sprite_manager import sprite_manager
 
@@ -20,6 +22,10 @@ class Camera:
         self.world_width = 20 * GRID_SIZE  # 20 grid cells wide
         self.world_height = 15 * GRID_SIZE  # 15 grid cells tall
         
+        # Size of the view the camera draws into
+        self.view_width = GAME_AREA_WIDTH
+        self.view_height = SCREEN_HEIGHT
+        
         # Calculate max camera offsets to keep world in view
         self.max_x = max(0, self.world_width - GAME_AREA_WIDTH)
         self.max_y = max(0, self.world_height - SCREEN_HEIGHT)
@@ -57,8 +63,10 @@ class Camera:
 class Level:
     """Manages level data, pathfinding, and terrain"""
     
-    def __init__(self, level_id: int = 1):
+    def __init__(self, level_id: int = 1, rng: Optional[random.Random] = None):
         self.level_id = level_id
+        # Random source for background generation
+        self.rng = rng if rng is not None else random.Random()
         self.level_config = LEVELS[level_id]
         self.name = self.level_config['name']
         
@@ -70,6 +78,9 @@ class Level:
         # Create path segments for smooth enemy movement
         self.path_segments = self._create_path_segments()
         
+        # Arc-length table: enemies move by distance along the path
+        self._build_arc_length_table()
+        
         # Camera system
         self.camera = Camera()
         
@@ -77,6 +88,9 @@ class Level:
         self.background_tiles: Dict[Tuple[int, int], str] = {}
         self.decorations: List[Dict[str, Any]] = []
         self._generate_background()
+        
+        # Pre-rendered tiles, path and decorations, baked on first render
+        self.static_layer: Optional[pygame.Surface] = None
     
     def _create_path_segments(self) -> List[Tuple[Tuple[int, int], Tuple[int, int]]]:
         """Create path segments between consecutive path points"""
@@ -129,64 +143,75 @@ class Level:
         """Convert world coordinates to grid coordinates"""
         return (int(world_x // GRID_SIZE), int(world_y // GRID_SIZE))
     
+    def _build_arc_length_table(self) -> None:
+        """Precompute world-space segments and cumulative arc lengths along the path"""
+        points = [self.get_world_position(*point) for point in self.path_points]
+        
+        starts = []
+        deltas = []
+        lengths = []
+        for (x1, y1), (x2, y2) in zip(points, points[1:]):
+            length = ((x2 - x1) ** 2 + (y2 - y1) ** 2) ** 0.5
+            # Zero-length segments never hold an enemy, so leave them out of the table
+            if length > 0:
+                starts.append((x1, y1))
+                deltas.append((x2 - x1, y2 - y1))
+                lengths.append(length)
+        
+        # Cumulative distance at the start of each segment, plus the total at the end
+        offsets = [0.0]
+        for length in lengths:
+            offsets.append(offsets[-1] + length)
+        
+        self.segment_starts = starts
+        self.segment_deltas = deltas
+        self.segment_lengths = lengths
+        self.segment_offsets = offsets
+        self.path_length = offsets[-1]
+        self.path_end = self.get_path_end()
+        
+        # Array copies for batched lookups
+        self.segment_starts_array = np.array(starts, dtype=np.float64).reshape(-1, 2)
+        self.segment_deltas_array = np.array(deltas, dtype=np.float64).reshape(-1, 2)
+        self.segment_lengths_array = np.array(lengths, dtype=np.float64)
+        self.segment_offsets_array = np.array(offsets, dtype=np.float64)
+    
+    def position_at(self, distance: float) -> Tuple[float, float]:
+        """Get the world position a distance along the path (O(log n) bisect on arc length)"""
+        if distance >= self.path_length:
+            return self.path_end
+        
+        segment = max(0, bisect.bisect_right(self.segment_offsets, distance) - 1)
+        ratio = (distance - self.segment_offsets[segment]) / self.segment_lengths[segment]
+        start_x, start_y = self.segment_starts[segment]
+        delta_x, delta_y = self.segment_deltas[segment]
+        return (start_x + delta_x * ratio, start_y + delta_y * ratio)
+    
+    def positions_at(self, distances: np.ndarray) -> np.ndarray:
+        """Get world positions (n x 2) for an array of distances along the path"""
+        if not self.segment_lengths:
+            return np.tile(np.array(self.path_end, dtype=np.float64), (len(distances), 1))
+        
+        segments = np.searchsorted(self.segment_offsets_array, distances, side='right') - 1
+        segments = np.clip(segments, 0, len(self.segment_lengths) - 1)
+        ratios = np.clip((distances - self.segment_offsets_array[segments]) / self.segment_lengths_array[segments],
+                         0.0, 1.0)
+        return self.segment_starts_array[segments] + self.segment_deltas_array[segments] * ratios[:, None]
+    
     def get_next_position_on_path(self, current_progress: float, distance: float) -> Tuple[float, float, float]:
         """
         Get the next position on the path given current progress and distance to move
+        
+        Progress is the fraction of the total path length covered.
         Returns: (x, y, new_progress)
         """
-        total_segments = len(self.path_segments)
-        if total_segments == 0:
+        if self.path_length == 0:
             return self.get_path_start() + (0.0,)
         
-        # Calculate which segment we're on and position within segment
-        segment_progress = current_progress * total_segments
-        current_segment = int(segment_progress)
-        segment_offset = segment_progress - current_segment
-        
-        remaining_distance = distance
-        
-        while remaining_distance > 0 and current_segment < total_segments:
-            # Get current segment
-            start_grid, end_grid = self.path_segments[current_segment]
-            start_pos = self.get_world_position(*start_grid)
-            end_pos = self.get_world_position(*end_grid)
-            
-            # Calculate segment length and current position
-            segment_length = ((end_pos[0] - start_pos[0]) ** 2 + (end_pos[1] - start_pos[1]) ** 2) ** 0.5
-            
-            if segment_length == 0:
-                # Zero-length segment, move to next
-                current_segment += 1
-                segment_offset = 0
-                continue
-            
-            # Current position in world coordinates
-            current_x = start_pos[0] + (end_pos[0] - start_pos[0]) * segment_offset
-            current_y = start_pos[1] + (end_pos[1] - start_pos[1]) * segment_offset
-            
-            # Distance remaining in current segment
-            distance_to_segment_end = segment_length * (1.0 - segment_offset)
-            
-            if remaining_distance <= distance_to_segment_end:
-                # We can complete the movement within this segment
-                movement_ratio = remaining_distance / segment_length
-                new_x = current_x + (end_pos[0] - start_pos[0]) * movement_ratio
-                new_y = current_y + (end_pos[1] - start_pos[1]) * movement_ratio
-                
-                # Update progress
-                new_segment_offset = segment_offset + movement_ratio
-                new_progress = (current_segment + new_segment_offset) / total_segments
-                
-                return (new_x, new_y, min(new_progress, 1.0))
-            else:
-                # Move to the end of current segment and continue
-                remaining_distance -= distance_to_segment_end
-                current_segment += 1
-                segment_offset = 0
-        
-        # If we've reached the end of the path
-        end_pos = self.get_path_end()
-        return (end_pos[0], end_pos[1], 1.0)
+        new_distance = current_progress * self.path_length + distance
+        if new_distance >= self.path_length:
+            return self.path_end + (1.0,)
+        return self.position_at(new_distance) + (new_distance / self.path_length,)
     
     def _generate_background(self) -> None:
         """Generate background tiles and decorations for the level"""
@@ -214,7 +239,7 @@ class Level:
                     self.background_tiles[(x, y)] = 'dirt_path'
                 else:
                     # Random grass variation
-                    if random.random() < 0.1:  # 10% chance for forest edge
+                    if self.rng.random() < 0.1:  # 10% chance for forest edge
                         self.background_tiles[(x, y)] = 'forest_edge'
                     else:
                         self.background_tiles[(x, y)] = 'grass_tile'
@@ -236,20 +261,20 @@ class Level:
                     
                     if clear_area:
                         # Random chance for decorations
-                        rand = random.random()
+                        rand = self.rng.random()
                         if rand < 0.15:  # 15% chance for tree
                             decoration = {
                                 'type': 'tree',
-                                'x': x * GRID_SIZE + random.randint(-8, 8),
-                                'y': y * GRID_SIZE + random.randint(-8, 8),
+                                'x': x * GRID_SIZE + self.rng.randint(-8, 8),
+                                'y': y * GRID_SIZE + self.rng.randint(-8, 8),
                                 'sprite': 'tree'
                             }
                             self.decorations.append(decoration)
                         elif rand < 0.20:  # 5% chance for rock
                             decoration = {
                                 'type': 'rock',
-                                'x': x * GRID_SIZE + random.randint(-8, 8),
-                                'y': y * GRID_SIZE + random.randint(-8, 8),
+                                'x': x * GRID_SIZE + self.rng.randint(-8, 8),
+                                'y': y * GRID_SIZE + self.rng.randint(-8, 8),
                                 'sprite': 'rock'
                             }
                             self.decorations.append(decoration)
@@ -267,17 +292,17 @@ class Level:
                     height_factor = y / self.grid_height  # 0.0 at top, 1.0 at bottom
                     
                     if height_factor < 0.3:  # Top 30% - cliffs and peaks
-                        if random.random() < 0.2:  # 20% chance for cliff face
+                        if self.rng.random() < 0.2:  # 20% chance for cliff face
                             self.background_tiles[(x, y)] = 'cliff_face'
                         else:
                             self.background_tiles[(x, y)] = 'stone_tile'
                     elif height_factor < 0.7:  # Middle 40% - mixed stone
-                        if random.random() < 0.15:  # 15% chance for mountain rock
+                        if self.rng.random() < 0.15:  # 15% chance for mountain rock
                             self.background_tiles[(x, y)] = 'mountain_rock'
                         else:
                             self.background_tiles[(x, y)] = 'stone_tile'
                     else:  # Bottom 30% - mostly stone with some darker areas
-                        if random.random() < 0.1:  # 10% chance for darker mountain rock
+                        if self.rng.random() < 0.1:  # 10% chance for darker mountain rock
                             self.background_tiles[(x, y)] = 'mountain_rock'
                         else:
                             self.background_tiles[(x, y)] = 'stone_tile'
@@ -300,7 +325,7 @@ class Level:
                     if clear_area:
                         # Random chance for decorations based on height
                         height_factor = y / self.grid_height
-                        rand = random.random()
+                        rand = self.rng.random()
                         
                         # Add boulders (more common in lower areas)
                         boulder_chance = 0.08 + (height_factor * 0.04)  # 8-12% chance based on height
@@ -308,8 +333,8 @@ class Level:
                         if rand < boulder_chance:
                             decoration = {
                                 'type': 'boulder',
-                                'x': x * GRID_SIZE + random.randint(-8, 8),
-                                'y': y * GRID_SIZE + random.randint(-8, 8),
+                                'x': x * GRID_SIZE + self.rng.randint(-8, 8),
+                                'y': y * GRID_SIZE + self.rng.randint(-8, 8),
                                 'sprite': 'boulder'
                             }
                             self.decorations.append(decoration)
@@ -318,8 +343,8 @@ class Level:
                         elif height_factor < 0.4 and rand < 0.03:  # 3% chance in upper 40%
                             decoration = {
                                 'type': 'mountain_peak',
-                                'x': x * GRID_SIZE + random.randint(-5, 5),
-                                'y': y * GRID_SIZE + random.randint(-5, 5),
+                                'x': x * GRID_SIZE + self.rng.randint(-5, 5),
+                                'y': y * GRID_SIZE + self.rng.randint(-5, 5),
                                 'sprite': 'mountain_peak'
                             }
                             self.decorations.append(decoration)
@@ -337,12 +362,12 @@ class Level:
                     edge_distance = min(x, y, self.grid_width - x - 1, self.grid_height - y - 1)
                     
                     if edge_distance <= 2:  # Near edges - canyon walls
-                        if random.random() < 0.7:  # 70% chance for canyon wall
+                        if self.rng.random() < 0.7:  # 70% chance for canyon wall
                             self.background_tiles[(x, y)] = 'canyon_wall'
                         else:
                             self.background_tiles[(x, y)] = 'sandstone_tile'
                     elif edge_distance <= 4:  # Middle ring - mixed terrain
-                        terrain_rand = random.random()
+                        terrain_rand = self.rng.random()
                         if terrain_rand < 0.4:  # 40% sand
                             self.background_tiles[(x, y)] = 'sand_tile'
                         elif terrain_rand < 0.7:  # 30% sandstone
@@ -350,7 +375,7 @@ class Level:
                         else:  # 30% canyon wall
                             self.background_tiles[(x, y)] = 'canyon_wall'
                     else:  # Center area - mostly sand with some variation
-                        if random.random() < 0.8:  # 80% sand
+                        if self.rng.random() < 0.8:  # 80% sand
                             self.background_tiles[(x, y)] = 'sand_tile'
                         else:  # 20% sandstone
                             self.background_tiles[(x, y)] = 'sandstone_tile'
@@ -373,31 +398,31 @@ class Level:
                     if clear_area:
                         # Random chance for decorations based on terrain type
                         terrain_type = self.background_tiles.get((x, y), 'sand_tile')
-                        rand = random.random()
+                        rand = self.rng.random()
                         
                         if terrain_type == 'sand_tile':
                             # Sand areas - cacti and small rocks
                             if rand < 0.08:  # 8% chance for cactus
                                 decoration = {
                                     'type': 'cactus',
-                                    'x': x * GRID_SIZE + random.randint(-8, 8),
-                                    'y': y * GRID_SIZE + random.randint(-8, 8),
+                                    'x': x * GRID_SIZE + self.rng.randint(-8, 8),
+                                    'y': y * GRID_SIZE + self.rng.randint(-8, 8),
                                     'sprite': 'cactus'
                                 }
                                 self.decorations.append(decoration)
                             elif rand < 0.15:  # 7% chance for desert rock
                                 decoration = {
                                     'type': 'desert_rock',
-                                    'x': x * GRID_SIZE + random.randint(-6, 6),
-                                    'y': y * GRID_SIZE + random.randint(-6, 6),
+                                    'x': x * GRID_SIZE + self.rng.randint(-6, 6),
+                                    'y': y * GRID_SIZE + self.rng.randint(-6, 6),
                                     'sprite': 'desert_rock'
                                 }
                                 self.decorations.append(decoration)
                             elif rand < 0.18:  # 3% chance for sand dune
                                 decoration = {
                                     'type': 'sand_dune',
-                                    'x': x * GRID_SIZE + random.randint(-10, 10),
-                                    'y': y * GRID_SIZE + random.randint(-5, 5),
+                                    'x': x * GRID_SIZE + self.rng.randint(-10, 10),
+                                    'y': y * GRID_SIZE + self.rng.randint(-5, 5),
                                     'sprite': 'sand_dune'
                                 }
                                 self.decorations.append(decoration)
@@ -407,8 +432,8 @@ class Level:
                             if rand < 0.12:  # 12% chance for desert rock
                                 decoration = {
                                     'type': 'desert_rock',
-                                    'x': x * GRID_SIZE + random.randint(-8, 8),
-                                    'y': y * GRID_SIZE + random.randint(-8, 8),
+                                    'x': x * GRID_SIZE + self.rng.randint(-8, 8),
+                                    'y': y * GRID_SIZE + self.rng.randint(-8, 8),
                                     'sprite': 'desert_rock'
                                 }
                                 self.decorations.append(decoration)
@@ -418,16 +443,16 @@ class Level:
                             if rand < 0.06:  # 6% chance for cactus
                                 decoration = {
                                     'type': 'cactus',
-                                    'x': x * GRID_SIZE + random.randint(-6, 6),
-                                    'y': y * GRID_SIZE + random.randint(-6, 6),
+                                    'x': x * GRID_SIZE + self.rng.randint(-6, 6),
+                                    'y': y * GRID_SIZE + self.rng.randint(-6, 6),
                                     'sprite': 'cactus'
                                 }
                                 self.decorations.append(decoration)
                             elif rand < 0.10:  # 4% chance for desert rock
                                 decoration = {
                                     'type': 'desert_rock',
-                                    'x': x * GRID_SIZE + random.randint(-6, 6),
-                                    'y': y * GRID_SIZE + random.randint(-6, 6),
+                                    'x': x * GRID_SIZE + self.rng.randint(-6, 6),
+                                    'y': y * GRID_SIZE + self.rng.randint(-6, 6),
                                     'sprite': 'desert_rock'
                                 }
                                 self.decorations.append(decoration)
@@ -450,7 +475,7 @@ class Level:
                     normalized_distance = distance_from_center / max_distance
                     
                     if normalized_distance < 0.3:  # Inner core - most corrupted
-                        terrain_rand = random.random()
+                        terrain_rand = self.rng.random()
                         if terrain_rand < 0.5:  # 50% obsidian
                             self.background_tiles[(x, y)] = 'obsidian_tile'
                         elif terrain_rand < 0.8:  # 30% corrupted stone
@@ -458,7 +483,7 @@ class Level:
                         else:  # 20% bone tile
                             self.background_tiles[(x, y)] = 'bone_tile'
                     elif normalized_distance < 0.6:  # Middle ring - mixed corruption
-                        terrain_rand = random.random()
+                        terrain_rand = self.rng.random()
                         if terrain_rand < 0.3:  # 30% obsidian
                             self.background_tiles[(x, y)] = 'obsidian_tile'
                         elif terrain_rand < 0.6:  # 30% corrupted stone
@@ -468,7 +493,7 @@ class Level:
                         else:  # 20% bone tile
                             self.background_tiles[(x, y)] = 'bone_tile'
                     else:  # Outer ring - dark but less corrupted
-                        terrain_rand = random.random()
+                        terrain_rand = self.rng.random()
                         if terrain_rand < 0.4:  # 40% dark earth
                             self.background_tiles[(x, y)] = 'dark_earth'
                         elif terrain_rand < 0.7:  # 30% corrupted stone
@@ -499,23 +524,23 @@ class Level:
                         max_distance = ((self.grid_width // 2) ** 2 + (self.grid_height // 2) ** 2) ** 0.5
                         normalized_distance = distance_from_center / max_distance
                         
-                        rand = random.random()
+                        rand = self.rng.random()
                         
                         if terrain_type == 'obsidian_tile':
                             # Obsidian areas - dark crystals and skulls
                             if rand < 0.12:  # 12% chance for dark crystal
                                 decoration = {
                                     'type': 'dark_crystal',
-                                    'x': x * GRID_SIZE + random.randint(-6, 6),
-                                    'y': y * GRID_SIZE + random.randint(-6, 6),
+                                    'x': x * GRID_SIZE + self.rng.randint(-6, 6),
+                                    'y': y * GRID_SIZE + self.rng.randint(-6, 6),
                                     'sprite': 'dark_crystal'
                                 }
                                 self.decorations.append(decoration)
                             elif rand < 0.20:  # 8% chance for skull
                                 decoration = {
                                     'type': 'skull',
-                                    'x': x * GRID_SIZE + random.randint(-8, 8),
-                                    'y': y * GRID_SIZE + random.randint(-8, 8),
+                                    'x': x * GRID_SIZE + self.rng.randint(-8, 8),
+                                    'y': y * GRID_SIZE + self.rng.randint(-8, 8),
                                     'sprite': 'skull'
                                 }
                                 self.decorations.append(decoration)
@@ -525,16 +550,16 @@ class Level:
                             if rand < 0.10:  # 10% chance for twisted tree
                                 decoration = {
                                     'type': 'twisted_tree',
-                                    'x': x * GRID_SIZE + random.randint(-6, 6),
-                                    'y': y * GRID_SIZE + random.randint(-6, 6),
+                                    'x': x * GRID_SIZE + self.rng.randint(-6, 6),
+                                    'y': y * GRID_SIZE + self.rng.randint(-6, 6),
                                     'sprite': 'twisted_tree'
                                 }
                                 self.decorations.append(decoration)
                             elif rand < 0.16:  # 6% chance for dark crystal
                                 decoration = {
                                     'type': 'dark_crystal',
-                                    'x': x * GRID_SIZE + random.randint(-6, 6),
-                                    'y': y * GRID_SIZE + random.randint(-6, 6),
+                                    'x': x * GRID_SIZE + self.rng.randint(-6, 6),
+                                    'y': y * GRID_SIZE + self.rng.randint(-6, 6),
                                     'sprite': 'dark_crystal'
                                 }
                                 self.decorations.append(decoration)
@@ -544,16 +569,16 @@ class Level:
                             if rand < 0.15:  # 15% chance for skull
                                 decoration = {
                                     'type': 'skull',
-                                    'x': x * GRID_SIZE + random.randint(-8, 8),
-                                    'y': y * GRID_SIZE + random.randint(-8, 8),
+                                    'x': x * GRID_SIZE + self.rng.randint(-8, 8),
+                                    'y': y * GRID_SIZE + self.rng.randint(-8, 8),
                                     'sprite': 'skull'
                                 }
                                 self.decorations.append(decoration)
                             elif rand < 0.22:  # 7% chance for bone pile
                                 decoration = {
                                     'type': 'bone_pile',
-                                    'x': x * GRID_SIZE + random.randint(-8, 8),
-                                    'y': y * GRID_SIZE + random.randint(-8, 8),
+                                    'x': x * GRID_SIZE + self.rng.randint(-8, 8),
+                                    'y': y * GRID_SIZE + self.rng.randint(-8, 8),
                                     'sprite': 'bone_pile'
                                 }
                                 self.decorations.append(decoration)
@@ -563,16 +588,16 @@ class Level:
                             if rand < 0.08:  # 8% chance for tombstone
                                 decoration = {
                                     'type': 'tombstone',
-                                    'x': x * GRID_SIZE + random.randint(-6, 6),
-                                    'y': y * GRID_SIZE + random.randint(-6, 6),
+                                    'x': x * GRID_SIZE + self.rng.randint(-6, 6),
+                                    'y': y * GRID_SIZE + self.rng.randint(-6, 6),
                                     'sprite': 'tombstone'
                                 }
                                 self.decorations.append(decoration)
                             elif rand < 0.14:  # 6% chance for twisted tree
                                 decoration = {
                                     'type': 'twisted_tree',
-                                    'x': x * GRID_SIZE + random.randint(-6, 6),
-                                    'y': y * GRID_SIZE + random.randint(-6, 6),
+                                    'x': x * GRID_SIZE + self.rng.randint(-6, 6),
+                                    'y': y * GRID_SIZE + self.rng.randint(-6, 6),
                                     'sprite': 'twisted_tree'
                                 }
                                 self.decorations.append(decoration)
@@ -581,8 +606,8 @@ class Level:
                         if normalized_distance < 0.4 and rand < 0.03:  # 3% chance for extra skulls near center
                             decoration = {
                                 'type': 'skull',
-                                'x': x * GRID_SIZE + random.randint(-10, 10),
-                                'y': y * GRID_SIZE + random.randint(-10, 10),
+                                'x': x * GRID_SIZE + self.rng.randint(-10, 10),
+                                'y': y * GRID_SIZE + self.rng.randint(-10, 10),
                                 'sprite': 'skull'
                             }
                             self.decorations.append(decoration)
@@ -607,7 +632,7 @@ class Level:
                     edge_distance = min(x, y, self.grid_width - x - 1, self.grid_height - y - 1)
                     
                     # Terrain distribution based on position
-                    terrain_rand = random.random()
+                    terrain_rand = self.rng.random()
                     
                     if edge_distance <= 1:  # Outer edge - more ice formations
                         if terrain_rand < 0.6:  # 60% ice tile
@@ -643,31 +668,31 @@ class Level:
                     if clear_area:
                         # Random chance for decorations based on terrain type
                         terrain_type = self.background_tiles.get((x, y), 'snow_tile')
-                        rand = random.random()
+                        rand = self.rng.random()
                         
                         if terrain_type == 'ice_tile':
                             # Ice areas - ice crystals and formations
                             if rand < 0.12:  # 12% chance for ice crystal
                                 decoration = {
                                     'type': 'ice_crystal',
-                                    'x': x * GRID_SIZE + random.randint(-8, 8),
-                                    'y': y * GRID_SIZE + random.randint(-8, 8),
+                                    'x': x * GRID_SIZE + self.rng.randint(-8, 8),
+                                    'y': y * GRID_SIZE + self.rng.randint(-8, 8),
                                     'sprite': 'ice_crystal'
                                 }
                                 self.decorations.append(decoration)
                             elif rand < 0.20:  # 8% chance for ice formation
                                 decoration = {
                                     'type': 'ice_formation',
-                                    'x': x * GRID_SIZE + random.randint(-6, 6),
-                                    'y': y * GRID_SIZE + random.randint(-6, 6),
+                                    'x': x * GRID_SIZE + self.rng.randint(-6, 6),
+                                    'y': y * GRID_SIZE + self.rng.randint(-6, 6),
                                     'sprite': 'ice_formation'
                                 }
                                 self.decorations.append(decoration)
                             elif rand < 0.25:  # 5% chance for icicle
                                 decoration = {
                                     'type': 'icicle',
-                                    'x': x * GRID_SIZE + random.randint(-4, 4),
-                                    'y': y * GRID_SIZE + random.randint(-4, 4),
+                                    'x': x * GRID_SIZE + self.rng.randint(-4, 4),
+                                    'y': y * GRID_SIZE + self.rng.randint(-4, 4),
                                     'sprite': 'icicle'
                                 }
                                 self.decorations.append(decoration)
@@ -677,24 +702,24 @@ class Level:
                             if rand < 0.10:  # 10% chance for frozen tree
                                 decoration = {
                                     'type': 'frozen_tree',
-                                    'x': x * GRID_SIZE + random.randint(-8, 8),
-                                    'y': y * GRID_SIZE + random.randint(-8, 8),
+                                    'x': x * GRID_SIZE + self.rng.randint(-8, 8),
+                                    'y': y * GRID_SIZE + self.rng.randint(-8, 8),
                                     'sprite': 'frozen_tree'
                                 }
                                 self.decorations.append(decoration)
                             elif rand < 0.18:  # 8% chance for snow drift
                                 decoration = {
                                     'type': 'snow_drift',
-                                    'x': x * GRID_SIZE + random.randint(-10, 10),
-                                    'y': y * GRID_SIZE + random.randint(-5, 5),
+                                    'x': x * GRID_SIZE + self.rng.randint(-10, 10),
+                                    'y': y * GRID_SIZE + self.rng.randint(-5, 5),
                                     'sprite': 'snow_drift'
                                 }
                                 self.decorations.append(decoration)
                             elif rand < 0.22:  # 4% chance for ice crystal (occasional)
                                 decoration = {
                                     'type': 'ice_crystal',
-                                    'x': x * GRID_SIZE + random.randint(-6, 6),
-                                    'y': y * GRID_SIZE + random.randint(-6, 6),
+                                    'x': x * GRID_SIZE + self.rng.randint(-6, 6),
+                                    'y': y * GRID_SIZE + self.rng.randint(-6, 6),
                                     'sprite': 'ice_crystal'
                                 }
                                 self.decorations.append(decoration)
@@ -711,27 +736,45 @@ class Level:
 
     def render(self, screen: pygame.Surface) -> None:
         """Render the level"""
-        # Draw background first
-        self._draw_background(screen)
-        
-        # Draw path
-        self._draw_path(screen)
-        
-        # Draw decorations
-        self._draw_decorations(screen)
+        # Tiles, path and decorations never change, so they are drawn once into
+        # a world-sized layer and each frame is a single blit at the camera offset
+        if self.static_layer is None:
+            self._bake_static_layer()
+        view = pygame.Rect(int(self.camera.x), int(self.camera.y), GAME_AREA_WIDTH, SCREEN_HEIGHT)
+        screen.blit(self.static_layer, (0, 0), view)
         
         # Draw game area boundary
         pygame.draw.line(screen, WHITE, (GAME_AREA_WIDTH, 0), (GAME_AREA_WIDTH, SCREEN_HEIGHT), 2)
     
-    def _draw_background(self, screen: pygame.Surface) -> None:
+    def _bake_static_layer(self) -> None:
+        """Draw background, path and decorations in world coordinates onto the static layer"""
+        world_camera = Camera()
+        world_camera.view_width = world_camera.world_width
+        world_camera.view_height = world_camera.world_height
+        
+        layer = pygame.Surface((world_camera.world_width, world_camera.world_height))
+        if pygame.display.get_surface() is not None:
+            layer = layer.convert()
+        
+        # Draw background first, then path, then decorations
+        self._draw_background(layer, world_camera)
+        self._draw_path(layer, world_camera)
+        self._draw_decorations(layer, world_camera)
+        self.static_layer = layer
+    
+    def invalidate_static_layer(self) -> None:
+        """Drop the baked layer so it is redrawn on the next render (e.g. after sprites reload)"""
+        self.static_layer = None
+    
+    def _draw_background(self, screen: pygame.Surface, camera: Camera) -> None:
         """Draw background tiles"""
         for (grid_x, grid_y), tile_type in self.background_tiles.items():
             world_x = grid_x * GRID_SIZE
             world_y = grid_y * GRID_SIZE
-            screen_x, screen_y = self.world_to_screen(world_x, world_y)
+            screen_x, screen_y = camera.world_to_screen(world_x, world_y)
             
             # Only draw tiles that are visible on screen
-            if -GRID_SIZE <= screen_x <= GAME_AREA_WIDTH and -GRID_SIZE <= screen_y <= SCREEN_HEIGHT:
+            if -GRID_SIZE <= screen_x <= camera.view_width and -GRID_SIZE <= screen_y <= camera.view_height:
                 sprite = sprite_manager.get_background_sprite(tile_type)
                 if sprite:
                     screen.blit(sprite, (screen_x, screen_y))
@@ -777,15 +820,15 @@ class Level:
                         color = (34, 139, 34)
                     pygame.draw.rect(screen, color, (screen_x, screen_y, GRID_SIZE, GRID_SIZE))
     
-    def _draw_decorations(self, screen: pygame.Surface) -> None:
+    def _draw_decorations(self, screen: pygame.Surface, camera: Camera) -> None:
         """Draw decorative elements like trees and rocks"""
         for decoration in self.decorations:
             world_x = decoration['x']
             world_y = decoration['y']
-            screen_x, screen_y = self.world_to_screen(world_x, world_y)
+            screen_x, screen_y = camera.world_to_screen(world_x, world_y)
             
             # Only draw decorations that are visible on screen
-            if -50 <= screen_x <= GAME_AREA_WIDTH + 50 and -50 <= screen_y <= SCREEN_HEIGHT + 50:
+            if -50 <= screen_x <= camera.view_width + 50 and -50 <= screen_y <= camera.view_height + 50:
                 sprite = sprite_manager.get_background_sprite(decoration['sprite'])
                 if sprite:
                     # Center the sprite
@@ -1071,16 +1114,16 @@ class Level:
                         pygame.draw.line(screen, (220, 230, 255), (int(screen_x - 2), int(screen_y - 8)), (int(screen_x - 1), int(screen_y + 8)), 1)
                         pygame.draw.line(screen, (220, 230, 255), (int(screen_x + 2), int(screen_y - 8)), (int(screen_x + 1), int(screen_y + 8)), 1)
 
-    def _draw_path(self, screen: pygame.Surface) -> None:
+    def _draw_path(self, screen: pygame.Surface, camera: Camera) -> None:
         """Draw the enemy path using camera coordinates"""
         # Draw path as connected lines with enhanced visuals
         path_screen_coords = []
         for grid_x, grid_y in self.path_points:
             world_x, world_y = self.get_world_position(grid_x, grid_y)
-            screen_x, screen_y = self.world_to_screen(world_x, world_y)
+            screen_x, screen_y = camera.world_to_screen(world_x, world_y)
             
             # Only add points that are visible on screen
-            if -20 <= screen_x <= GAME_AREA_WIDTH + 20 and -20 <= screen_y <= SCREEN_HEIGHT + 20:
+            if -20 <= screen_x <= camera.view_width + 20 and -20 <= screen_y <= camera.view_height + 20:
                 path_screen_coords.append((screen_x, screen_y))
         
         if len(path_screen_coords) > 1:
@@ -1132,8 +1175,8 @@ class Level:
         # Draw start and end markers with enhanced visuals
         if path_screen_coords:
             start_world = self.get_world_position(*self.path_points[0])
-            start_screen = self.world_to_screen(*start_world)
-            if 0 <= start_screen[0] <= GAME_AREA_WIDTH and 0 <= start_screen[1] <= SCREEN_HEIGHT:
+            start_screen = camera.world_to_screen(*start_world)
+            if 0 <= start_screen[0] <= camera.view_width and 0 <= start_screen[1] <= camera.view_height:
                 # Start marker (green with border)
                 pygame.draw.circle(screen, (0, 100, 0), (int(start_screen[0]), int(start_screen[1])), 18)
                 pygame.draw.circle(screen, GREEN, (int(start_screen[0]), int(start_screen[1])), 15)
@@ -1147,8 +1190,8 @@ class Level:
                 ])
             
             end_world = self.get_world_position(*self.path_points[-1])
-            end_screen = self.world_to_screen(*end_world)
-            if 0 <= end_screen[0] <= GAME_AREA_WIDTH and 0 <= end_screen[1] <= SCREEN_HEIGHT:
+            end_screen = camera.world_to_screen(*end_world)
+            if 0 <= end_screen[0] <= camera.view_width and 0 <= end_screen[1] <= camera.view_height:
                 # End marker (red with border)
                 pygame.draw.circle(screen, (150, 0, 0), (int(end_screen[0]), int(end_screen[1])), 18)
                 pygame.draw.circle(screen, RED, (int(end_screen[0]), int(end_screen[1])), 15)
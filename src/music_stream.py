@@ -0,0 +1,244 @@
+"""
+Streaming music synthesis - renders music recipes chunk by chunk
+
+render_sound() (sound_bank.py) renders a whole recipe before the first
+sample can play, which for minutes of music means millions of samples in
+memory. MusicSynth renders any window of a recipe's timeline instead:
+
+- each sequence note is synthesized once and mixed into the windows it overlaps
+- tones are evaluated with the phase they have at the window start
+- noise carries its filter state from one window to the next
+- fades are evaluated at the window's position in the track
+
+stream_music() turns that into a generator of fixed-size int16 chunks that
+loops the track seamlessly, so memory stays constant however long the music
+plays. Playback is in audio.py (MusicStreamer).
+
+The peak of a whole track isn't known until it has been rendered, so chunks
+aren't normalized: they are scaled so the loudest possible mix (every layer
+at full amplitude) reaches the recipe's volume.
+
+Supported layers are tones, noise and sequences without a layer envelope,
+which covers every recipe in MUSIC_RECIPES.
+
+Command line (streams each track, reports synthesis speed and checks the
+loop seam):
+    python -m src.music_stream --seconds 60
+"""
+
+import argparse
+import math
+import time
+import numpy as np  # type: ignore
+from typing import Any, Dict, Iterator, List, Optional
+from .constants import MUSIC_CHUNK_SAMPLES
+from .audio_generator import AudioGenerator
+from .sound_bank import render_note
+from .sound_recipes import MUSIC_RECIPES
+
+# Layer types a track can be streamed with
+STREAMABLE_LAYERS = ('tone', 'noise', 'sequence')
+
+class MusicSynth:
+    """Renders windows of a music recipe's timeline; windows must be rendered in order for seamless noise"""
+
+    def __init__(self, recipe: Dict[str, Any]):
+        self.generator = AudioGenerator(seed=recipe.get('seed', 0))
+        self.sample_rate = self.generator.sample_rate
+        duration = recipe['duration']
+        self.length = int(self.sample_rate * duration)
+
+        fade_in, fade_out = recipe.get('fade', (0.0, 0.0))
+        self.fade_in = int(fade_in * self.sample_rate)
+        self.fade_out = int(fade_out * self.sample_rate)
+
+        # Per layer: its span of the track plus whatever it needs between windows
+        self.layers: List[Dict[str, Any]] = []
+        peak = 0.0
+        for layer in recipe['layers']:
+            if layer['type'] not in STREAMABLE_LAYERS or 'envelope' in layer:
+                raise ValueError(f"Layer can't be streamed: {layer['type']}"
+                                 f"{' with an envelope' if 'envelope' in layer else ''}")
+            layer_start = layer.get('start', 0.0)
+            layer_duration = layer.get('duration', duration - layer_start)
+            start = int(round(layer_start * self.sample_rate))
+            stream = {'layer': layer, 'start': start,
+                      'end': min(self.length, start + int(self.sample_rate * layer_duration))}
+
+            amplitude = layer.get('amplitude', 0.5)
+            if layer['type'] == 'sequence':
+                step = layer['step']
+                note_length = layer.get('note_length', step)
+                stream['notes'] = {}
+                stream['step_count'] = int(round(layer_duration / step)) if layer['notes'] else 0
+                stream['note_samples'] = int(self.sample_rate * note_length)
+
+                # Notes longer than a step overlap the following ones
+                peak += amplitude * math.ceil(note_length / step - 1e-9)
+            else:
+                stream['history'] = np.zeros(self.generator.NOISE_FILTER_SIZE - 1)
+                stream['level'] = 0.0
+                peak += amplitude
+            self.layers.append(stream)
+
+        self.gain = recipe.get('volume', 0.9) / peak if peak > 0 else 0.0
+
+    def render(self, start: int, count: int) -> np.ndarray:
+        """Render track samples [start, start + count), faded but before the gain"""
+        audio = np.zeros(count)
+        end = start + count
+        for stream in self.layers:
+            low, high = max(start, stream['start']), min(end, stream['end'])
+            if low < high:
+                audio[low - start:high - start] += self._render_layer(stream, low - stream['start'], high - low)
+
+        # Fade in from silence over the first samples of the track and back to
+        # silence over the last (as apply_fade does), so loops wrap without a click
+        fade_end = min(self.fade_in, self.length, end)
+        if fade_end > start:
+            audio[:fade_end - start] *= np.arange(start, fade_end) / self.fade_in
+        fade_start = max(self.length - min(self.fade_out, self.length), start)
+        if fade_start < end:
+            audio[fade_start - start:] *= (self.length - 1 - np.arange(fade_start, end)) / self.fade_out
+        return audio
+
+    def _render_layer(self, stream: Dict[str, Any], start: int, count: int) -> np.ndarray:
+        """Render layer samples [start, start + count), counted from the layer's start"""
+        layer = stream['layer']
+        layer_type = layer['type']
+        amplitude = layer.get('amplitude', 0.5)
+        generator = self.generator
+
+        if layer_type == 'tone':
+            # Start the waveform at the phase it has at the window start; the
+            # half-sample duration makes generate_waveform return exactly count samples
+            frequency = layer['frequency']
+            cycles = (frequency * start / self.sample_rate) % 1.0
+            return generator.generate_waveform(layer.get('wave', AudioGenerator.SINE), frequency,
+                                               (count + 0.5) / self.sample_rate, amplitude,
+                                               layer.get('phase', 0.0) + 2 * math.pi * cycles)
+
+        if layer_type == 'noise':
+            return self._render_noise(stream, layer.get('noise', AudioGenerator.WHITE_NOISE), count, amplitude)
+
+        # Sequence: mix in every note sounding in the window, cut off at the end of the layer
+        audio = np.zeros(count)
+        notes = layer['notes']
+        step = layer['step']
+        step_samples = step * self.sample_rate
+        end = start + count
+        first = max(0, int((start - stream['note_samples']) // step_samples) - 1)
+        last = min(stream['step_count'], int(end // step_samples) + 2)
+        for index in range(first, last):
+            note = notes[index % len(notes)]
+            if note is None:
+                continue
+            key = tuple(note) if isinstance(note, list) else note
+            samples = stream['notes'].get(key)
+            if samples is None:
+                samples = stream['notes'][key] = render_note(generator, layer, note)
+            note_start = int(round(index * step * self.sample_rate))
+            low, high = max(start, note_start), min(end, note_start + len(samples))
+            if low < high:
+                audio[low - start:high - start] += samples[low - note_start:high - note_start]
+        return audio
+
+    def _render_noise(self, stream: Dict[str, Any], noise_type: str, count: int, amplitude: float) -> np.ndarray:
+        """Continue a noise layer by count samples"""
+        generator = self.generator
+        if noise_type == AudioGenerator.WHITE_NOISE:
+            return amplitude * generator.rng.uniform(-1.0, 1.0, count)
+
+        if noise_type == AudioGenerator.BROWN_NOISE:
+            # Same leaky integrator as generate_noise, resumed from the last sample
+            brown = generator._leaky_integrate(generator.rng.uniform(-0.1, 0.1, count),
+                                               generator.BROWN_NOISE_LEAK, stream['level'])
+            stream['level'] = brown[-1]
+            return amplitude * np.clip(brown, -1.0, 1.0)
+
+        if noise_type == AudioGenerator.FILTERED_NOISE:
+            # Moving average over the previous samples, continued from the last window's
+            # (trailing where generate_noise is centred, a delay of two samples)
+            white = np.concatenate((stream['history'], amplitude * generator.rng.uniform(-1.0, 1.0, count)))
+            stream['history'] = white[len(white) - len(stream['history']):]
+            return np.convolve(white, np.ones(generator.NOISE_FILTER_SIZE), 'valid') / generator.NOISE_FILTER_SIZE
+
+        raise ValueError(f"Unknown noise type: {noise_type}")
+
+def stream_music(recipe: Dict[str, Any], chunk_samples: int = MUSIC_CHUNK_SAMPLES,
+                 loop: bool = True) -> Iterator[np.ndarray]:
+    """
+    Synthesize a music recipe as int16 chunks of chunk_samples samples
+
+    Nothing is rendered until the first chunk is requested. With loop the
+    track repeats forever; otherwise the last chunk is cut short at the end.
+    """
+    synth = MusicSynth(recipe)
+    if synth.length == 0:
+        return
+
+    position = 0
+    while True:
+        chunk = np.empty(chunk_samples)
+        filled = 0
+        while filled < chunk_samples:
+            count = min(chunk_samples - filled, synth.length - position)
+            chunk[filled:filled + count] = synth.render(position, count)
+            filled += count
+            position += count
+            if position == synth.length:
+                if not loop:
+                    yield synth.generator.to_pcm16(chunk[:filled] * synth.gain, normalize=False)
+                    return
+                position = 0
+        yield synth.generator.to_pcm16(chunk * synth.gain, normalize=False)
+
+def loop_seam(recipe: Dict[str, Any], chunk_samples: int = MUSIC_CHUNK_SAMPLES) -> Dict[str, float]:
+    """
+    Levels (full scale = 1) either side of the point where a streamed track loops
+
+    Returns the last sample before the wrap and the first one after it, which
+    should both be silent, and the RMS of the chunk-long stretches around them.
+    """
+    synth = MusicSynth(recipe)
+    count = min(chunk_samples, synth.length)
+    before = synth.render(synth.length - count, count) * synth.gain
+    after = synth.render(0, count) * synth.gain
+    return {
+        'last_sample': float(before[-1]) if count else 0.0,
+        'first_sample': float(after[0]) if count else 0.0,
+        'last_chunk_rms': float(np.sqrt(np.mean(before ** 2))) if count else 0.0,
+        'first_chunk_rms': float(np.sqrt(np.mean(after ** 2))) if count else 0.0,
+    }
+
+def main(argv: Optional[List[str]] = None) -> None:
+    """Command line entry point"""
+    parser = argparse.ArgumentParser(description="Measure streaming music synthesis")
+    parser.add_argument('tracks', nargs='*', help="music tracks to stream (default: all)")
+    parser.add_argument('--seconds', type=float, default=60.0, help="seconds of music per track")
+    parser.add_argument('--chunk', type=int, default=MUSIC_CHUNK_SAMPLES, help="samples per chunk")
+    args = parser.parse_args(argv)
+
+    unknown = [name for name in args.tracks if name not in MUSIC_RECIPES]
+    if unknown:
+        parser.error(f"unknown tracks: {', '.join(unknown)}")
+
+    chunk_seconds = args.chunk / AudioGenerator.SAMPLE_RATE
+    chunk_count = max(1, int(args.seconds / chunk_seconds))
+    for name in args.tracks or MUSIC_RECIPES:
+        times = []
+        chunks = stream_music(MUSIC_RECIPES[name], args.chunk)
+        for _ in range(chunk_count):
+            start_time = time.perf_counter()
+            next(chunks)
+            times.append(time.perf_counter() - start_time)
+        seam = loop_seam(MUSIC_RECIPES[name], args.chunk)
+        click = max(abs(seam['last_sample']), abs(seam['first_sample'])) > 0.5 / AudioGenerator.MAX_AMPLITUDE
+        print(f"{name:<20}{chunk_count * chunk_seconds / sum(times):>8.0f}x realtime   "
+              f"slowest chunk {max(times) * 1000:5.1f}ms of {chunk_seconds * 1000:.0f}ms   "
+              f"loop seam {seam['last_sample']:+.4f} -> {seam['first_sample']:+.4f} "
+              f"(chunk rms {seam['last_chunk_rms']:.3f} / {seam['first_chunk_rms']:.3f})"
+              f"{'  CLICKS' if click else ''}")
+
+if __name__ == "__main__":
+    main()
@@ -1,12 +1,363 @@
 """
-Projectile system - Currently integrated into tower.py
-This file is a placeholder for future refactoring if needed.
+Projectile system - one pooled store for every projectile in flight
 
-The projectile logic is currently handled within the Tower class
-in tower.py for simplicity during Phase 1 development.
-
-Future improvements could move projectile-specific logic here
-for better separation of concerns.
+Towers emit FireRequests; the ProjectileSystem owns all projectile state in
+preallocated NumPy arrays, reuses freed slots through a free list and moves
+every projectile in a single batched step.
 """
 
-# Placeholder - projectiles are currently handled in tower.py 
\ No newline at end of file
+import pygame  # type: ignore
+import numpy as np  # type: ignore
+from typing import Any, List, NamedTuple, Optional, Set
+from .constants import *
+from .sprite_manager import sprite_manager
+from .render_queue import RenderQueue
+
+# Projectile sprite kinds, indexed by the kind array
+PROJECTILE_KINDS = ('bullet', 'piercing', 'homing', 'freeze')
+KIND_BULLET, KIND_PIERCING, KIND_HOMING, KIND_FREEZE = range(len(PROJECTILE_KINDS))
+
+# Fallback colours when a projectile sprite is missing
+PROJECTILE_COLORS = {
+    KIND_BULLET: WHITE,
+    KIND_PIERCING: (255, 0, 255),  # Magenta for laser
+    KIND_HOMING: YELLOW,
+    KIND_FREEZE: WHITE,
+}
+
+class FireRequest(NamedTuple):
+    """A shot emitted by a tower, turned into a projectile by the ProjectileSystem"""
+    start_x: float
+    start_y: float
+    target_x: float
+    target_y: float
+    damage: int
+    speed: float
+    splash_radius: float = 0
+    homing: bool = False
+    piercing: bool = False
+    freeze_duration: float = 0.0
+    freeze_slow_multiplier: float = 1.0
+    target_enemy: Any = None  # For homing missiles
+    tower_type: str = ''
+
+def segment_circle_hit_times(start_x: np.ndarray, start_y: np.ndarray, move_x: np.ndarray, move_y: np.ndarray,
+                             center_x: np.ndarray, center_y: np.ndarray, radius: np.ndarray) -> np.ndarray:
+    """
+    Earliest contact along each segment start + t * move (t in [0, 1]) with a circle
+
+    Returns t per pair: 0 if the segment starts inside the circle, inf if it
+    never touches it within this step.
+    """
+    offset_x = start_x - center_x
+    offset_y = start_y - center_y
+    a = move_x * move_x + move_y * move_y
+    b = offset_x * move_x + offset_y * move_y
+    c = offset_x * offset_x + offset_y * offset_y - radius * radius
+
+    # Solve a t^2 + 2 b t + c = 0 for the entry point
+    discriminant = b * b - a * c
+    with np.errstate(divide='ignore', invalid='ignore'):
+        entry = (-b - np.sqrt(np.maximum(discriminant, 0.0))) / a
+    crossing = (c > 0) & (a > 0) & (discriminant >= 0) & (entry >= 0) & (entry <= 1)
+
+    return np.where(c <= 0, 0.0, np.where(crossing, entry, np.inf))
+
+class ProjectileSystem:
+    """Pooled, array-backed storage and simulation for all projectiles"""
+
+    def __init__(self, capacity: int = 256):
+        self.capacity = 0
+        self.x = np.zeros(0)
+        self.y = np.zeros(0)
+        self.prev_x = np.zeros(0)  # Positions before the last step, for render interpolation
+        self.prev_y = np.zeros(0)
+        self.velocity_x = np.zeros(0)
+        self.velocity_y = np.zeros(0)
+        self.speed = np.zeros(0)
+        self.damage = np.zeros(0, dtype=np.int64)
+        self.splash_radius = np.zeros(0)
+        self.freeze_duration = np.zeros(0)
+        self.freeze_slow_multiplier = np.zeros(0)
+        self.active = np.zeros(0, dtype=bool)
+        self.homing = np.zeros(0, dtype=bool)
+        self.piercing = np.zeros(0, dtype=bool)
+        self.kind = np.zeros(0, dtype=np.int8)
+
+        # Object references cannot live in NumPy arrays
+        self.target_enemies: List[Any] = []
+        self.hit_enemies: List[Optional[Set[Any]]] = []
+
+        # Stack of free slots; popping from the end hands out the lowest slots first
+        self.free_slots: List[int] = []
+        self._grow(capacity)
+
+        # Kind of every projectile that burst with splash damage during the last update
+        self.splash_impacts: List[int] = []
+
+        # (sprite, half width, half height) per projectile kind, looked up on first render
+        self.render_sprites: Optional[List[Any]] = None
+        self.render_queue = RenderQueue()
+
+    def _grow(self, new_capacity: int) -> None:
+        """Enlarge every pool array and add the new slots to the free list"""
+        old_capacity = self.capacity
+        for name in ('x', 'y', 'prev_x', 'prev_y', 'velocity_x', 'velocity_y', 'speed', 'damage', 'splash_radius',
+                     'freeze_duration', 'freeze_slow_multiplier', 'active', 'homing', 'piercing', 'kind'):
+            old = getattr(self, name)
+            new = np.zeros(new_capacity, dtype=old.dtype)
+            new[:old_capacity] = old
+            setattr(self, name, new)
+        self.target_enemies.extend([None] * (new_capacity - old_capacity))
+        self.hit_enemies.extend([None] * (new_capacity - old_capacity))
+        self.free_slots.extend(range(new_capacity - 1, old_capacity - 1, -1))
+        self.capacity = new_capacity
+
+    def fire(self, request: FireRequest) -> int:
+        """Spawn a projectile from a fire request and return its slot"""
+        if not self.free_slots:
+            self._grow(self.capacity * 2)
+        slot = self.free_slots.pop()
+
+        self.x[slot] = request.start_x
+        self.y[slot] = request.start_y
+        self.prev_x[slot] = request.start_x
+        self.prev_y[slot] = request.start_y
+        self.speed[slot] = request.speed
+        self.damage[slot] = request.damage
+        self.splash_radius[slot] = request.splash_radius
+        self.freeze_duration[slot] = request.freeze_duration
+        self.freeze_slow_multiplier[slot] = request.freeze_slow_multiplier
+        self.homing[slot] = request.homing
+        self.piercing[slot] = request.piercing
+        self.active[slot] = True
+
+        if request.piercing:
+            self.kind[slot] = KIND_PIERCING
+        elif request.homing:
+            self.kind[slot] = KIND_HOMING
+        elif request.freeze_duration > 0:
+            self.kind[slot] = KIND_FREEZE
+        else:
+            self.kind[slot] = KIND_BULLET
+
+        # Calculate direction
+        dx = request.target_x - request.start_x
+        dy = request.target_y - request.start_y
+        distance = (dx * dx + dy * dy) ** 0.5
+        if distance > 0:
+            self.velocity_x[slot] = (dx / distance) * request.speed
+            self.velocity_y[slot] = (dy / distance) * request.speed
+        else:
+            self.velocity_x[slot] = 0.0
+            self.velocity_y[slot] = 0.0
+
+        self.target_enemies[slot] = request.target_enemy if request.homing else None
+        self.hit_enemies[slot] = set() if request.piercing else None
+        return slot
+
+    def _release(self, slot: int) -> None:
+        """Return a slot to the free list"""
+        self.active[slot] = False
+        self.target_enemies[slot] = None
+        self.hit_enemies[slot] = None
+        self.free_slots.append(slot)
+
+    def count(self) -> int:
+        """Get the number of projectiles in flight"""
+        return self.capacity - len(self.free_slots)
+
+    def clear(self) -> None:
+        """Remove all projectiles"""
+        for slot in np.flatnonzero(self.active):
+            self._release(int(slot))
+        self.splash_impacts.clear()
+
+    def update(self, dt: float, enemy_manager) -> None:
+        """Move every projectile and resolve hits"""
+        self.splash_impacts.clear()
+        slots = np.flatnonzero(self.active)
+        if len(slots) == 0:
+            return
+
+        # Steer homing projectiles toward their (still living) targets
+        homing_slots = slots[self.homing[slots]]
+        if len(homing_slots):
+            steer = []
+            target_x = []
+            target_y = []
+            for slot in homing_slots:
+                target = self.target_enemies[slot]
+                if target is not None and target.is_alive:
+                    steer.append(slot)
+                    tx, ty = target.get_position()
+                    target_x.append(tx)
+                    target_y.append(ty)
+            if steer:
+                steer = np.array(steer)
+                dx = np.array(target_x) - self.x[steer]
+                dy = np.array(target_y) - self.y[steer]
+                distance = np.hypot(dx, dy)
+                moving = distance > 0
+                steer = steer[moving]
+                scale = self.speed[steer] / distance[moving]
+                self.velocity_x[steer] = dx[moving] * scale
+                self.velocity_y[steer] = dy[moving] * scale
+
+        # Move every projectile in one step
+        self.prev_x[slots] = self.x[slots]
+        self.prev_y[slots] = self.y[slots]
+        self.x[slots] += self.velocity_x[slots] * dt
+        self.y[slots] += self.velocity_y[slots] * dt
+
+        # Resolve hits along the whole path travelled this step
+        self._resolve_hits(slots, enemy_manager)
+
+        # Remove projectiles that leave the screen
+        slots = slots[self.active[slots]]
+        off_screen = ((self.x[slots] < -50) | (self.x[slots] > SCREEN_WIDTH + 50) |
+                      (self.y[slots] < -50) | (self.y[slots] > SCREEN_HEIGHT + 50))
+        for slot in slots[off_screen].tolist():
+            self._release(slot)
+
+    def _resolve_hits(self, slots: np.ndarray, enemy_manager) -> None:
+        """
+        Swept collision: test each projectile's motion segment for this step
+        against every nearby enemy circle, so fast projectiles and long steps
+        cannot skip over small enemies
+        """
+        start_x = self.prev_x[slots]
+        start_y = self.prev_y[slots]
+        move_x = self.x[slots] - start_x
+        move_y = self.y[slots] - start_y
+
+        # Broadphase: enemies in grid cells around each segment, far enough out
+        # for the largest enemy (read from the table each time, since balance
+        # sweeps override enemy sizes)
+        mid_x = start_x + move_x * 0.5
+        mid_y = start_y + move_y * 0.5
+        max_enemy_size = max(stats['size'] for stats in ENEMY_TYPES.values())
+        reach = 0.5 * np.hypot(move_x, move_y) + max_enemy_size + PROJECTILE_HIT_PADDING
+        pair_index = []
+        pair_enemies = []
+        for i, (x, y, radius) in enumerate(zip(mid_x.tolist(), mid_y.tolist(), reach.tolist())):
+            for enemy in enemy_manager.query_radius(x, y, radius):
+                pair_index.append(i)
+                pair_enemies.append(enemy)
+        if not pair_enemies:
+            return
+
+        # Narrowphase: every candidate pair in one vectorized segment-circle test
+        count = len(pair_enemies)
+        pair_index = np.array(pair_index)
+        enemy_x = np.fromiter((enemy.x for enemy in pair_enemies), dtype=np.float64, count=count)
+        enemy_y = np.fromiter((enemy.y for enemy in pair_enemies), dtype=np.float64, count=count)
+        radius = np.fromiter((enemy.size for enemy in pair_enemies), dtype=np.float64, count=count)
+        hit_times = segment_circle_hit_times(start_x[pair_index], start_y[pair_index],
+                                             move_x[pair_index], move_y[pair_index],
+                                             enemy_x, enemy_y, radius + PROJECTILE_HIT_PADDING)
+
+        # Apply hits per projectile in slot order, earliest contact first
+        hits = np.flatnonzero(hit_times <= 1.0)
+        hits = hits[np.lexsort((hit_times[hits], pair_index[hits]))]
+        for pair in hits.tolist():
+            i = pair_index[pair]
+            slot = int(slots[i])
+            if not self.active[slot]:
+                continue  # Non-piercing projectile already spent on an earlier contact
+            enemy = pair_enemies[pair]
+            hit_enemies = self.hit_enemies[slot]
+            if not enemy.is_alive or (hit_enemies is not None and enemy in hit_enemies):
+                continue
+            t = hit_times[pair]
+            self._hit_enemy(slot, enemy, enemy_manager, start_x[i] + move_x[i] * t, start_y[i] + move_y[i] * t)
+
+    def _hit_enemy(self, slot: int, primary_enemy, enemy_manager, x: float, y: float) -> None:
+        """Handle a projectile hitting an enemy at impact point (x, y)"""
+        damage = int(self.damage[slot])
+        freeze_duration = self.freeze_duration[slot]
+        freeze_slow_multiplier = self.freeze_slow_multiplier[slot]
+        splash_radius = self.splash_radius[slot]
+
+        # Mark enemy as hit (for piercing projectiles)
+        hit_enemies = self.hit_enemies[slot]
+        if hit_enemies is not None:
+            hit_enemies.add(primary_enemy)
+
+        # Damage primary target
+        primary_enemy.take_damage(damage)
+
+        # Apply freeze effect if this projectile has freeze
+        if freeze_duration > 0:
+            primary_enemy.apply_freeze_effect(freeze_duration, freeze_slow_multiplier)
+
+        # Handle splash damage and freeze
+        if splash_radius > 0:
+            self.splash_impacts.append(int(self.kind[slot]))
+            for enemy in enemy_manager.query_radius(x, y, splash_radius):
+                if enemy != primary_enemy and enemy.is_alive:
+                    # Flying enemies and splash-immune enemies are immune to splash damage
+                    if enemy.flying or getattr(enemy, 'splash_immune', False):
+                        continue
+
+                    distance = ((x - enemy.x) ** 2 + (y - enemy.y) ** 2) ** 0.5
+                    if distance <= splash_radius:
+                        # Reduce splash damage based on distance
+                        damage_ratio = 1.0 - (distance / splash_radius)
+                        splash_damage = int(damage * damage_ratio * 0.5)  # 50% splash damage
+                        enemy.take_damage(splash_damage)
+
+                        # Apply freeze effect to splash targets
+                        if freeze_duration > 0:
+                            enemy.apply_freeze_effect(freeze_duration, freeze_slow_multiplier)
+
+        # Only destroy projectile if not piercing
+        if not self.piercing[slot]:
+            self._release(slot)
+
+    def _get_render_sprites(self) -> List[Any]:
+        """Get (sprite, half width, half height) per projectile kind, looked up once"""
+        if self.render_sprites is None:
+            self.render_sprites = []
+            for kind in PROJECTILE_KINDS:
+                sprite = sprite_manager.get_projectile_sprite(kind)
+                self.render_sprites.append((sprite, sprite.get_width() // 2, sprite.get_height() // 2)
+                                           if sprite else None)
+        return self.render_sprites
+
+    def render(self, screen: pygame.Surface, level, alpha: float = 1.0) -> List[pygame.Rect]:
+        """
+        Render every projectile in flight, interpolated alpha of the way into the current step
+        
+        Returns the screen areas drawn on, for dirty-rect rendering
+        """
+        rects: List[pygame.Rect] = []
+        slots = np.flatnonzero(self.active)
+        if len(slots) == 0:
+            return rects
+
+        # Interpolated screen positions of every live projectile at once
+        camera_x, camera_y = level.camera.x, level.camera.y
+        screen_x = self.prev_x[slots] + (self.x[slots] - self.prev_x[slots]) * alpha - camera_x
+        screen_y = self.prev_y[slots] + (self.y[slots] - self.prev_y[slots]) * alpha - camera_y
+
+        # Only render if visible on screen
+        visible = ((screen_x >= -10) & (screen_x <= GAME_AREA_WIDTH + 10) &
+                   (screen_y >= -10) & (screen_y <= SCREEN_HEIGHT + 10))
+        kinds = self.kind[slots][visible]
+        center_x = screen_x[visible].astype(np.int64)
+        center_y = screen_y[visible].astype(np.int64)
+
+        sprites = self._get_render_sprites()
+        queue = self.render_queue
+        for kind, x, y in zip(kinds.tolist(), center_x.tolist(), center_y.tolist()):
+            sprite = sprites[kind]
+            if sprite:
+                # Center the sprite on the projectile position
+                surface, half_width, half_height = sprite
+                queue.add('projectiles', surface, (x - half_width, y - half_height))
+            else:
+                # Fallback to simple circle if sprite not available
+                rects.append(pygame.draw.circle(screen, PROJECTILE_COLORS[kind], (x, y), 3))
+        rects.extend(queue.flush(screen, 'projectiles'))
+        return rects
@@ -0,0 +1,30 @@
+"""
+Render queue - batches sprite blits per layer into single Surface.blits calls
+"""
+
+import pygame  # type: ignore
+from typing import Dict, List, Tuple
+
+class RenderQueue:
+    """Collects (surface, dest) pairs per layer and submits each layer in one call"""
+    
+    def __init__(self):
+        self.layers: Dict[str, List[Tuple[pygame.Surface, Tuple[int, int]]]] = {}
+    
+    def add(self, layer: str, surface: pygame.Surface, dest: Tuple[int, int]) -> None:
+        """Queue a blit of surface with its top-left corner at dest"""
+        items = self.layers.get(layer)
+        if items is None:
+            items = self.layers[layer] = []
+        items.append((surface, dest))
+    
+    def flush(self, screen: pygame.Surface, layer: str) -> List[pygame.Rect]:
+        """Blit everything queued on a layer, in queue order, and return the areas drawn"""
+        items = self.layers.pop(layer, None)
+        if not items:
+            return []
+        return screen.blits(items)
+    
+    def clear(self) -> None:
+        """Drop everything queued"""
+        self.layers.clear()
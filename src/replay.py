@@ -0,0 +1,154 @@
+"""
+Input recording and frame-exact replay playback
+
+A replay stores the game seed and every command applied through
+Game.apply_command together with the simulation tick it was applied on.
+Because the simulation runs on a fixed timestep and draws all randomness
+from the seed, re-applying the commands on the same ticks reproduces the
+game exactly.
+
+File format (JSON, one compact document):
+    {"version": 1, "seed": 123, "sim_rate": 60, "end_tick": 9000,
+     "commands": [[0, "select_level", 2], [0, "start_game"], [412, "click", 3, 4], ...]}
+
+Headless playback at maximum speed:
+    python -m src.replay run.replay
+"""
+
+import argparse
+import json
+import time
+from typing import Any, Dict, List, Optional, Tuple
+from .constants import *
+from .game import Game, GameState
+
+# Bump when the file format or simulation changes in a way that breaks old replays
+REPLAY_VERSION = 1
+
+class ReplayRecorder:
+    """Collects commands applied to a game, tagged with their simulation tick"""
+
+    def __init__(self, seed: int):
+        self.seed = seed
+        self.commands: List[List[Any]] = []
+
+    def record(self, tick: int, command: str, args: Tuple) -> None:
+        """Record one applied command"""
+        self.commands.append([tick, command, *args])
+
+    def to_dict(self, end_tick: int) -> Dict[str, Any]:
+        """Get the replay document; end_tick is the sim tick the recording stopped on"""
+        return {
+            'version': REPLAY_VERSION,
+            'seed': self.seed,
+            'sim_rate': SIM_RATE,
+            'end_tick': end_tick,
+            'commands': self.commands,
+        }
+
+    def save(self, path: str, end_tick: int) -> None:
+        """Write the replay file"""
+        with open(path, 'w') as f:
+            json.dump(self.to_dict(end_tick), f, separators=(',', ':'))
+
+class Replay:
+    """A loaded replay file"""
+
+    def __init__(self, seed: int, commands: List[List[Any]], end_tick: int):
+        self.seed = seed
+        self.commands = commands
+        self.end_tick = end_tick
+
+    @classmethod
+    def load(cls, path: str) -> 'Replay':
+        """Read and validate a replay file"""
+        with open(path) as f:
+            data = json.load(f)
+
+        if data.get('version') != REPLAY_VERSION:
+            raise ValueError(f"Unsupported replay version: {data.get('version')}")
+        if data.get('sim_rate') != SIM_RATE:
+            raise ValueError(f"Replay recorded at {data.get('sim_rate')} steps/s, game runs at {SIM_RATE}")
+        return cls(data['seed'], data['commands'], data['end_tick'])
+
+class ReplayPlayer:
+    """Re-drives a game from a replay, applying each command on its recorded tick"""
+
+    def __init__(self, replay: Replay, game: Game):
+        self.replay = replay
+        self.game = game
+        self.next_index = 0
+
+    def apply_due(self) -> None:
+        """Apply every pending command recorded on or before the current sim tick"""
+        commands = self.replay.commands
+        while self.next_index < len(commands) and commands[self.next_index][0] <= self.game.sim_ticks:
+            _, command, *args = commands[self.next_index]
+            self.next_index += 1
+            self.game.apply_command(command, *args)
+
+    def has_pending(self) -> bool:
+        """Check if commands remain to be applied"""
+        return self.next_index < len(self.replay.commands)
+
+    @property
+    def finished(self) -> bool:
+        """True once every command is applied and the recording's last tick is reached"""
+        return not self.has_pending() and self.game.sim_ticks >= self.replay.end_tick
+
+    def step(self) -> None:
+        """Apply due commands and advance the simulation one fixed step"""
+        self.apply_due()
+        if not self.finished:
+            self.game.update(SIM_DT)
+
+def play_headless(replay: Replay) -> Dict[str, Any]:
+    """
+    Play a replay without a display as fast as possible
+
+    Returns:
+        Dictionary with the final game state and timings
+    """
+    game = Game(seed=replay.seed)
+    player = ReplayPlayer(replay, game)
+
+    start_time = time.perf_counter()
+    ticks = 0
+    while True:
+        player.apply_due()
+        # The sim tick only advances while playing, so outside PLAYING
+        # nothing further can come due
+        if player.finished or game.state != GameState.PLAYING:
+            break
+        game.update(SIM_DT)
+        ticks += 1
+    wall_time = time.perf_counter() - start_time
+
+    return {
+        'seed': replay.seed,
+        'level': game.current_level,
+        'state': game.state,
+        'lives': game.lives,
+        'gold': game.gold,
+        'kills': game.enemies_killed,
+        'leaks': game.enemies_leaked,
+        'wave': game.current_wave,
+        'end_tick': game.sim_ticks,
+        'commands_applied': player.next_index,
+        'commands_total': len(replay.commands),
+        'ticks': ticks,
+        'wall_time': round(wall_time, 3),
+        'ticks_per_second': round(ticks / wall_time) if wall_time > 0 else None,
+    }
+
+def main(argv: Optional[List[str]] = None) -> None:
+    """Command line entry point"""
+    parser = argparse.ArgumentParser(description="Play back a tower defense replay headless at full speed")
+    parser.add_argument('replay', help="replay file recorded with main.py --record")
+    args = parser.parse_args(argv)
+
+    results = play_headless(Replay.load(args.replay))
+    print(json.dumps(results, indent=2))
+
+if __name__ == "__main__":
+    main()
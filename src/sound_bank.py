@@ -0,0 +1,253 @@
+"""
+Sound bank builder - renders sound recipes to WAV files in parallel
+
+Every recipe in sound_recipes.py is rendered with AudioGenerator and saved
+under a hash of the recipe and the synthesis code:
+
+    assets/sounds/generated/<hash>.wav
+    assets/sounds/generated/bank.json   (sound name -> file)
+
+A sound whose recipe and generator are unchanged is never re-synthesized,
+so a warm build only hashes recipes and checks files. Cold builds render
+one recipe per worker process, longest first.
+
+Command line:
+    python -m src.sound_bank --workers 8
+"""
+
+import argparse
+import json
+import os
+import re
+import time
+import wave
+import numpy as np  # type: ignore
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import Any, Dict, List, Optional
+from .audio_generator import AudioGenerator
+from .fingerprint import content_hash, file_fingerprint
+from .sound_recipes import SOUND_RECIPES
+
+# Default location of the rendered sounds
+SOUND_BANK_DIR = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'assets', 'sounds', 'generated')
+SOUND_BANK_MANIFEST = 'bank.json'
+
+# Rendered files are named by their 20-character recipe hash
+_BANK_FILE = re.compile(r'^[0-9a-f]{20}\.wav$')
+
+# Semitones above C of each note letter
+_NOTE_OFFSETS = {'C': 0, 'D': 2, 'E': 4, 'F': 5, 'G': 7, 'A': 9, 'B': 11}
+_NOTE_NAME = re.compile(r'^([A-G])([#b]*)(-?\d+)$')
+
+def note_frequency(name: str) -> float:
+    """Equal-tempered frequency of a note name such as 'A4', 'F#3' or 'Bb2'"""
+    match = _NOTE_NAME.match(name)
+    if not match:
+        raise ValueError(f"Invalid note name: {name}")
+    letter, accidentals, octave = match.groups()
+    midi = 12 * (int(octave) + 1) + _NOTE_OFFSETS[letter] + accidentals.count('#') - accidentals.count('b')
+    return 440.0 * 2 ** ((midi - 69) / 12)
+
+def render_note(generator: AudioGenerator, layer: Dict[str, Any], note: Any) -> np.ndarray:
+    """Render one note, or chord given as a list of notes, of a sequence layer"""
+    names = note if isinstance(note, list) else [note]
+    wave_type = layer.get('wave', AudioGenerator.SINE)
+    note_length = layer.get('note_length', layer['step'])
+    amplitude = layer.get('amplitude', 0.5) / len(names)
+    chord = generator.mix_audio(*(generator.generate_waveform(wave_type, note_frequency(name), note_length, amplitude)
+                                  for name in names))
+    if 'note_envelope' in layer:
+        chord = generator.apply_envelope(chord, *layer['note_envelope'])
+    return chord
+
+def _render_sequence(generator: AudioGenerator, layer: Dict[str, Any], duration: float) -> np.ndarray:
+    """Render a looping note sequence; each distinct note or chord is synthesized once"""
+    step = layer['step']
+    audio = np.zeros(int(generator.sample_rate * duration))
+
+    rendered: Dict[Any, np.ndarray] = {}
+    notes = layer['notes']
+    step_count = int(round(duration / step)) if notes else 0
+    for index in range(step_count):
+        note = notes[index % len(notes)]
+        if note is None:
+            continue
+        key = tuple(note) if isinstance(note, list) else note
+        if key not in rendered:
+            rendered[key] = render_note(generator, layer, note)
+
+        # Mix the note in at its step, cut off at the end of the layer
+        start = int(round(index * step * generator.sample_rate))
+        samples = rendered[key][:max(0, len(audio) - start)]
+        audio[start:start + len(samples)] += samples
+    return audio
+
+def render_layer(generator: AudioGenerator, layer: Dict[str, Any], duration: float) -> np.ndarray:
+    """Render one recipe layer (see sound_recipes.py) lasting the given duration"""
+    layer_type = layer['type']
+    amplitude = layer.get('amplitude', 0.5)
+    if layer_type == 'tone':
+        audio = generator.generate_waveform(layer.get('wave', AudioGenerator.SINE), layer['frequency'], duration,
+                                            amplitude, layer.get('phase', 0.0))
+    elif layer_type == 'noise':
+        audio = generator.generate_noise(layer.get('noise', AudioGenerator.WHITE_NOISE), duration, amplitude)
+    elif layer_type == 'sweep':
+        audio = generator.generate_sweep(layer['start_freq'], layer['end_freq'], duration,
+                                         layer.get('wave', AudioGenerator.SINE), amplitude)
+    elif layer_type == 'fm':
+        audio = generator.frequency_modulation(layer['carrier'], layer['modulator'], layer['depth'],
+                                               duration, amplitude)
+    elif layer_type == 'harmonics':
+        audio = generator.generate_complex_tone(layer['frequency'], [tuple(h) for h in layer['harmonics']],
+                                                duration, amplitude)
+    elif layer_type == 'sequence':
+        audio = _render_sequence(generator, layer, duration)
+    else:
+        raise ValueError(f"Unknown layer type: {layer_type}")
+
+    if 'envelope' in layer:
+        audio = generator.apply_envelope(audio, *layer['envelope'])
+    return audio
+
+def render_sound(recipe: Dict[str, Any]) -> np.ndarray:
+    """Render a recipe to float samples, mixed, faded and normalized"""
+    generator = AudioGenerator(seed=recipe.get('seed', 0))
+    duration = recipe['duration']
+    audio = np.zeros(int(generator.sample_rate * duration))
+
+    for layer in recipe['layers']:
+        start = layer.get('start', 0.0)
+        layer_audio = render_layer(generator, layer, layer.get('duration', duration - start))
+        offset = int(round(start * generator.sample_rate))
+        layer_audio = layer_audio[:max(0, len(audio) - offset)]
+        audio[offset:offset + len(layer_audio)] += layer_audio
+
+    fade_in, fade_out = recipe.get('fade', (0.0, 0.0))
+    if fade_in or fade_out:
+        audio = generator.apply_fade(audio, fade_in, fade_out)
+    return generator.normalize_audio(audio, recipe.get('volume', 0.9))
+
+def _generator_fingerprint() -> str:
+    """Hash the synthesis code so rendered sounds expire when it changes"""
+    src_dir = os.path.dirname(os.path.abspath(__file__))
+    return file_fingerprint(os.path.join(src_dir, name) for name in ('audio_generator.py', 'sound_bank.py'))
+
+def build_sound(recipe: Dict[str, Any], path: str) -> float:
+    """Render a recipe to a 16-bit WAV file (runs inside a worker process); returns render seconds"""
+    start_time = time.perf_counter()
+    generator = AudioGenerator()
+    pcm = generator.to_pcm16(render_sound(recipe), normalize=False)
+
+    # Write to a temporary file and rename so a partly written sound is never picked up
+    temp_path = f"{path}.tmp"
+    with wave.open(temp_path, 'wb') as wav_file:
+        wav_file.setnchannels(generator.CHANNELS)
+        wav_file.setsampwidth(generator.bit_depth // 8)
+        wav_file.setframerate(generator.sample_rate)
+        wav_file.writeframes(pcm.astype('<i2').tobytes())
+    os.replace(temp_path, path)
+    return time.perf_counter() - start_time
+
+def read_pcm(path: str) -> np.ndarray:
+    """Read a rendered sound back as an int16 array (read in one call, no per-sample parsing)"""
+    with wave.open(path, 'rb') as wav_file:
+        if wav_file.getsampwidth() != 2 or wav_file.getnchannels() != 1:
+            raise ValueError(f"Not a mono 16-bit sound: {path}")
+        return np.frombuffer(wav_file.readframes(wav_file.getnframes()), dtype='<i2').astype(np.int16, copy=False)
+
+def build_sound_bank(recipes: Optional[Dict[str, Dict[str, Any]]] = None, bank_dir: str = SOUND_BANK_DIR,
+                     workers: Optional[int] = None, force: bool = False,
+                     prune: bool = True) -> Dict[str, Dict[str, Any]]:
+    """
+    Render every recipe that isn't already in the bank
+
+    Args:
+        recipes: Sound name -> recipe; defaults to every recipe in sound_recipes.py
+        bank_dir: Directory of rendered sounds
+        workers: Worker processes; defaults to the number of CPU cores
+        force: Re-render every sound even if it is cached
+        prune: Delete rendered sounds no recipe refers to any more
+
+    Returns:
+        Per sound name: {'hash', 'path', 'cached', 'seconds'}
+    """
+    recipes = SOUND_RECIPES if recipes is None else recipes
+    fingerprint = _generator_fingerprint()
+    records: Dict[str, Dict[str, Any]] = {}
+    todo: Dict[str, str] = {}
+    for name, recipe in recipes.items():
+        sound_hash = content_hash(recipe, fingerprint)
+        path = os.path.join(bank_dir, f"{sound_hash}.wav")
+        cached = not force and os.path.exists(path)
+        records[name] = {'hash': sound_hash, 'path': path, 'cached': cached, 'seconds': 0.0}
+        if not cached:
+            todo.setdefault(sound_hash, name)
+
+    os.makedirs(bank_dir, exist_ok=True)
+
+    # Fan the missing sounds out over the worker pool, longest first so the pool drains evenly
+    if todo:
+        order = sorted(todo.items(), key=lambda item: -recipes[item[1]]['duration'])
+        render_seconds = {}
+        with ProcessPoolExecutor(max_workers=workers or os.cpu_count()) as executor:
+            futures = {executor.submit(build_sound, recipes[name], records[name]['path']): sound_hash
+                       for sound_hash, name in order}
+            for future in as_completed(futures):
+                render_seconds[futures[future]] = future.result()
+        for record in records.values():
+            record['seconds'] = render_seconds.get(record['hash'], 0.0)
+
+    # Manifest mapping sound names to files; partial builds add to it, and
+    # it is only rewritten when it changes
+    manifest_path = os.path.join(bank_dir, SOUND_BANK_MANIFEST)
+    try:
+        with open(manifest_path) as f:
+            old_manifest = f.read()
+        entries = {} if prune else json.loads(old_manifest)
+    except (OSError, ValueError):
+        old_manifest, entries = None, {}
+    entries.update({name: os.path.basename(record['path']) for name, record in records.items()})
+    manifest = json.dumps(entries, indent=2, sort_keys=True)
+    if manifest != old_manifest:
+        with open(manifest_path, 'w') as f:
+            f.write(manifest)
+
+    if prune:
+        current = {os.path.basename(record['path']) for record in records.values()}
+        for file_name in os.listdir(bank_dir):
+            if _BANK_FILE.match(file_name) and file_name not in current:
+                os.remove(os.path.join(bank_dir, file_name))
+
+    return records
+
+def main(argv: Optional[List[str]] = None) -> None:
+    """Command line entry point"""
+    parser = argparse.ArgumentParser(description="Render the procedural sound bank")
+    parser.add_argument('sounds', nargs='*', help="sound names to build (default: all)")
+    parser.add_argument('--workers', type=int, default=None, help="worker processes (default: all cores)")
+    parser.add_argument('--out', default=SOUND_BANK_DIR, help="sound bank directory")
+    parser.add_argument('--force', action='store_true', help="re-render cached sounds")
+    parser.add_argument('--list', action='store_true', help="list the available sounds")
+    args = parser.parse_args(argv)
+
+    if args.list:
+        for name, recipe in SOUND_RECIPES.items():
+            print(f"{name:<20}{recipe['duration']:>7.2f}s")
+        return
+
+    recipes = SOUND_RECIPES
+    if args.sounds:
+        unknown = [name for name in args.sounds if name not in SOUND_RECIPES]
+        if unknown:
+            parser.error(f"unknown sounds: {', '.join(unknown)}")
+        recipes = {name: SOUND_RECIPES[name] for name in args.sounds}
+
+    start_time = time.perf_counter()
+    records = build_sound_bank(recipes, args.out, args.workers, args.force, prune=not args.sounds)
+    elapsed = time.perf_counter() - start_time
+
+    cached = sum(1 for record in records.values() if record['cached'])
+    print(f"{len(records)} sounds ({cached} cached) in {elapsed * 1000:.0f}ms -> {args.out}")
+
+if __name__ == "__main__":
+    main()
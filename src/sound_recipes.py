@@ -0,0 +1,236 @@
+"""
+Sound recipes - parameter descriptions of every procedural sound
+
+Each recipe is plain JSON-compatible data rendered by sound_bank.py:
+
+    {
+        'duration': seconds,
+        'layers': [layer, ...],      # mixed together at their start offsets
+        'fade': [fade_in, fade_out], # optional, seconds
+        'volume': 0.9,               # optional normalization peak
+        'seed': 0,                   # optional noise seed
+    }
+
+Layers share 'start', 'duration' (defaults to the rest of the sound),
+'amplitude' and an optional ADSR 'envelope' [attack, decay, sustain,
+release, sustain_level]. By 'type':
+
+    tone       wave, frequency, phase
+    noise      noise (white, brown, filtered)
+    sweep      start_freq, end_freq, wave
+    fm         carrier, modulator, depth
+    harmonics  frequency, harmonics [[ratio, amplitude], ...]
+    sequence   notes (note names, chords as lists, None for rests), step,
+               wave, note_length, note_envelope; loops to fill its duration
+
+Changing a recipe only re-renders that sound; changing the synthesis code
+re-renders them all.
+"""
+
+from typing import Any, Dict
+
+# Sound effects (see assets/sounds/AUDIO_IMPLEMENTATION_PLAN.md)
+SFX_RECIPES: Dict[str, Dict[str, Any]] = {
+    # Tower firing
+    'cannon_fire': {
+        'duration': 0.2,
+        'layers': [
+            {'type': 'tone', 'wave': 'sine', 'frequency': 100, 'amplitude': 0.8,
+             'envelope': [0.005, 0.06, 0.04, 0.095, 0.5]},
+            {'type': 'sweep', 'start_freq': 120, 'end_freq': 60, 'amplitude': 0.5,
+             'envelope': [0.002, 0.05, 0.05, 0.098, 0.4]},
+            {'type': 'noise', 'noise': 'brown', 'duration': 0.13, 'amplitude': 0.6,
+             'envelope': [0.001, 0.03, 0.0, 0.099, 0.3]},
+        ],
+    },
+    'machine_gun_fire': {
+        'duration': 0.15,
+        'layers': [
+            layer
+            for start in (0.0, 0.05, 0.1)
+            for layer in (
+                {'type': 'tone', 'wave': 'square', 'frequency': 300, 'start': start, 'duration': 0.04,
+                 'amplitude': 0.35, 'envelope': [0.001, 0.01, 0.01, 0.019, 0.5]},
+                {'type': 'noise', 'noise': 'white', 'start': start, 'duration': 0.04,
+                 'amplitude': 0.5, 'envelope': [0.001, 0.008, 0.005, 0.026, 0.4]},
+            )
+        ],
+    },
+    'missile_launch': {
+        'duration': 0.3,
+        'layers': [
+            {'type': 'sweep', 'start_freq': 400, 'end_freq': 800, 'amplitude': 0.5,
+             'envelope': [0.06, 0.05, 0.12, 0.07, 0.7]},
+            {'type': 'noise', 'noise': 'filtered', 'amplitude': 0.4,
+             'envelope': [0.04, 0.06, 0.12, 0.08, 0.6]},
+        ],
+        'fade': [0.0, 0.03],
+    },
+    'laser_beam': {
+        'duration': 0.1,
+        'layers': [
+            {'type': 'harmonics', 'frequency': 1000, 'harmonics': [[2.0, 0.3], [3.0, 0.15]], 'amplitude': 0.5,
+             'envelope': [0.001, 0.02, 0.04, 0.039, 0.6]},
+            {'type': 'fm', 'carrier': 1200, 'modulator': 60, 'depth': 80, 'amplitude': 0.2,
+             'envelope': [0.001, 0.02, 0.04, 0.039, 0.5]},
+        ],
+    },
+    'freeze_blast': {
+        'duration': 0.18,
+        'layers': [
+            {'type': 'harmonics', 'frequency': 600, 'harmonics': [[2.0, 0.5], [4.0, 0.3]], 'amplitude': 0.5,
+             'envelope': [0.03, 0.03, 0.09, 0.03, 0.8]},
+            {'type': 'noise', 'noise': 'filtered', 'amplitude': 0.1,
+             'envelope': [0.03, 0.03, 0.09, 0.03, 0.6]},
+        ],
+    },
+
+    # Explosions
+    'explosion_small': {
+        'duration': 0.12,
+        'layers': [
+            {'type': 'noise', 'noise': 'white', 'amplitude': 0.6,
+             'envelope': [0.001, 0.02, 0.0, 0.099, 0.5]},
+            {'type': 'noise', 'noise': 'filtered', 'amplitude': 0.8,
+             'envelope': [0.001, 0.03, 0.0, 0.089, 0.5]},
+            {'type': 'sweep', 'start_freq': 800, 'end_freq': 200, 'amplitude': 0.3,
+             'envelope': [0.001, 0.03, 0.0, 0.089, 0.4]},
+        ],
+    },
+    'explosion_large': {
+        'duration': 0.25,
+        'layers': [
+            {'type': 'noise', 'noise': 'brown', 'amplitude': 0.9,
+             'envelope': [0.002, 0.05, 0.03, 0.168, 0.6]},
+            {'type': 'sweep', 'start_freq': 120, 'end_freq': 50, 'amplitude': 0.6,
+             'envelope': [0.002, 0.06, 0.04, 0.148, 0.5]},
+        ],
+    },
+
+    # UI and game events
+    'ui_click': {
+        'duration': 0.05,
+        'layers': [
+            {'type': 'tone', 'wave': 'sine', 'frequency': 440, 'amplitude': 0.5,
+             'envelope': [0.002, 0.01, 0.02, 0.018, 0.6]},
+        ],
+    },
+    'wave_start': {
+        'duration': 0.4,
+        'layers': [
+            {'type': 'sequence', 'notes': ['C4', 'E4', 'G4', 'C5'], 'step': 0.1, 'wave': 'triangle',
+             'amplitude': 0.5, 'note_envelope': [0.01, 0.03, 0.04, 0.02, 0.6]},
+        ],
+    },
+    'victory': {
+        'duration': 0.8,
+        'layers': [
+            {'type': 'sequence', 'notes': [['C4', 'E4', 'G4'], ['F4', 'A4', 'C5'], ['G4', 'B4', 'D5'],
+                                           ['C4', 'E4', 'G4', 'C5']],
+             'step': 0.2, 'wave': 'sine', 'amplitude': 0.5, 'note_envelope': [0.02, 0.05, 0.1, 0.03, 0.7]},
+        ],
+        'fade': [0.0, 0.05],
+    },
+    'enemy_death': {
+        'duration': 0.15,
+        'layers': [
+            {'type': 'sweep', 'start_freq': 500, 'end_freq': 150, 'amplitude': 0.5,
+             'envelope': [0.002, 0.04, 0.06, 0.048, 0.5]},
+            {'type': 'noise', 'noise': 'white', 'duration': 0.06, 'amplitude': 0.3,
+             'envelope': [0.001, 0.02, 0.0, 0.039, 0.4]},
+        ],
+    },
+    'life_lost': {
+        'duration': 0.35,
+        'layers': [
+            {'type': 'sequence', 'notes': ['A4', 'F4'], 'step': 0.15, 'note_length': 0.17, 'wave': 'square',
+             'amplitude': 0.3, 'note_envelope': [0.005, 0.04, 0.08, 0.045, 0.6]},
+        ],
+    },
+}
+
+def _beats(bpm: float, count: float) -> float:
+    """Length in seconds of count beats at the given tempo"""
+    return count * 60.0 / bpm
+
+# Level background music: loops whose length is a whole number of bars
+MUSIC_RECIPES: Dict[str, Dict[str, Any]] = {
+    # Forest Path: 60 BPM, C major pentatonic, flute over wind
+    'forest_ambient': {
+        'duration': _beats(60, 64),
+        'layers': [
+            {'type': 'sequence', 'wave': 'sine', 'step': _beats(60, 0.5), 'amplitude': 0.35,
+             'notes': ['C5', 'D5', 'E5', 'G5', 'A5', None, 'G5', 'E5',
+                       'D5', 'E5', 'G5', None, 'E5', 'D5', 'C5', None],
+             'note_envelope': [0.05, 0.1, 0.25, 0.1, 0.6]},
+            {'type': 'sequence', 'wave': 'triangle', 'step': _beats(60, 4), 'amplitude': 0.3,
+             'notes': ['C3', 'A2', 'F2', 'G2'], 'note_envelope': [0.2, 0.5, 2.8, 0.5, 0.5]},
+            {'type': 'noise', 'noise': 'filtered', 'amplitude': 0.05},
+        ],
+        'fade': [0.5, 0.5],
+    },
+    # Mountain Pass: 70 BPM, A minor, square bass under an echoing melody
+    'mountain_ambient': {
+        'duration': _beats(70, 64),
+        'layers': [
+            {'type': 'sequence', 'wave': 'square', 'step': _beats(70, 1), 'amplitude': 0.15,
+             'notes': ['A2', 'A2', 'E2', 'E2', 'F2', 'F2', 'G2', 'G2'],
+             'note_envelope': [0.01, 0.1, 0.5, 0.2, 0.6]},
+            {'type': 'sequence', 'wave': 'triangle', 'step': _beats(70, 0.5), 'amplitude': 0.3,
+             'notes': ['A4', 'C5', 'E5', 'D5', 'C5', 'B4', 'A4', None,
+                       'E4', 'G4', 'B4', 'A4', 'G4', 'E4', 'A4', None],
+             'note_envelope': [0.02, 0.08, 0.2, 0.1, 0.6]},
+            {'type': 'sequence', 'wave': 'triangle', 'step': _beats(70, 0.5), 'amplitude': 0.12,
+             'start': _beats(70, 0.75),
+             'notes': ['A4', 'C5', 'E5', 'D5', 'C5', 'B4', 'A4', None,
+                       'E4', 'G4', 'B4', 'A4', 'G4', 'E4', 'A4', None],
+             'note_envelope': [0.02, 0.08, 0.2, 0.1, 0.6]},
+        ],
+        'fade': [0.5, 0.5],
+    },
+    # Desert Canyon: 65 BPM, D harmonic minor, triangle lead over noise percussion
+    'desert_ambient': {
+        'duration': _beats(65, 64),
+        'layers': [
+            {'type': 'sequence', 'wave': 'triangle', 'step': _beats(65, 0.5), 'amplitude': 0.35,
+             'notes': ['D4', 'E4', 'F4', 'G4', 'A4', 'A#4', 'C#5', 'D5',
+                       'C#5', 'A#4', 'A4', 'G4', 'F4', 'E4', 'D4', None],
+             'note_envelope': [0.03, 0.1, 0.2, 0.1, 0.6]},
+            {'type': 'sequence', 'wave': 'sine', 'step': _beats(65, 2), 'amplitude': 0.3,
+             'notes': ['D2', 'A2', 'A#2', 'A2'], 'note_envelope': [0.05, 0.3, 1.2, 0.3, 0.6]},
+            {'type': 'noise', 'noise': 'brown', 'amplitude': 0.08},
+        ],
+        'fade': [0.5, 0.5],
+    },
+    # Nightmare Spiral: 55 BPM, C minor with dissonance, sawtooth drones
+    'nightmare_ambient': {
+        'duration': _beats(55, 48),
+        'layers': [
+            {'type': 'sequence', 'wave': 'sawtooth', 'step': _beats(55, 4), 'amplitude': 0.15,
+             'notes': [['C2', 'C#2'], ['G#1', 'A1'], ['F2', 'F#2'], ['G1', 'G#1']],
+             'note_envelope': [0.5, 1.0, 2.3, 0.5, 0.7]},
+            {'type': 'sequence', 'wave': 'sine', 'step': _beats(55, 1), 'amplitude': 0.25,
+             'notes': ['C4', 'D#4', 'F#4', 'C4', 'G4', 'F#4', 'D#4', None],
+             'note_envelope': [0.05, 0.2, 0.5, 0.3, 0.5]},
+            {'type': 'tone', 'wave': 'sine', 'frequency': 32.7, 'amplitude': 0.2},
+        ],
+        'fade': [0.5, 0.5],
+    },
+    # Frozen Wasteland: 50 BPM, F# minor, sine pads and crystalline bells
+    'frozen_ambient': {
+        'duration': _beats(50, 48),
+        'layers': [
+            {'type': 'sequence', 'wave': 'sine', 'step': _beats(50, 4), 'amplitude': 0.25,
+             'notes': [['F#3', 'A3', 'C#4'], ['D3', 'F#3', 'A3'], ['E3', 'G#3', 'B3'], ['C#3', 'E#3', 'G#3']],
+             'note_envelope': [0.8, 1.0, 2.4, 0.6, 0.7]},
+            {'type': 'sequence', 'wave': 'sine', 'step': _beats(50, 0.5), 'note_length': 0.3, 'amplitude': 0.2,
+             'notes': ['C#6', None, 'F#6', None, None, 'A5', None, 'E6',
+                       None, 'C#6', None, None, 'B5', None, 'F#6', None],
+             'note_envelope': [0.002, 0.05, 0.05, 0.198, 0.4]},
+        ],
+        'fade': [0.5, 0.5],
+    },
+}
+
+# Every recipe the sound bank builds
+SOUND_RECIPES: Dict[str, Dict[str, Any]] = {**SFX_RECIPES, **MUSIC_RECIPES}
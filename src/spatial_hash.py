@@ -0,0 +1,71 @@
+"""
+Uniform-grid spatial hash for fast proximity queries
+"""
+
+from typing import Any, Dict, Iterable, List, Tuple
+from .constants import GRID_SIZE
+
+class SpatialHash:
+    """Buckets objects with an x/y position into square grid cells"""
+
+    def __init__(self, cell_size: int = GRID_SIZE):
+        self.cell_size = cell_size
+        # Each bucket holds (insertion_order, object) so query results can be
+        # returned in the same order the objects were inserted
+        self.cells: Dict[Tuple[int, int], List[Tuple[int, Any]]] = {}
+        self.count = 0
+
+    def clear(self) -> None:
+        """Remove all objects from the hash"""
+        self.cells.clear()
+        self.count = 0
+
+    def _cell_of(self, x: float, y: float) -> Tuple[int, int]:
+        """Get the cell coordinates containing a world position"""
+        return (int(x // self.cell_size), int(y // self.cell_size))
+
+    def insert(self, obj: Any, x: float, y: float) -> None:
+        """Add an object at a world position"""
+        cell = self._cell_of(x, y)
+        bucket = self.cells.get(cell)
+        if bucket is None:
+            bucket = []
+            self.cells[cell] = bucket
+        bucket.append((self.count, obj))
+        self.count += 1
+
+    def rebuild(self, objects: Iterable[Any]) -> None:
+        """Clear the hash and re-insert objects using their x/y attributes"""
+        self.clear()
+        for obj in objects:
+            self.insert(obj, obj.x, obj.y)
+
+    def query_radius(self, x: float, y: float, radius: float) -> List[Any]:
+        """Get objects within radius of a position, in insertion order"""
+        if not self.count:
+            return []
+
+        min_cx, min_cy = self._cell_of(x - radius, y - radius)
+        max_cx, max_cy = self._cell_of(x + radius, y + radius)
+        radius_sq = radius * radius
+
+        # Walk whichever is smaller: the cells covered by the query or the occupied cells
+        if (max_cx - min_cx + 1) * (max_cy - min_cy + 1) <= len(self.cells):
+            buckets = [self.cells.get((cx, cy)) for cx in range(min_cx, max_cx + 1)
+                       for cy in range(min_cy, max_cy + 1)]
+        else:
+            buckets = [bucket for (cx, cy), bucket in self.cells.items()
+                       if min_cx <= cx <= max_cx and min_cy <= cy <= max_cy]
+
+        found = []
+        for bucket in buckets:
+            if not bucket:
+                continue
+            for order, obj in bucket:
+                dx = obj.x - x
+                dy = obj.y - y
+                if dx * dx + dy * dy <= radius_sq:
+                    found.append((order, obj))
+
+        found.sort(key=lambda item: item[0])
+        return [obj for _, obj in found]
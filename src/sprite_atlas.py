@@ -0,0 +1,166 @@
+"""
+Texture atlas - packs scaled sprites into a few large surfaces
+
+The sprite manager builds an atlas once from every sprite it loads or
+generates and saves it to a cache directory as a single pack file: a JSON
+header (rect index and page layout) followed by the pages as raw RGBA.
+Later launches memory-map the pack, wrap each page with
+pygame.image.frombuffer and hand out subsurfaces, so nothing is decoded,
+scaled or generated.
+
+Pack file layout:
+    b'TDSPRITE' | header length (uint32, little endian) | JSON header | page bytes...
+
+The cache is keyed by a fingerprint of the sprite files and the code that
+scales and draws them, so editing either rebuilds it.
+"""
+
+import json
+import mmap
+import os
+import struct
+import pygame  # type: ignore
+from typing import Dict, List, Optional, Tuple
+from .fingerprint import file_fingerprint
+
+# Bump when the page or index format changes
+ATLAS_VERSION = 2
+
+# Atlas page size and the gap left around each sprite
+ATLAS_PAGE_SIZE = 512
+ATLAS_PADDING = 1
+
+ATLAS_PACK_FILE = 'sprites.pack'
+ATLAS_MAGIC = b'TDSPRITE'
+ATLAS_HEADER = struct.Struct('<I')
+
+# pygame.image.tostring was renamed tobytes in pygame 2.1.3
+_surface_to_bytes = getattr(pygame.image, 'tobytes', None) or pygame.image.tostring
+
+def source_fingerprint(sprite_dir: str, code_files: List[str]) -> str:
+    """Hash the sprite files' names, sizes and modification times plus the given source files"""
+    sprite_stats = []
+    if os.path.isdir(sprite_dir):
+        for name in sorted(os.listdir(sprite_dir)):
+            if name.endswith('.png'):
+                stat = os.stat(os.path.join(sprite_dir, name))
+                sprite_stats.append(f"{name}:{stat.st_size}:{stat.st_mtime_ns}")
+    return file_fingerprint(code_files, str(ATLAS_VERSION), *sprite_stats)
+
+class SpriteAtlas:
+    """A set of atlas pages with the rect of every sprite packed into them"""
+
+    def __init__(self, pages: List[pygame.Surface], rects: Dict[str, Tuple[int, int, int, int, int]],
+                 mapping: Optional[mmap.mmap] = None):
+        self.pages = pages
+        self.rects = rects  # name -> (page, x, y, width, height)
+
+        # Pages loaded from a pack file share its memory map, so it stays open with them
+        self.mapping = mapping
+
+    @classmethod
+    def build(cls, sprites: Dict[str, pygame.Surface], page_size: int = ATLAS_PAGE_SIZE) -> 'SpriteAtlas':
+        """Shelf-pack sprites, tallest first, onto as many pages as needed"""
+        order = sorted(sprites, key=lambda name: (-sprites[name].get_height(), -sprites[name].get_width(), name))
+        rects: Dict[str, Tuple[int, int, int, int, int]] = {}
+        page_heights: List[int] = [0]
+        page, x, y, shelf_height = 0, 0, 0, 0
+        for name in order:
+            width, height = sprites[name].get_size()
+            if width + ATLAS_PADDING > page_size or height + ATLAS_PADDING > page_size:
+                raise ValueError(f"Sprite {name} ({width}x{height}) does not fit an atlas page")
+
+            # Start a new shelf, or a new page, when the sprite doesn't fit
+            if x + width + ATLAS_PADDING > page_size:
+                x, y, shelf_height = 0, y + shelf_height, 0
+            if y + height + ATLAS_PADDING > page_size:
+                page, x, y, shelf_height = page + 1, 0, 0, 0
+                page_heights.append(0)
+
+            rects[name] = (page, x, y, width, height)
+            x += width + ATLAS_PADDING
+            shelf_height = max(shelf_height, height + ATLAS_PADDING)
+            page_heights[page] = max(page_heights[page], y + shelf_height)
+
+        # Pages are cropped to their last shelf so no empty rows are saved and decoded.
+        # Copy pixels exactly: blending onto the transparent page with MAX keeps source colour and alpha
+        pages = []
+        for page_height in (page_heights if rects else []):
+            surface = pygame.Surface((page_size, page_height), pygame.SRCALPHA)
+            surface.fill((0, 0, 0, 0))
+            pages.append(surface)
+        for name, (page_index, x, y, width, height) in rects.items():
+            pages[page_index].blit(sprites[name], (x, y), special_flags=pygame.BLEND_RGBA_MAX)
+        return cls(pages, rects)
+
+    def subsurfaces(self) -> Dict[str, pygame.Surface]:
+        """Get every sprite as a subsurface of its page"""
+        return {name: self.pages[page].subsurface((x, y, width, height))
+                for name, (page, x, y, width, height) in self.rects.items()}
+
+    def convert_alpha(self) -> None:
+        """Convert the pages to the display format (needs a display)"""
+        self.pages = [page.convert_alpha() for page in self.pages]
+
+    def save(self, cache_dir: str, fingerprint: str) -> None:
+        """Write the pack file: header with the rect index, then every page as raw RGBA"""
+        os.makedirs(cache_dir, exist_ok=True)
+        page_data = [_surface_to_bytes(page, 'RGBA') for page in self.pages]
+        header = {
+            'version': ATLAS_VERSION,
+            'fingerprint': fingerprint,
+            'pages': [list(page.get_size()) for page in self.pages],
+            'rects': self.rects,
+        }
+        header_bytes = json.dumps(header).encode()
+
+        # Write to a temporary file and rename so a partly written pack is never picked up
+        path = os.path.join(cache_dir, ATLAS_PACK_FILE)
+        temp_path = f"{path}.tmp"
+        with open(temp_path, 'wb') as f:
+            f.write(ATLAS_MAGIC)
+            f.write(ATLAS_HEADER.pack(len(header_bytes)))
+            f.write(header_bytes)
+            for data in page_data:
+                f.write(data)
+        os.replace(temp_path, path)
+
+    @classmethod
+    def load(cls, cache_dir: str, fingerprint: str) -> Optional['SpriteAtlas']:
+        """Memory-map a saved pack, or None if there is none or it was built from different sources"""
+        path = os.path.join(cache_dir, ATLAS_PACK_FILE)
+        try:
+            with open(path, 'rb') as f:
+                # Copy-on-write mapping: surfaces wrap it directly but writes never reach the file
+                mapping = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_COPY)
+        except (OSError, ValueError):
+            return None
+
+        try:
+            prefix_size = len(ATLAS_MAGIC) + ATLAS_HEADER.size
+            if mapping[:len(ATLAS_MAGIC)] != ATLAS_MAGIC:
+                raise ValueError("Not a sprite pack")
+            header_size, = ATLAS_HEADER.unpack_from(mapping, len(ATLAS_MAGIC))
+            header = json.loads(mapping[prefix_size:prefix_size + header_size])
+            if header.get('version') != ATLAS_VERSION or header.get('fingerprint') != fingerprint:
+                raise ValueError("Stale sprite pack")
+
+            page_sizes = [(int(width), int(height)) for width, height in header['pages']]
+            rects = {name: tuple(rect) for name, rect in header['rects'].items()}
+            data_size = sum(width * height * 4 for width, height in page_sizes)
+            if prefix_size + header_size + data_size > len(mapping):
+                raise ValueError("Truncated sprite pack")
+        except (ValueError, KeyError, TypeError, struct.error):
+            mapping.close()
+            return None
+
+        # Wrap each page in place; no pixel data is copied or decoded
+        pages = []
+        offset = prefix_size + header_size
+        view = memoryview(mapping)
+        for width, height in page_sizes:
+            size = width * height * 4
+            pages.append(pygame.image.frombuffer(view[offset:offset + size], (width, height), 'RGBA'))
+            offset += size
+
+        return cls(pages, rects, mapping)
@@ -6,16 +6,78 @@ import pygame  # type: ignore
 import os
 from typing import Dict, Optional, Tuple
 from .constants import *
+from .sprite_atlas import SpriteAtlas, source_fingerprint
+
+# Enemy sprite variants built once at load: stealthed enemies are drawn
+# translucent, frozen and enraged ones tinted
+ENEMY_STEALTH_ALPHA = 80
+ENEMY_TINTS = {
+    'frozen': (160, 210, 255),
+    'enraged': (255, 150, 150),
+}
 
 class SpriteManager:
     """Manages loading and caching of game sprites"""
     
     def __init__(self):
         self.sprites: Dict[str, pygame.Surface] = {}
+        
+        # Precomputed variants of enemy sprites by (enemy_type, variant)
+        self.enemy_variants: Dict[Tuple[str, str], pygame.Surface] = {}
+        
+        # Fallback shapes for entities without a sprite, by (shape, size, color, alpha)
+        self.shapes: Dict[Tuple[str, int, Tuple[int, int, int], int], pygame.Surface] = {}
         self.sprite_path = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'assets', 'sprites')
-        self._load_default_sprites()
+        
+        # Every sprite is packed into a texture atlas cached on disk between launches
+        self.use_atlas = True
+        self.atlas_path = os.path.join(os.path.dirname(os.path.dirname(__file__)), '.sprite_cache')
+        self.atlas: Optional[SpriteAtlas] = None
+        
+        # Sprites are loaded on first use so headless runs never build surfaces
+        self.loaded = False
+    
+    def _ensure_loaded(self) -> None:
+        """Load sprites the first time one is requested"""
+        if not self.loaded:
+            self.loaded = True
+            self._load_default_sprites()
+    
+    def _load_default_sprites(self, use_cache: bool = True) -> None:
+        """Load every sprite, from the cached atlas when it is up to date"""
+        if not self.use_atlas:
+            self._load_sprite_sources()
+            self._build_enemy_variants()
+            return
+        
+        fingerprint = self._atlas_fingerprint()
+        atlas = SpriteAtlas.load(self.atlas_path, fingerprint) if use_cache else None
+        if atlas is None:
+            # Decode, scale and generate everything once, then pack and save the atlas
+            self._load_sprite_sources()
+            atlas = SpriteAtlas.build(self.sprites)
+            try:
+                atlas.save(self.atlas_path, fingerprint)
+            except (OSError, pygame.error):
+                pass  # Read-only install: rebuild next launch
+        
+        self._use_atlas(atlas)
     
-    def _load_default_sprites(self) -> None:
+    def _atlas_fingerprint(self) -> str:
+        """Fingerprint of the sprite files and the code that scales and draws them"""
+        src_dir = os.path.dirname(os.path.abspath(__file__))
+        code_files = [os.path.join(src_dir, name) for name in ('sprite_manager.py', 'sprite_atlas.py', 'constants.py')]
+        return source_fingerprint(self.sprite_path, code_files)
+    
+    def _use_atlas(self, atlas: SpriteAtlas) -> None:
+        """Serve every sprite as a subsurface of the atlas"""
+        if pygame.get_init() and pygame.display.get_surface():
+            atlas.convert_alpha()
+        self.atlas = atlas
+        self.sprites = atlas.subsurfaces()
+        self._build_enemy_variants()
+    
+    def _load_sprite_sources(self) -> None:
         """Load default sprites or create placeholder sprites if files don't exist"""
         # Tower sprites
         self._load_or_create_sprite('cannon_tower', (40, 40), BROWN)
@@ -99,6 +161,23 @@ class SpriteManager:
         self._load_or_create_sprite('ice_formation', (32, 32), (150, 200, 255))
         self._load_or_create_sprite('icicle', (16, 32), (200, 230, 255))
     
+    def _build_enemy_variants(self) -> None:
+        """Precompute the stealth, frozen and enraged versions of every enemy sprite"""
+        self.enemy_variants.clear()
+        for name, sprite in self.sprites.items():
+            if not name.endswith('_enemy'):
+                continue
+            enemy_type = name[:-len('_enemy')]
+            
+            stealth = sprite.copy()
+            stealth.set_alpha(ENEMY_STEALTH_ALPHA)
+            self.enemy_variants[(enemy_type, 'stealth')] = stealth
+            
+            for variant, tint in ENEMY_TINTS.items():
+                tinted = sprite.copy()
+                tinted.fill(tint, special_flags=pygame.BLEND_RGB_MULT)
+                self.enemy_variants[(enemy_type, variant)] = tinted
+    
     def _load_or_create_sprite(self, name: str, size: Tuple[int, int], color: Tuple[int, int, int]) -> None:
         """Load sprite from file or create a placeholder if file doesn't exist"""
         file_path = os.path.join(self.sprite_path, f"{name}.png")
@@ -732,15 +811,41 @@ class SpriteManager:
     
     def get_sprite(self, name: str) -> Optional[pygame.Surface]:
         """Get a sprite by name"""
+        if not self.loaded:
+            self._ensure_loaded()
         return self.sprites.get(name)
     
     def get_tower_sprite(self, tower_type: str) -> Optional[pygame.Surface]:
         """Get tower sprite by tower type"""
         return self.get_sprite(f"{tower_type}_tower")
     
-    def get_enemy_sprite(self, enemy_type: str) -> Optional[pygame.Surface]:
-        """Get enemy sprite by enemy type"""
-        return self.get_sprite(f"{enemy_type}_enemy")
+    def get_enemy_sprite(self, enemy_type: str, variant: Optional[str] = None) -> Optional[pygame.Surface]:
+        """Get enemy sprite by enemy type, optionally its 'stealth', 'frozen' or 'enraged' variant"""
+        if variant is None:
+            return self.get_sprite(f"{enemy_type}_enemy")
+        if not self.loaded:
+            self._ensure_loaded()
+        return self.enemy_variants.get((enemy_type, variant))
+    
+    def get_circle_sprite(self, radius: int, color: Tuple[int, int, int], alpha: int) -> pygame.Surface:
+        """Get a cached translucent filled circle (fallback for enemies without a sprite)"""
+        key = ('circle', radius, color, alpha)
+        circle = self.shapes.get(key)
+        if circle is None:
+            circle = pygame.Surface((radius * 2, radius * 2), pygame.SRCALPHA)
+            pygame.draw.circle(circle, (*color, alpha), (radius, radius), radius)
+            self.shapes[key] = circle
+        return circle
+    
+    def get_square_sprite(self, size: int, color: Tuple[int, int, int]) -> pygame.Surface:
+        """Get a cached filled square (fallback for towers without a sprite)"""
+        key = ('square', size, color, 255)
+        square = self.shapes.get(key)
+        if square is None:
+            square = pygame.Surface((size, size))
+            square.fill(color)
+            self.shapes[key] = square
+        return square
     
     def get_projectile_sprite(self, projectile_type: str) -> Optional[pygame.Surface]:
         """Get projectile sprite by type"""
@@ -760,57 +865,25 @@ class SpriteManager:
     def reload_sprites(self) -> None:
         """Reload all sprites (useful for development)"""
         self.sprites.clear()
-        self._load_default_sprites()
+        self.loaded = True
+        self._load_default_sprites(use_cache=False)
     
     def ensure_sprites_loaded(self) -> None:
-        """Ensure sprites are properly loaded after display initialization"""
-        # Check if we have placeholder sprites that could be replaced with real ones
-        for name in list(self.sprites.keys()):
-            if name.endswith('_tower') or name.endswith('_enemy') or name in ['freeze', 'bullet', 'missile', 'laser_beam']:
-                file_path = os.path.join(self.sprite_path, f"{name}.png")
-                if os.path.exists(file_path):
-                    # Try to reload this sprite now that display is initialized
-                    try:
-                        sprite = pygame.image.load(file_path).convert_alpha()
-                        # Get the expected size for this sprite type
-                        if name.endswith('_tower'):
-                            size = (40, 40)
-                        elif name.endswith('_enemy'):
-                            # Get size based on enemy type
-                            if 'swarm' in name:
-                                size = (16, 16)
-                            elif 'titan' in name:
-                                size = (70, 70)
-                            elif 'boss' in name:
-                                size = (60, 60)
-                            elif 'elite' in name:
-                                size = (44, 44)
-                            elif 'heavy' in name:
-                                size = (40, 40)
-                            elif 'armored' in name:
-                                size = (36, 36)
-                            elif 'berserker' in name:
-                                size = (36, 36)
-                            elif 'stealth' in name:
-                                size = (32, 32)
-                            elif 'basic' in name:
-                                size = (30, 30)
-                            elif 'flying' in name or 'phantom' in name:
-                                size = (28, 28)
-                            elif 'fast' in name:
-                                size = (24, 24)
-                            else:
-                                size = (30, 30)  # default
-                        else:  # projectiles
-                            if name == 'laser_beam':
-                                size = (6, 6)
-                            else:
-                                size = (8, 8)
-                        
-                        sprite = pygame.transform.scale(sprite, size)
-                        self.sprites[name] = sprite
-                    except pygame.error as e:
-                        pass  # Keep placeholder
+        """Ensure sprites are in the display format once the display is initialized"""
+        if not self.loaded:
+            # First load happens with the display up, so sprites are already converted
+            self._ensure_loaded()
+            return
+        
+        # Atlas sprites only need their pages converted to the display format
+        if self.atlas is not None:
+            self._use_atlas(self.atlas)
+            return
+        
+        # Sprites loaded before the display existed are converted in place rather
+        # than decoded and scaled from their files a second time
+        self.sprites = {name: sprite.convert_alpha() for name, sprite in self.sprites.items()}
+        self._build_enemy_variants()
 
 # Global sprite manager instance
 sprite_manager = SpriteManager() 
\ No newline at end of file
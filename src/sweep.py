@@ -0,0 +1,281 @@
+"""
+Balance sweep runner - fans headless games out over every CPU core
+
+A sweep is the cross product of levels, placement strategies, seeds and a
+grid of balance overrides. Overrides are dotted paths into the balance
+tables in constants.py, for example:
+
+    {
+        "levels": [1, 2],
+        "strategies": ["cannon", "mixed"],
+        "seeds": [1, 2, 3],
+        "waves": "1-10",
+        "grid": {"TOWER_TYPES.cannon.damage": [20, 25, 30]},
+        "level_grids": {"2": {"LEVELS.2.waves.0.delay": [0.5, 1.0]}}
+    }
+
+Each run is cached under a hash of its configuration and the simulation
+source, so rerunning a sweep only plays the games that changed.
+
+Command line:
+    python -m src.sweep sweep.json --out report --workers 8
+"""
+
+import argparse
+import copy
+import csv
+import itertools
+import json
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+from . import constants
+from .constants import *
+from .fingerprint import content_hash, file_fingerprint
+from .level import Level
+from .headless import run_headless, _parse_wave_range
+
+# Default location of cached run results
+SWEEP_CACHE_DIR = '.sweep_cache'
+
+# Balance tables that overrides may target
+OVERRIDABLE_TABLES = ('TOWER_TYPES', 'UPGRADE_MULTIPLIERS', 'UPGRADE_COSTS', 'ENEMY_TYPES', 'LEVELS')
+
+def _rank_build_cells(level: Level, reach: int = 2) -> List[Tuple[int, int]]:
+    """Get buildable cells next to the path, the ones covering the most path cells first"""
+    path_cells = level.path_points
+    ranked = []
+    for grid_x in range(level.grid_width):
+        for grid_y in range(level.grid_height):
+            if not level.is_buildable(grid_x, grid_y):
+                continue
+            coverage = sum(1 for (px, py) in path_cells
+                           if abs(px - grid_x) <= reach and abs(py - grid_y) <= reach)
+            if coverage:
+                ranked.append((-coverage, grid_x, grid_y))
+    ranked.sort()
+    return [(grid_x, grid_y) for _, grid_x, grid_y in ranked]
+
+def strategy_cannon(level: Level) -> List[Dict[str, Any]]:
+    """Cannons on every cell next to the path, best coverage first"""
+    return [{'action': 'place', 'tower_type': 'cannon', 'grid_x': x, 'grid_y': y}
+            for x, y in _rank_build_cells(level)]
+
+def strategy_mixed(level: Level) -> List[Dict[str, Any]]:
+    """Cycle through every tower type so each wave meets a mixed defense"""
+    tower_types = list(TOWER_TYPES.keys())
+    return [{'action': 'place', 'tower_type': tower_types[i % len(tower_types)], 'grid_x': x, 'grid_y': y}
+            for i, (x, y) in enumerate(_rank_build_cells(level))]
+
+def strategy_upgrade(level: Level, tower_count: int = 6) -> List[Dict[str, Any]]:
+    """A handful of well-placed towers upgraded to the maximum, then more towers"""
+    tower_types = ['cannon', 'machine_gun', 'missile', 'laser', 'freeze']
+    cells = _rank_build_cells(level)
+    core = cells[:tower_count]
+
+    actions = [{'action': 'place', 'tower_type': tower_types[i % len(tower_types)], 'grid_x': x, 'grid_y': y}
+               for i, (x, y) in enumerate(core)]
+    for _ in range(MAX_UPGRADE_LEVEL):
+        actions.extend({'action': 'upgrade', 'grid_x': x, 'grid_y': y} for x, y in core)
+    actions.extend({'action': 'place', 'tower_type': 'machine_gun', 'grid_x': x, 'grid_y': y}
+                   for x, y in cells[tower_count:])
+    return actions
+
+# Placement strategies by name: each maps a level to a scripted action list
+STRATEGIES: Dict[str, Callable[[Level], List[Dict[str, Any]]]] = {
+    'cannon': strategy_cannon,
+    'mixed': strategy_mixed,
+    'upgrade': strategy_upgrade,
+}
+
+def _resolve(path: str) -> Tuple[Any, Any]:
+    """Resolve a dotted override path to its (container, key)"""
+    table, *keys = path.split('.')
+    if table not in OVERRIDABLE_TABLES or not keys:
+        raise ValueError(f"Override path must start with one of {OVERRIDABLE_TABLES}: {path}")
+
+    container = getattr(constants, table)
+    for i, key in enumerate(keys):
+        if isinstance(container, list):
+            key = int(key)
+        elif key not in container and key.lstrip('-').isdigit():
+            key = int(key)
+        if i == len(keys) - 1:
+            return container, key
+        container = container[key]
+    raise ValueError(f"Invalid override path: {path}")
+
+@contextmanager
+def overridden_constants(overrides: Dict[str, Any]) -> Iterator[None]:
+    """Apply balance overrides to the shared constant tables, restoring them afterwards"""
+    saved = []
+    try:
+        for path, value in overrides.items():
+            container, key = _resolve(path)
+            saved.append((container, key, copy.deepcopy(container[key])))
+            container[key] = value
+        yield
+    finally:
+        for container, key, value in reversed(saved):
+            container[key] = value
+
+def _source_fingerprint() -> str:
+    """Hash the simulation source so cached results expire when the game code changes"""
+    src_dir = os.path.dirname(os.path.abspath(__file__))
+    return file_fingerprint(os.path.join(src_dir, name) for name in sorted(os.listdir(src_dir)) if name.endswith('.py'))
+
+def expand_sweep(spec: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """Expand a sweep specification into one configuration per run"""
+    levels = spec.get('levels', list(LEVELS.keys()))
+    strategies = spec.get('strategies', list(STRATEGIES.keys()))
+    seeds = spec.get('seeds', [1])
+    waves = spec.get('waves')
+    for strategy in strategies:
+        if strategy not in STRATEGIES:
+            raise ValueError(f"Unknown strategy: {strategy}")
+
+    configs = []
+    for level_id in levels:
+        grid = dict(spec.get('grid', {}))
+        grid.update(spec.get('level_grids', {}).get(str(level_id), {}))
+        paths = sorted(grid)
+        for values in itertools.product(*(grid[path] for path in paths)):
+            overrides = dict(zip(paths, values))
+            for strategy in strategies:
+                for seed in seeds:
+                    configs.append({
+                        'level': level_id,
+                        'strategy': strategy,
+                        'seed': seed,
+                        'waves': waves,
+                        'overrides': overrides,
+                    })
+    return configs
+
+def run_config(config: Dict[str, Any]) -> Dict[str, Any]:
+    """Play one sweep configuration (runs inside a worker process)"""
+    with overridden_constants(config['overrides']):
+        level = Level(config['level'])
+        placements = STRATEGIES[config['strategy']](level)
+        wave_range = _parse_wave_range(config['waves']) if config['waves'] else None
+        result = run_headless(config['level'], placements, wave_range, config['seed'])
+    return {'config': config, 'result': result}
+
+def run_sweep(spec: Dict[str, Any], workers: Optional[int] = None,
+              cache_dir: Optional[str] = SWEEP_CACHE_DIR) -> List[Dict[str, Any]]:
+    """
+    Run every configuration of a sweep, reusing cached results
+
+    Args:
+        spec: Sweep specification (see module docstring)
+        workers: Worker processes; defaults to the number of CPU cores
+        cache_dir: Directory of cached run results, or None to disable caching
+
+    Returns:
+        One {'config', 'result', 'hash', 'cached'} record per run, in sweep order
+    """
+    configs = expand_sweep(spec)
+    fingerprint = _source_fingerprint()
+    hashes = [content_hash(config, fingerprint) for config in configs]
+    records: List[Optional[Dict[str, Any]]] = [None] * len(configs)
+
+    # Load whatever is already cached; an unreadable entry is played again
+    todo = []
+    for index, run_hash in enumerate(hashes):
+        cache_path = os.path.join(cache_dir, f"{run_hash}.json") if cache_dir else None
+        try:
+            if cache_path and os.path.exists(cache_path):
+                with open(cache_path) as f:
+                    records[index] = dict(json.load(f), hash=run_hash, cached=True)
+        except (OSError, ValueError, TypeError):
+            records[index] = None
+        if records[index] is None:
+            todo.append(index)
+
+    if cache_dir:
+        os.makedirs(cache_dir, exist_ok=True)
+
+    # Fan the remaining games out over the worker pool
+    if todo:
+        with ProcessPoolExecutor(max_workers=workers or os.cpu_count()) as executor:
+            futures = {executor.submit(run_config, configs[index]): index for index in todo}
+            for future in as_completed(futures):
+                index = futures[future]
+                record = future.result()
+                if cache_dir:
+                    # Write to a temporary file and rename so an interrupted sweep never leaves a partial result
+                    cache_path = os.path.join(cache_dir, f"{hashes[index]}.json")
+                    temp_path = f"{cache_path}.tmp"
+                    with open(temp_path, 'w') as f:
+                        json.dump(record, f)
+                    os.replace(temp_path, cache_path)
+                records[index] = dict(record, hash=hashes[index], cached=False)
+
+    return records
+
+def write_report(records: List[Dict[str, Any]], out_prefix: str) -> None:
+    """
+    Write a sweep report
+
+    <out_prefix>.json holds every run with its per-wave statistics;
+    <out_prefix>.csv has one row per run and wave (leaks, gold curve, clear time).
+    """
+    with open(f"{out_prefix}.json", 'w') as f:
+        json.dump(records, f, indent=2)
+
+    fields = ['hash', 'level', 'strategy', 'seed', 'overrides', 'result', 'final_lives', 'final_gold',
+              'total_leaks', 'wave', 'start_time', 'gold_at_start', 'leaks', 'clear_time']
+    with open(f"{out_prefix}.csv", 'w', newline='') as f:
+        writer = csv.DictWriter(f, fieldnames=fields)
+        writer.writeheader()
+        for record in records:
+            config = record['config']
+            result = record['result']
+            run_fields = {
+                'hash': record['hash'],
+                'level': config['level'],
+                'strategy': config['strategy'],
+                'seed': config['seed'],
+                'overrides': json.dumps(config['overrides'], sort_keys=True),
+                'result': result['result'],
+                'final_lives': result['lives'],
+                'final_gold': result['gold'],
+                'total_leaks': result['leaks'],
+            }
+            for wave in result['wave_stats']:
+                writer.writerow(dict(run_fields, **wave))
+
+def main(argv: Optional[List[str]] = None) -> None:
+    """Command line entry point"""
+    parser = argparse.ArgumentParser(description="Run a multiprocess balance sweep")
+    parser.add_argument('spec', nargs='?', default=None, help="JSON sweep specification")
+    parser.add_argument('--levels', type=int, nargs='+', help="levels to sweep (overrides the spec)")
+    parser.add_argument('--strategies', nargs='+', choices=sorted(STRATEGIES), help="placement strategies")
+    parser.add_argument('--seeds', type=int, nargs='+', help="game seeds")
+    parser.add_argument('--waves', default=None, help="wave range, e.g. 1-10")
+    parser.add_argument('--workers', type=int, default=None, help="worker processes (default: all cores)")
+    parser.add_argument('--out', default='sweep_report', help="report path prefix (.json and .csv)")
+    parser.add_argument('--cache-dir', default=SWEEP_CACHE_DIR, help="result cache directory")
+    parser.add_argument('--no-cache', action='store_true', help="ignore and do not write cached results")
+    args = parser.parse_args(argv)
+
+    spec: Dict[str, Any] = {}
+    if args.spec:
+        with open(args.spec) as f:
+            spec = json.load(f)
+    for key in ('levels', 'strategies', 'seeds', 'waves'):
+        if getattr(args, key) is not None:
+            spec[key] = getattr(args, key)
+
+    start_time = time.perf_counter()
+    records = run_sweep(spec, args.workers, None if args.no_cache else args.cache_dir)
+    write_report(records, args.out)
+
+    cached = sum(1 for record in records if record['cached'])
+    print(f"{len(records)} runs ({cached} cached) in {time.perf_counter() - start_time:.1f}s "
+          f"-> {args.out}.json, {args.out}.csv")
+
+if __name__ == "__main__":
+    main()
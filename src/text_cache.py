@@ -0,0 +1,51 @@
+"""
+Shared font registry and rendered-text cache
+"""
+
+import pygame  # type: ignore
+from collections import OrderedDict
+from typing import Dict, Optional, Tuple
+from .constants import *
+
+class TextCache:
+    """Keeps one Font per (name, size) and an LRU cache of rendered text surfaces"""
+    
+    def __init__(self, max_entries: int = TEXT_CACHE_SIZE):
+        self.fonts: Dict[Tuple[Optional[str], int], pygame.font.Font] = {}
+        self.surfaces: 'OrderedDict[tuple, pygame.Surface]' = OrderedDict()
+        self.max_entries = max_entries
+    
+    def get_font(self, size: int, name: Optional[str] = None) -> pygame.font.Font:
+        """Get a shared font, loading it the first time it is asked for"""
+        key = (name, size)
+        font = self.fonts.get(key)
+        if font is None:
+            font = pygame.font.Font(name, size)
+            self.fonts[key] = font
+        return font
+    
+    def render(self, text: str, size: int, color: Tuple[int, int, int],
+               name: Optional[str] = None) -> pygame.Surface:
+        """
+        Get antialiased text rendered in the given font and colour
+        
+        The returned surface is shared; callers must blit it, not draw on it.
+        """
+        key = (name, size, text, color)
+        surface = self.surfaces.get(key)
+        if surface is not None:
+            self.surfaces.move_to_end(key)
+            return surface
+        
+        surface = self.get_font(size, name).render(text, True, color)
+        self.surfaces[key] = surface
+        if len(self.surfaces) > self.max_entries:
+            self.surfaces.popitem(last=False)
+        return surface
+    
+    def clear(self) -> None:
+        """Drop every cached text surface"""
+        self.surfaces.clear()
+
+# Global text cache instance
+text_cache = TextCache()
@@ -0,0 +1,74 @@
+"""
+Fixed-timestep accumulator decoupling the simulation rate from the frame rate
+"""
+
+import math
+from .constants import SIM_DT, MAX_SUBSTEPS, SIM_FRAME_BUDGET
+
+# Frame budget guard: how fast the effective speed backs off and recovers
+SPEED_BACKOFF = 0.8
+SPEED_RECOVERY = 1.1
+
+class FixedTimestep:
+    """Turns variable frame times into a whole number of fixed simulation steps"""
+
+    def __init__(self, step: float = SIM_DT, max_substeps: int = MAX_SUBSTEPS,
+                 frame_budget: float = SIM_FRAME_BUDGET):
+        self.step = step
+        self.max_substeps = max_substeps
+        self.frame_budget = frame_budget
+        self.accumulator = 0.0
+        self.ticks = 0
+
+        # Requested speed multiplier and the speed actually run after the budget guard
+        self.speed = 1
+        self.effective_speed = 1.0
+
+    def set_speed(self, speed: int) -> None:
+        """Request a simulation speed multiplier (more fixed steps per second, never larger steps)"""
+        self.speed = speed
+        self.effective_speed = float(speed)
+
+    def advance(self, frame_dt: float) -> int:
+        """
+        Add a frame's elapsed time and get the number of steps to simulate
+
+        Frame time is scaled by the effective speed, so fast-forward runs more
+        fixed steps rather than longer ones. At most max_substeps steps per 1x
+        of speed are returned; time beyond that (after a long hitch) is
+        dropped so the game slows down instead of spiralling.
+        """
+        self.accumulator += max(0.0, frame_dt) * self.effective_speed
+
+        max_steps = self.max_substeps * max(1, math.ceil(self.effective_speed))
+        steps = int(self.accumulator / self.step)
+        if steps > max_steps:
+            steps = max_steps
+            self.accumulator = self.accumulator % self.step
+        else:
+            self.accumulator -= steps * self.step
+
+        self.ticks += steps
+        return steps
+
+    def report_sim_cost(self, seconds: float) -> None:
+        """
+        Frame budget guard: feed back how long the last frame's steps took
+
+        When the simulation overruns its budget the effective speed backs off
+        (never below 1x) so the frame rate holds; it climbs back toward the
+        requested speed once there is headroom again.
+        """
+        if seconds > self.frame_budget and self.effective_speed > 1.0:
+            self.effective_speed = max(1.0, self.effective_speed * SPEED_BACKOFF)
+        elif seconds < self.frame_budget * 0.5 and self.effective_speed < self.speed:
+            self.effective_speed = min(float(self.speed), self.effective_speed * SPEED_RECOVERY)
+
+    @property
+    def alpha(self) -> float:
+        """Fraction of a step left in the accumulator, for render interpolation"""
+        return min(1.0, self.accumulator / self.step)
+
+    def reset(self) -> None:
+        """Drop any accumulated time"""
+        self.accumulator = 0.0
@@ -3,152 +3,22 @@ Tower classes and management system
 """
 
 import pygame  # type: ignore
-import math
+import random
+import numpy as np  # type: ignore
 from typing import List, Optional, Tuple, Any, Dict
 from .constants import *
 from .sprite_manager import sprite_manager
+from .projectile import FireRequest, ProjectileSystem
+from .render_queue import RenderQueue
 
-class Projectile:
-    """Projectile fired by towers"""
-    
-    def __init__(self, start_x: float, start_y: float, target_x: float, target_y: float, 
-                 damage: int, speed: float, splash_radius: float = 0, homing: bool = False, piercing: bool = False,
-                 freeze_duration: float = 0.0, freeze_slow_multiplier: float = 1.0):
-        self.x = start_x
-        self.y = start_y
-        self.target_x = target_x
-        self.target_y = target_y
-        self.damage = damage
-        self.speed = speed
-        self.splash_radius = splash_radius
-        self.homing = homing
-        self.piercing = piercing
-        self.freeze_duration = freeze_duration
-        self.freeze_slow_multiplier = freeze_slow_multiplier
-        self.hit_enemies = set()  # Track enemies already hit (for piercing)
-        
-        # Calculate direction
-        dx = target_x - start_x
-        dy = target_y - start_y
-        distance = math.sqrt(dx * dx + dy * dy)
-        
-        if distance > 0:
-            self.velocity_x = (dx / distance) * speed
-            self.velocity_y = (dy / distance) * speed
-        else:
-            self.velocity_x = 0
-            self.velocity_y = 0
-        
-        self.is_alive = True
-        self.target_enemy = None  # For homing missiles
-    
-    def update(self, dt: float, enemies: List) -> None:
-        """Update projectile position and check for hits"""
-        if not self.is_alive:
-            return
-        
-        # Update homing behavior
-        if self.homing and self.target_enemy and self.target_enemy.is_alive:
-            # Update target position
-            self.target_x, self.target_y = self.target_enemy.get_position()  # type: ignore
-            
-            # Recalculate direction
-            dx = self.target_x - self.x
-            dy = self.target_y - self.y
-            distance = math.sqrt(dx * dx + dy * dy)
-            
-            if distance > 0:
-                self.velocity_x = (dx / distance) * self.speed
-                self.velocity_y = (dy / distance) * self.speed
-        
-        # Move projectile
-        self.x += self.velocity_x * dt
-        self.y += self.velocity_y * dt
-        
-        # Check for hits
-        hit_this_frame = False
-        for enemy in enemies:
-            if enemy.is_alive and enemy not in self.hit_enemies:
-                distance = math.sqrt((self.x - enemy.x) ** 2 + (self.y - enemy.y) ** 2)
-                if distance <= enemy.size + 5:  # Hit detection radius
-                    self._hit_enemy(enemy, enemies)
-                    hit_this_frame = True
-                    
-                    # For non-piercing projectiles, destroy after first hit
-                    if not self.piercing:
-                        return
-        
-        # Remove projectile if it goes off screen
-        if (self.x < -50 or self.x > SCREEN_WIDTH + 50 or 
-            self.y < -50 or self.y > SCREEN_HEIGHT + 50):
-            self.is_alive = False
-    
-    def _hit_enemy(self, primary_enemy, all_enemies: List) -> None:
-        """Handle projectile hitting an enemy"""
-        # Mark enemy as hit (for piercing projectiles)
-        self.hit_enemies.add(primary_enemy)
-        
-        # Damage primary target
-        primary_enemy.take_damage(self.damage)
-        
-        # Apply freeze effect if this projectile has freeze
-        if self.freeze_duration > 0:
-            primary_enemy.apply_freeze_effect(self.freeze_duration, self.freeze_slow_multiplier)
-        
-        # Handle splash damage and freeze
-        if self.splash_radius > 0:
-            for enemy in all_enemies:
-                if enemy != primary_enemy and enemy.is_alive:
-                    # Flying enemies and splash-immune enemies are immune to splash damage
-                    if enemy.flying or getattr(enemy, 'splash_immune', False):
-                        continue
-                        
-                    distance = math.sqrt((self.x - enemy.x) ** 2 + (self.y - enemy.y) ** 2)
-                    if distance <= self.splash_radius:
-                        # Reduce splash damage based on distance
-                        damage_ratio = 1.0 - (distance / self.splash_radius)
-                        splash_damage = int(self.damage * damage_ratio * 0.5)  # 50% splash damage
-                        enemy.take_damage(splash_damage)
-                        
-                        # Apply freeze effect to splash targets
-                        if self.freeze_duration > 0:
-                            enemy.apply_freeze_effect(self.freeze_duration, self.freeze_slow_multiplier)
-        
-        # Only destroy projectile if not piercing
-        if not self.piercing:
-            self.is_alive = False
-    
-    def render(self, screen: pygame.Surface, level) -> None:
-        """Render the projectile"""
-        if self.is_alive:
-            # Convert world coordinates to screen coordinates
-            screen_x, screen_y = level.world_to_screen(self.x, self.y)
-            
-            # Only render if visible on screen
-            if -10 <= screen_x <= GAME_AREA_WIDTH + 10 and -10 <= screen_y <= SCREEN_HEIGHT + 10:
-                # Get appropriate sprite
-                if self.piercing:
-                    sprite = sprite_manager.get_projectile_sprite('piercing')
-                elif self.homing:
-                    sprite = sprite_manager.get_projectile_sprite('homing')
-                elif self.freeze_duration > 0:
-                    sprite = sprite_manager.get_projectile_sprite('freeze')
-                else:
-                    sprite = sprite_manager.get_projectile_sprite('bullet')
-                
-                if sprite:
-                    # Center the sprite on the projectile position
-                    sprite_rect = sprite.get_rect(center=(int(screen_x), int(screen_y)))
-                    screen.blit(sprite, sprite_rect)
-                else:
-                    # Fallback to simple circle if sprite not available
-                    if self.piercing:
-                        color = (255, 0, 255)  # Magenta for laser
-                    elif self.homing:
-                        color = YELLOW
-                    else:
-                        color = WHITE
-                    pygame.draw.circle(screen, color, (int(screen_x), int(screen_y)), 3)
+# Tower types that can target flying enemies
+ANTI_AIR_TOWERS = ('missile', 'laser')
+
+# Tower types that reliably target stealthed enemies and can hit phased enemies
+TRUE_SIGHT_TOWERS = ('laser',)
+
+# Chance for other towers to lose track of a stealthed enemy each frame
+STEALTH_MISS_CHANCE = 0.7
 
 class Tower:
     """Base tower class"""
@@ -164,6 +34,10 @@ class Tower:
         # Get base tower stats from constants
         self.base_stats = TOWER_TYPES[tower_type].copy()
         
+        # Targeting eligibility
+        self.targets_flying = tower_type in ANTI_AIR_TOWERS
+        self.true_sight = tower_type in TRUE_SIGHT_TOWERS
+        
         # Calculate current stats (base stats modified by upgrades)
         self._update_stats()
         
@@ -176,8 +50,8 @@ class Tower:
         self.shot_cooldown = 1.0 / self.fire_rate
         self.target_enemy = None
         
-        # Projectiles
-        self.projectiles: List[Projectile] = []
+        # (sprite, half width, half height), looked up on first render; False if missing
+        self.render_sprite = None
     
     def _update_stats(self) -> None:
         """Update tower stats based on current upgrade level"""
@@ -266,64 +140,24 @@ class Tower:
             'upgrade_level': preview_level
         }
 
-    def update(self, dt: float, enemies: List) -> None:
-        """Update tower targeting and shooting"""
+    def update(self, dt: float, target_enemy: Optional[Any]) -> Optional[FireRequest]:
+        """Update tower shooting and return a fire request when the tower shoots"""
         # Update shot cooldown timer
         self.last_shot_time += dt
         
-        # Update projectiles
-        for projectile in self.projectiles[:]:
-            projectile.update(dt, enemies)
-            if not projectile.is_alive:
-                self.projectiles.remove(projectile)
-        
-        # Find target
-        self.target_enemy = self._find_target(enemies)
+        # Target chosen by TowerManager from the shared distance matrix
+        self.target_enemy = target_enemy
         
         # Shoot if we have a target and cooldown is ready
         if self.target_enemy and self.last_shot_time >= self.shot_cooldown:
-            self._shoot_at_target()
             self.last_shot_time = 0.0
+            return self._shoot_at_target()
+        return None
     
-    def _find_target(self, enemies: List) -> Optional[Any]:
-        """Find the best enemy to target"""
-        enemies_in_range = []
-        
-        for enemy in enemies:
-            if enemy.is_alive:
-                distance = math.sqrt((self.x - enemy.x) ** 2 + (self.y - enemy.y) ** 2)
-                if distance <= self.range:
-                    # Check if this tower can target flying enemies
-                    if enemy.flying and self.tower_type not in ['missile', 'laser']:
-                        continue  # Can't target flying enemies
-                    
-                    # Check if enemy is stealthed (harder to target)
-                    if hasattr(enemy, 'stealth') and enemy.stealth and enemy.is_stealthed:
-                        # Only laser towers can reliably target stealthed enemies
-                        if self.tower_type != 'laser':
-                            import random
-                            if random.random() < 0.7:  # 70% chance to miss stealthed enemies
-                                continue
-                    
-                    # Check if enemy is phased (immune to some towers temporarily)
-                    if hasattr(enemy, 'phase') and enemy.phase and enemy.is_phased:
-                        # Phased enemies can only be hit by laser towers
-                        if self.tower_type != 'laser':
-                            continue
-                    
-                    enemies_in_range.append((enemy, distance))
-        
-        if not enemies_in_range:
-            return None
-        
-        # Targeting strategy: closest enemy
-        enemies_in_range.sort(key=lambda x: x[1])
-        return enemies_in_range[0][0]
-    
-    def _shoot_at_target(self) -> None:
-        """Create a projectile targeting the current enemy"""
+    def _shoot_at_target(self) -> Optional[FireRequest]:
+        """Build a fire request targeting the current enemy"""
         if not self.target_enemy:
-            return
+            return None
         
         target_x, target_y = self.target_enemy.get_position()
         
@@ -331,7 +165,7 @@ class Tower:
         freeze_duration = self.freeze_duration if self.freeze_effect else 0.0
         freeze_multiplier = self.freeze_slow_multiplier if self.freeze_effect else 1.0
         
-        projectile = Projectile(
+        return FireRequest(
             self.x, self.y,
             target_x, target_y,
             self.damage,
@@ -340,47 +174,52 @@ class Tower:
             self.homing,
             self.piercing,
             freeze_duration,
-            freeze_multiplier
+            freeze_multiplier,
+            self.target_enemy if self.homing else None,  # Target for homing missiles
+            self.tower_type
         )
-        
-        # Set target for homing missiles
-        if self.homing:
-            projectile.target_enemy = self.target_enemy
-        
-        self.projectiles.append(projectile)
     
-    def render(self, screen: pygame.Surface, level) -> None:
-        """Render the tower and its projectiles"""
+    def queue_render(self, queue: RenderQueue, camera_x: float, camera_y: float) -> Optional[Tuple[int, int]]:
+        """
+        Queue the tower sprite on the 'towers' layer
+        
+        Returns:
+            The integer screen position of the tower centre, or None if off screen
+        """
         # Convert world coordinates to screen coordinates
-        screen_x, screen_y = level.world_to_screen(self.x, self.y)
+        screen_x = self.x - camera_x
+        screen_y = self.y - camera_y
         
         # Only render if visible on screen
-        if -50 <= screen_x <= GAME_AREA_WIDTH + 50 and -50 <= screen_y <= SCREEN_HEIGHT + 50:
-            # Get tower sprite
+        if not (-50 <= screen_x <= GAME_AREA_WIDTH + 50 and -50 <= screen_y <= SCREEN_HEIGHT + 50):
+            return None
+        
+        # Get tower sprite, looked up once per tower
+        if self.render_sprite is None:
             sprite = sprite_manager.get_tower_sprite(self.tower_type)
-            
-            if sprite:
-                # Center the sprite on the tower position
-                sprite_rect = sprite.get_rect(center=(int(screen_x), int(screen_y)))
-                screen.blit(sprite, sprite_rect)
-            else:
-                # Fallback to simple rectangle if sprite not available
-                tower_size = GRID_SIZE - 4
-                tower_rect = pygame.Rect(
-                    screen_x - tower_size // 2,
-                    screen_y - tower_size // 2,
-                    tower_size,
-                    tower_size
-                )
-                pygame.draw.rect(screen, self.color, tower_rect)
+            self.render_sprite = (sprite, sprite.get_width() // 2, sprite.get_height() // 2) if sprite else False
+        
+        if self.render_sprite:
+            # Center the sprite on the tower position
+            sprite, half_width, half_height = self.render_sprite
+            queue.add('towers', sprite, (int(screen_x) - half_width, int(screen_y) - half_height))
+        else:
+            # Fallback to a cached plain square if sprite not available
+            tower_size = GRID_SIZE - 4
+            square = sprite_manager.get_square_sprite(tower_size, self.color)
+            queue.add('towers', square, (int(screen_x - tower_size // 2), int(screen_y - tower_size // 2)))
+        return (int(screen_x), int(screen_y))
+    
+    def render(self, screen: pygame.Surface, level) -> None:
+        """Render the tower"""
+        queue = RenderQueue()
+        center = self.queue_render(queue, level.camera.x, level.camera.y)
+        if center is not None:
+            queue.flush(screen, 'towers')
             
             # Draw upgrade level indicators
             if self.upgrade_level > 0:
-                self._draw_upgrade_indicators(screen, int(screen_x), int(screen_y))
-        
-        # Draw projectiles
-        for projectile in self.projectiles:
-            projectile.render(screen, level)
+                self._draw_upgrade_indicators(screen, *center)
     
     def _draw_upgrade_indicators(self, screen: pygame.Surface, center_x: int, center_y: int) -> None:
         """Draw visual indicators for upgrade level"""
@@ -407,8 +246,24 @@ class Tower:
 class TowerManager:
     """Manages all towers"""
     
-    def __init__(self):
+    def __init__(self, rng: Optional[random.Random] = None):
         self.towers: List[Tower] = []
+        
+        # Random source for stealth miss rolls
+        self.rng = rng if rng is not None else random.Random()
+        
+        # Bumped whenever a tower is placed, upgraded or removed, so cached
+        # renderings of the towers know when to redraw
+        self.revision = 0
+        
+        # Batched sprite blits, reused every frame
+        self.render_queue = RenderQueue()
+        
+        # Every projectile from every tower lives in one pooled system
+        self.projectile_system = ProjectileSystem()
+        
+        # Tower type of every shot fired during the last update
+        self.shots_fired: List[str] = []
     
     def place_tower(self, tower_type: str, grid_x: int, grid_y: int) -> bool:
         """Place a new tower at the specified grid position"""
@@ -419,6 +274,7 @@ class TowerManager:
         # Create and add tower
         new_tower = Tower(tower_type, grid_x, grid_y)
         self.towers.append(new_tower)
+        self.revision += 1
         return True
     
     def has_tower_at(self, grid_x: int, grid_y: int) -> bool:
@@ -439,19 +295,103 @@ class TowerManager:
         """Upgrade tower at specific position"""
         tower = self.get_tower_at(grid_x, grid_y)
         if tower and tower.can_upgrade():
-            return tower.upgrade()
+            return self.upgrade_tower(tower)
         return False
     
-    def update(self, dt: float, enemies: List) -> None:
-        """Update all towers"""
-        for tower in self.towers:
-            tower.update(dt, enemies)
+    def update(self, dt: float, enemy_manager) -> None:
+        """Update projectiles, then let every tower target and fire"""
+        self.projectile_system.update(dt, enemy_manager)
+        self.shots_fired.clear()
+        
+        targets = self._find_targets(enemy_manager)
+        for tower, target_enemy in zip(self.towers, targets):
+            fire_request = tower.update(dt, target_enemy)
+            if fire_request is not None:
+                self.projectile_system.fire(fire_request)
+                self.shots_fired.append(fire_request.tower_type)
+    
+    def _find_targets(self, enemy_manager) -> List[Optional[Any]]:
+        """Pick the closest eligible enemy for every tower from one tower x enemy distance matrix"""
+        if not self.towers:
+            return []
+        
+        data = enemy_manager.get_target_data()
+        if not data.enemies:
+            return [None] * len(self.towers)
+        
+        tower_x = np.array([tower.x for tower in self.towers], dtype=np.float64)
+        tower_y = np.array([tower.y for tower in self.towers], dtype=np.float64)
+        tower_range = np.array([tower.range for tower in self.towers], dtype=np.float64)
+        targets_flying = np.array([tower.targets_flying for tower in self.towers], dtype=bool)
+        true_sight = np.array([tower.true_sight for tower in self.towers], dtype=bool)
+        
+        # Squared distance from every tower (rows) to every enemy (columns)
+        dx = tower_x[:, None] - data.x[None, :]
+        dy = tower_y[:, None] - data.y[None, :]
+        distance_sq = dx * dx + dy * dy
+        
+        # Range mask plus flying eligibility
+        eligible = distance_sq <= (tower_range * tower_range)[:, None]
+        eligible &= targets_flying[:, None] | ~data.flying[None, :]
+        
+        # Stealthed enemies are missed most of the time by towers without true sight
+        stealth_checks = eligible & data.stealthed[None, :] & ~true_sight[:, None]
+        if stealth_checks.any():
+            rows, cols = np.nonzero(stealth_checks)
+            missed = np.array([self.rng.random() < STEALTH_MISS_CHANCE for _ in range(len(rows))])
+            eligible[rows[missed], cols[missed]] = False
+        
+        # Phased enemies can only be hit by towers with true sight
+        eligible &= true_sight[:, None] | ~data.phased[None, :]
+        
+        # Targeting strategy: closest enemy (ties go to the earliest spawned)
+        masked = np.where(eligible, distance_sq, np.inf)
+        closest = np.argmin(masked, axis=1)
+        has_target = eligible.any(axis=1)
+        return [data.enemies[col] if found else None for col, found in zip(closest.tolist(), has_target.tolist())]
+    
+    def upgrade_tower(self, tower: Tower) -> bool:
+        """Upgrade a tower managed here"""
+        if tower.upgrade():
+            self.revision += 1
+            return True
+        return False
     
     def clear_towers(self) -> None:
-        """Remove all towers (for game restart)"""
+        """Remove all towers and their projectiles (for game restart)"""
         self.towers.clear()
+        self.projectile_system.clear()
+        self.shots_fired.clear()
+        self.revision += 1
     
-    def render(self, screen: pygame.Surface, level) -> None:
-        """Render all towers"""
+    def get_shots_fired(self) -> List[str]:
+        """Get the tower type of every shot fired this frame"""
+        return self.shots_fired.copy()
+    
+    def get_splash_impacts(self) -> List[int]:
+        """Get the projectile kind of every splash impact this frame"""
+        return self.projectile_system.splash_impacts.copy()
+    
+    def render(self, screen: pygame.Surface, level, alpha: float = 1.0) -> None:
+        """Render all towers and projectiles"""
+        self.render_towers(screen, level)
+        self.render_projectiles(screen, level, alpha)
+    
+    def render_towers(self, screen: pygame.Surface, level) -> None:
+        """Render all towers (static between revisions) with one batched sprite blit"""
+        queue = self.render_queue
+        camera_x, camera_y = level.camera.x, level.camera.y
+        upgraded = []
         for tower in self.towers:
-            tower.render(screen, level) 
\ No newline at end of file
+            center = tower.queue_render(queue, camera_x, camera_y)
+            if center is not None and tower.upgrade_level > 0:
+                upgraded.append((tower, center))
+        queue.flush(screen, 'towers')
+        
+        # Draw upgrade level indicators on top
+        for tower, (center_x, center_y) in upgraded:
+            tower._draw_upgrade_indicators(screen, center_x, center_y)
+    
+    def render_projectiles(self, screen: pygame.Surface, level, alpha: float = 1.0) -> List[pygame.Rect]:
+        """Render all projectiles and return the screen areas drawn on"""
+        return self.projectile_system.render(screen, level, alpha) 
\ No newline at end of file
@@ -6,14 +6,15 @@ import pygame  # type: ignore
 from typing import Dict, Optional
 from .constants import *
 from .sprite_manager import sprite_manager
+from .text_cache import text_cache
 
 class UI:
     """User interface manager"""
     
     def __init__(self, screen: pygame.Surface):
         self.screen = screen
-        self.font = pygame.font.Font(None, 24)
-        self.small_font = pygame.font.Font(None, 18)
+        self.font = text_cache.get_font(24)
+        self.small_font = text_cache.get_font(18)
         
         # UI state
         self.gold = 0
@@ -24,34 +25,94 @@ class UI:
         self.wave_force_max_time = 45.0
         self.wave_in_progress = False
         self.wave_start_timer = 0.0
+        self.game_speed = 1
+        self.effective_speed = 1.0
         
         # UI panel area
         self.panel_rect = pygame.Rect(GAME_AREA_WIDTH, 0, UI_PANEL_WIDTH, SCREEN_HEIGHT)
+        
+        # Retained panel: the parts that never change are drawn once into the
+        # panel surface, the rest are widget surfaces rebuilt only when the
+        # setters below change what they display
+        self.panel_surface: Optional[pygame.Surface] = None
+        self.widgets: Dict[str, Optional[pygame.Surface]] = {}
+        self.timer_label = None
+        self.speed_label = (f"{self.game_speed}x", WHITE)
+        self.revision = 0
+    
+    def _invalidate(self, widget: str) -> None:
+        """Drop a widget surface so it is re-rendered on the next draw"""
+        self.widgets.pop(widget, None)
+        self.revision += 1
     
     def update_gold(self, gold: int) -> None:
         """Update gold display"""
-        self.gold = gold
+        if gold != self.gold:
+            self.gold = gold
+            self._invalidate('gold')
     
     def update_lives(self, lives: int) -> None:
         """Update lives display"""
-        self.lives = lives
+        if lives != self.lives:
+            self.lives = lives
+            self._invalidate('lives')
     
     def update_wave(self, current_wave: int, total_waves: int) -> None:
         """Update wave display"""
-        self.current_wave = current_wave
-        self.total_waves = total_waves
+        if (current_wave, total_waves) != (self.current_wave, self.total_waves):
+            self.current_wave = current_wave
+            self.total_waves = total_waves
+            self._invalidate('wave')
     
     def update_wave_force_timer(self, force_timer: float) -> None:
         """Update wave force timer display"""
         self.wave_force_timer = force_timer
+        self._update_timer_label()
     
     def update_wave_status(self, wave_in_progress: bool) -> None:
         """Update wave status for UI decisions"""
         self.wave_in_progress = wave_in_progress
+        self._update_timer_label()
     
     def update_wave_start_timer(self, start_timer: float) -> None:
         """Update wave start timer for skip button logic"""
         self.wave_start_timer = start_timer
+        self._update_timer_label()
+    
+    def update_game_speed(self, game_speed: int, effective_speed: float) -> None:
+        """Update the fast-forward display (effective speed drops when the CPU can't keep up)"""
+        self.game_speed = game_speed
+        self.effective_speed = effective_speed
+        
+        # Show the throttled speed in orange when the frame budget guard kicks in
+        if effective_speed < game_speed - 0.05:
+            label = (f"{effective_speed:.1f}x", ORANGE)
+        else:
+            label = (f"{game_speed}x", WHITE)
+        if label != self.speed_label:
+            self.speed_label = label
+            self._invalidate('speed')
+    
+    def _update_timer_label(self) -> None:
+        """Work out the wave timer text; the widget only re-renders when the shown tenths change"""
+        if self.wave_in_progress and self.wave_force_timer > 0:
+            # During active wave: force timer countdown, red under 10 seconds
+            time_remaining = max(0, self.wave_force_max_time - self.wave_force_timer)
+            timer_color = RED if time_remaining <= 10 else YELLOW
+            label = (f"Next wave in: {time_remaining:.1f}s", timer_color)
+        elif not self.wave_in_progress and self.wave_start_timer > 0:
+            # Between waves: waiting timer
+            label = (f"Next wave starts in: {self.wave_start_timer:.1f}s", WHITE)
+        else:
+            label = None
+        
+        if label != self.timer_label:
+            self.timer_label = label
+            self._invalidate('timer')
+    
+    def state_key(self) -> int:
+        """Changes whenever anything the side panel displays changes"""
+        return self.revision
     
     def handle_event(self, event: pygame.event.Event) -> Optional[str]:
         """Handle UI-specific events"""
@@ -69,6 +130,10 @@ class UI:
         if skip_button_rect and skip_button_rect.collidepoint(mouse_x, mouse_y):
             return "skip_wave"
         
+        # Check fast-forward button
+        if self._get_speed_button_rect().collidepoint(mouse_x, mouse_y):
+            return "speed"
+        
         return None
     
     def _get_skip_button_rect(self) -> Optional[pygame.Rect]:
@@ -78,93 +143,116 @@ class UI:
             # Button position below timer (if present) or below wave info
             x = GAME_AREA_WIDTH + 10
             y = 180  # Below stats and timer section
-            return pygame.Rect(x, y, 170, 30)
+            return pygame.Rect(x, y, 120, 30)
         return None
     
+    def _get_speed_button_rect(self) -> pygame.Rect:
+        """Get fast-forward button rectangle (right of the skip wave button)"""
+        return pygame.Rect(GAME_AREA_WIDTH + 135, 180, 45, 30)
+    
     def render(self) -> None:
         """Render the UI"""
+        # Panel background, title, tower buttons and controls help
+        if self.panel_surface is None:
+            self.panel_surface = self._build_panel_surface()
+        self.screen.blit(self.panel_surface, self.panel_rect)
+        
+        # Game stats
+        x_pos = GAME_AREA_WIDTH + 10
+        self.screen.blit(self._get_widget('gold'), (x_pos, 60))
+        self.screen.blit(self._get_widget('lives'), (x_pos, 90))
+        self.screen.blit(self._get_widget('wave'), (x_pos, 120))
+        timer = self._get_widget('timer')
+        if timer:
+            self.screen.blit(timer, (x_pos, 150))
+        
+        # Skip wave and fast-forward buttons
+        skip_button_rect = self._get_skip_button_rect()
+        if skip_button_rect:
+            self.screen.blit(self._get_widget('skip'), skip_button_rect)
+        self.screen.blit(self._get_widget('speed'), self._get_speed_button_rect())
+    
+    def render_to(self, surface: pygame.Surface) -> None:
+        """Render the UI onto another surface (e.g. a cached static frame)"""
+        screen = self.screen
+        self.screen = surface
+        try:
+            self.render()
+        finally:
+            self.screen = screen
+    
+    def _get_widget(self, name: str) -> Optional[pygame.Surface]:
+        """Get a widget surface, rendering it if its value changed since the last draw"""
+        if name not in self.widgets:
+            self.widgets[name] = self._render_widget(name)
+        return self.widgets[name]
+    
+    def _render_widget(self, name: str) -> Optional[pygame.Surface]:
+        """Render one panel widget"""
+        if name == 'gold':
+            return self.font.render(f"Gold: {self.gold}", True, YELLOW)
+        if name == 'lives':
+            lives_color = RED if self.lives <= 5 else WHITE
+            return self.font.render(f"Lives: {self.lives}", True, lives_color)
+        if name == 'wave':
+            return self.font.render(f"Wave: {self.current_wave}/{self.total_waves}", True, WHITE)
+        if name == 'timer':
+            if self.timer_label is None:
+                return None
+            text, color = self.timer_label
+            return self.small_font.render(text, True, color)
+        if name == 'skip':
+            return self._render_button((120, 30), (0, 150, 0), "Start Next Wave", WHITE)  # Brighter green
+        if name == 'speed':
+            text, color = self.speed_label
+            return self._render_button((45, 30), (0, 90, 150), text, color)
+        raise ValueError(f"Unknown UI widget: {name}")
+    
+    def _render_button(self, size: tuple, fill_color: tuple, text: str, text_color: tuple) -> pygame.Surface:
+        """Render a bordered button with centered text"""
+        button = pygame.Surface(size)
+        button_rect = button.get_rect()
+        pygame.draw.rect(button, fill_color, button_rect)
+        pygame.draw.rect(button, WHITE, button_rect, 2)
+        
+        button_text = self.small_font.render(text, True, text_color)
+        text_rect = button_text.get_rect(center=button_rect.center)
+        button.blit(button_text, text_rect)
+        return button
+    
+    def _build_panel_surface(self) -> pygame.Surface:
+        """Draw the parts of the panel that never change"""
+        panel = pygame.Surface(self.panel_rect.size)
+        
         # Draw UI panel background
-        pygame.draw.rect(self.screen, GRAY, self.panel_rect)
-        pygame.draw.rect(self.screen, WHITE, self.panel_rect, 2)
+        panel_area = panel.get_rect()
+        pygame.draw.rect(panel, GRAY, panel_area)
+        pygame.draw.rect(panel, WHITE, panel_area, 2)
         
-        # Starting Y position for UI elements
+        # Starting Y position for UI elements (stats occupy 60-240, see render)
         y_pos = 20
         
         # Title
         title_text = self.font.render("Tower Defense", True, WHITE)
-        self.screen.blit(title_text, (GAME_AREA_WIDTH + 10, y_pos))
+        panel.blit(title_text, (10, y_pos))
         y_pos += 40
         
-        # Game stats
-        self._draw_stats(y_pos)
-        y_pos += 180  # Extra space for timer and button display
+        # Space for stats, timer and button display
+        y_pos += 180
         
         # Tower selection
-        self._draw_tower_selection(y_pos)
+        self._draw_tower_selection(panel, 10, y_pos)
         y_pos += 220  # Updated spacing (5 towers × 38px + 30px title + 10px buffer)
         
         # Controls help
-        self._draw_controls(y_pos)
+        self._draw_controls(panel, 10, y_pos)
+        return panel
     
-    def _draw_stats(self, y_pos: int) -> None:
-        """Draw game statistics"""
-        x_pos = GAME_AREA_WIDTH + 10
-        
-        # Gold
-        gold_text = self.font.render(f"Gold: {self.gold}", True, YELLOW)
-        self.screen.blit(gold_text, (x_pos, y_pos))
-        y_pos += 30
-        
-        # Lives
-        lives_color = RED if self.lives <= 5 else WHITE
-        lives_text = self.font.render(f"Lives: {self.lives}", True, lives_color)
-        self.screen.blit(lives_text, (x_pos, y_pos))
-        y_pos += 30
-        
-        # Wave
-        wave_text = self.font.render(f"Wave: {self.current_wave}/{self.total_waves}", True, WHITE)
-        self.screen.blit(wave_text, (x_pos, y_pos))
-        y_pos += 30
-        
-        # Show timer based on game state
-        if self.wave_in_progress and self.wave_force_timer > 0:
-            # During active wave: show force timer countdown
-            time_remaining = max(0, self.wave_force_max_time - self.wave_force_timer)
-            if time_remaining <= 10:  # Warning when less than 10 seconds
-                timer_color = RED
-                timer_text = self.small_font.render(f"Next wave in: {time_remaining:.1f}s", True, timer_color)
-            else:
-                timer_color = YELLOW
-                timer_text = self.small_font.render(f"Next wave in: {time_remaining:.1f}s", True, timer_color)
-            self.screen.blit(timer_text, (x_pos, y_pos))
-        elif not self.wave_in_progress and self.wave_start_timer > 0:
-            # Between waves: show waiting timer
-            timer_text = self.small_font.render(f"Next wave starts in: {self.wave_start_timer:.1f}s", True, WHITE)
-            self.screen.blit(timer_text, (x_pos, y_pos))
-        
-        # Draw skip wave button
-        self._draw_skip_button()
-    
-    def _draw_skip_button(self) -> None:
-        """Draw skip to next wave button"""
-        button_rect = self._get_skip_button_rect()
-        if button_rect:
-            # Button background
-            pygame.draw.rect(self.screen, (0, 150, 0), button_rect)  # Brighter green
-            pygame.draw.rect(self.screen, WHITE, button_rect, 2)
-            
-            # Button text
-            button_text = self.small_font.render("Start Next Wave", True, WHITE)
-            text_rect = button_text.get_rect(center=button_rect.center)
-            self.screen.blit(button_text, text_rect)
-    
-    def _draw_tower_selection(self, y_pos: int) -> None:
+    def _draw_tower_selection(self, surface: pygame.Surface, x_pos: int, y_pos: int) -> None:
         """Draw tower selection panel"""
-        x_pos = GAME_AREA_WIDTH + 10
-        
         # Title
         towers_text = self.font.render("Towers:", True, WHITE)
-        self.screen.blit(towers_text, (x_pos, y_pos))
+        surface.blit(towers_text, (x_pos, y_pos))
         y_pos += 30
         
         # Tower buttons
@@ -177,17 +265,18 @@ class UI:
         ]
         
         for tower_type, key, name in towers:
-            self._draw_tower_button(x_pos, y_pos, tower_type, key, name)
+            self._draw_tower_button(surface, x_pos, y_pos, tower_type, key, name)
             y_pos += 38  # Reduced spacing between tower buttons to fit 5 towers better
     
-    def _draw_tower_button(self, x: int, y: int, tower_type: str, key: str, name: str) -> None:
+    def _draw_tower_button(self, surface: pygame.Surface, x: int, y: int,
+                           tower_type: str, key: str, name: str) -> None:
         """Draw a tower selection button"""
         stats = TOWER_TYPES[tower_type]
         
         # Button background
         button_rect = pygame.Rect(x, y, 170, 32)  # Reduced height from 35 to 32
-        pygame.draw.rect(self.screen, stats['color'], button_rect)
-        pygame.draw.rect(self.screen, WHITE, button_rect, 1)
+        pygame.draw.rect(surface, stats['color'], button_rect)
+        pygame.draw.rect(surface, WHITE, button_rect, 1)
         
         # Tower sprite icon
         tower_sprite = sprite_manager.get_tower_sprite(tower_type)
@@ -195,19 +284,19 @@ class UI:
             # Scale sprite to fit button
             scaled_sprite = pygame.transform.scale(tower_sprite, (22, 22))  # Slightly smaller sprite
             sprite_rect = scaled_sprite.get_rect(center=(x + 15, y + 16))  # Adjusted center
-            self.screen.blit(scaled_sprite, sprite_rect)
+            surface.blit(scaled_sprite, sprite_rect)
         
         # Tower info
         name_text = self.small_font.render(f"{key}. {name}", True, WHITE)
         cost_text = self.small_font.render(f"Cost: {stats['cost']}", True, WHITE)
         
-        self.screen.blit(name_text, (x + 32, y + 4))   # Adjusted for smaller sprite and button
-        self.screen.blit(cost_text, (x + 32, y + 17))  # Adjusted for shorter button
+        surface.blit(name_text, (x + 32, y + 4))   # Adjusted for smaller sprite and button
+        surface.blit(cost_text, (x + 32, y + 17))  # Adjusted for shorter button
     
-    def render_tower_info(self, tower, mouse_pos: tuple) -> None:
-        """Render tower information popup near mouse"""
+    def render_tower_info(self, tower, mouse_pos: tuple) -> Optional[pygame.Rect]:
+        """Render tower information popup near mouse and return its screen area"""
         if not tower:
-            return
+            return None
         
         mouse_x, mouse_y = mouse_pos
         
@@ -260,15 +349,15 @@ class UI:
                 elif "Next" in line:
                     text_color = GREEN
                 
-                text = self.small_font.render(line, True, text_color)
+                text = text_cache.render(line, 18, text_color)
                 self.screen.blit(text, (panel_x + 5, panel_y + 5 + i * line_height))
+        
+        return panel_rect
     
-    def _draw_controls(self, y_pos: int) -> None:
+    def _draw_controls(self, surface: pygame.Surface, x_pos: int, y_pos: int) -> None:
         """Draw control instructions"""
-        x_pos = GAME_AREA_WIDTH + 10
-        
         controls_text = self.small_font.render("Controls:", True, WHITE)
-        self.screen.blit(controls_text, (x_pos, y_pos))
+        surface.blit(controls_text, (x_pos, y_pos))
         y_pos += 25
         
         controls = [
@@ -276,11 +365,55 @@ class UI:
             "Click: Place/Upgrade Tower",
             "Hover: Show Tower Info",
             "WASD/Arrows: Pan Camera",
-            "P: Pause",
+            "P: Pause  F/[ ]: Speed",
             "R: Restart (Game Over)"
         ]
         
         for control in controls:
             control_text = self.small_font.render(control, True, WHITE)
-            self.screen.blit(control_text, (x_pos, y_pos))
-            y_pos += 20 
\ No newline at end of file
+            surface.blit(control_text, (x_pos, y_pos))
+            y_pos += 20 
+
+class HeadlessUI(UI):
+    """UI stand-in for headless simulation: tracks state but never creates fonts or draws"""
+    
+    def __init__(self):
+        self.screen = None
+        
+        # UI state
+        self.gold = 0
+        self.lives = 0
+        self.current_wave = 1
+        self.total_waves = 10
+        self.wave_force_timer = 0.0
+        self.wave_force_max_time = 45.0
+        self.wave_in_progress = False
+        self.wave_start_timer = 0.0
+        self.game_speed = 1
+        self.effective_speed = 1.0
+        self.revision = 0
+    
+    def _invalidate(self, widget: str) -> None:
+        """No widget surfaces without a display"""
+        pass
+    
+    def _update_timer_label(self) -> None:
+        """No timer text without a display"""
+        pass
+    
+    def update_game_speed(self, game_speed: int, effective_speed: float) -> None:
+        """Update the fast-forward state"""
+        self.game_speed = game_speed
+        self.effective_speed = effective_speed
+    
+    def handle_event(self, event: pygame.event.Event) -> Optional[str]:
+        """Headless runs have no clickable UI"""
+        return None
+    
+    def render(self) -> None:
+        """Nothing to draw without a display"""
+        pass
+    
+    def render_tower_info(self, tower, mouse_pos: tuple) -> Optional[pygame.Rect]:
+        """Nothing to draw without a display"""
+        return None